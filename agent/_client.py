@@ -0,0 +1,51 @@
+"""
+Shared OpenAI clients
+Every agent component uses the same connection pool, so TLS sessions and
+keep-alive connections are reused across planner, critic and generation calls.
+An async pool can only be used from the event loop it was created on, so
+there is one async client per running loop
+"""
+import asyncio
+import threading
+import weakref
+
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultHttpxClient, DefaultAsyncHttpxClient
+
+from rag.config import OPENAI_API_KEY
+
+try:
+    import h2  # noqa: F401  (optional: lets concurrent requests share one connection)
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=64)
+
+CLIENT = OpenAI(
+    api_key=OPENAI_API_KEY,
+    http_client=DefaultHttpxClient(http2=_HTTP2, limits=_LIMITS)
+)
+
+# Event loop -> async client used on it; entries go away with their loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_clients_lock = threading.Lock()
+
+
+def get_async_client() -> AsyncOpenAI:
+    """
+    Async client for the running event loop (created on first use there)
+    Must be called from a coroutine; don't keep the client beyond the loop
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=OPENAI_API_KEY,
+                http_client=DefaultAsyncHttpxClient(http2=_HTTP2, limits=_LIMITS)
+            )
+            _async_clients[loop] = client
+        return client
@@ -1,15 +1,199 @@
 """
 Logging utilities for agent execution traces
 """
-import json
+import atexit
+import itertools
 import logging
+import os
+import queue
+import reprlib
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO, Optional, Tuple
+
+import orjson
 
 from agent.memory import AgentState
 from rag.config import LOG_DIR, LOG_LEVEL
 
+# Size of the in-memory buffer for append-only JSONL logs
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Background writer tuning: queue capacity, max records combined per write,
+# and how long buffered records may sit before being flushed (seconds)
+LOG_QUEUE_SIZE = 10000
+LOG_BATCH_MAX = 512
+LOG_FLUSH_INTERVAL = 0.01
+
+
+def write_bytes(path: str, blob: bytes) -> None:
+    """Write a fully serialized document with raw os.write calls (no buffering layer)"""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(blob)
+        while view:
+            # os.write may write less than requested for large blobs
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Bounded repr for tool results: large containers are summarized, never fully stringified
+_RESULT_REPR = reprlib.Repr()
+_RESULT_REPR.maxstring = 200
+_RESULT_REPR.maxother = 200
+
+
+def _preview_result(result: Any, limit: int = 200) -> str:
+    """Short text form of a tool result for the log"""
+    if isinstance(result, str):
+        return result[:limit]
+    return _RESULT_REPR.repr(result)[:limit]
+
+
+_CONFIGURED = False
+
+
+def configure_logging() -> None:
+    """Configure root logging once per process (later calls are no-ops)"""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    logging.basicConfig(
+        level=getattr(logging, LOG_LEVEL),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    _CONFIGURED = True
+
+
+configure_logging()
+
+
+def _encode_record(entry: Dict[str, Any]) -> bytes:
+    """Serialize a log record straight to newline-terminated UTF-8 bytes"""
+    return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+
+
+class _LogWriter:
+    """
+    Buffered log files of one directory and the thread that writes them
+    Shared by every AgentLogger on that directory (see _get_writer)
+    """
+
+    def __init__(self, log_dir: Path):
+        # Long-lived buffered handles: records are batched in memory and
+        # written out in 64 KB blocks instead of one open/write/close per event
+        self._trace_fh = open(log_dir / "agent_traces.log", 'ab', buffering=LOG_BUFFER_SIZE)
+        self._tool_fh = open(log_dir / "tool_calls.log", 'ab', buffering=LOG_BUFFER_SIZE)
+        self.handles = {"trace": self._trace_fh, "tool": self._tool_fh}
+
+        # Disk writes happen on a dedicated thread so the reasoning loop
+        # only pays for a queue put; the writer combines queued records
+        self._log_q: "queue.Queue[Tuple[Optional[BinaryIO], bytes]]" = queue.Queue(
+            maxsize=LOG_QUEUE_SIZE
+        )
+        self._writer = threading.Thread(
+            target=self._drain, name="agent-log-writer", daemon=True
+        )
+        self._writer.start()
+
+    def enqueue(self, fh: BinaryIO, payload: bytes) -> None:
+        """Hand a serialized record to the writer thread"""
+        try:
+            self._log_q.put_nowait((fh, payload))
+        except queue.Full:
+            # Writer fell behind: apply backpressure instead of dropping records
+            self._log_q.put((fh, payload))
+
+    def _drain(self) -> None:
+        """Writer thread: batch queued records into grouped writes"""
+        dirty = False
+        last_flush = time.monotonic()
+
+        while True:
+            try:
+                batch = [self._log_q.get(timeout=LOG_FLUSH_INTERVAL)]
+            except queue.Empty:
+                if dirty:
+                    self._flush_handles()
+                    dirty = False
+                    last_flush = time.monotonic()
+                continue
+
+            # Combine everything already waiting into the same pass
+            while len(batch) < LOG_BATCH_MAX:
+                try:
+                    batch.append(self._log_q.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for fh, group in itertools.groupby(batch, key=lambda item: item[0]):
+                if fh is None:
+                    stop = True
+                    continue
+                fh.writelines(payload for _, payload in group)
+                dirty = True
+
+            now = time.monotonic()
+            if stop or now - last_flush >= LOG_FLUSH_INTERVAL:
+                self._flush_handles()
+                dirty = False
+                last_flush = now
+
+            for _ in batch:
+                self._log_q.task_done()
+
+            if stop:
+                return
+
+    def _flush_handles(self) -> None:
+        for fh in (self._trace_fh, self._tool_fh):
+            if not fh.closed:
+                fh.flush()
+
+    def flush(self) -> None:
+        """Wait for queued records to be written, then flush them to disk"""
+        if self._writer.is_alive():
+            self._log_q.join()
+        self._flush_handles()
+
+    def close(self) -> None:
+        """Drain the writer thread and close the log file handles"""
+        if self._writer.is_alive():
+            self._log_q.put((None, b""))
+            self._writer.join()
+        for fh in (self._trace_fh, self._tool_fh):
+            if not fh.closed:
+                fh.close()
+
+
+# Resolved log directory -> its shared writer
+_writers: Dict[Path, _LogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _get_writer(log_dir: Path) -> _LogWriter:
+    """Get or create the writer of a log directory"""
+    key = log_dir.resolve()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = _LogWriter(key)
+        return writer
+
+
+@atexit.register
+def _close_writers() -> None:
+    """Drain every writer thread and close the log files (once, at exit)"""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
 
 class AgentLogger:
     """Logger for agent execution traces"""
@@ -22,60 +206,125 @@ class AgentLogger:
         self.trace_log = self.log_dir / "agent_traces.log"
         self.tool_log = self.log_dir / "tool_calls.log"
 
-        # Configure logging
-        logging.basicConfig(
-            level=getattr(logging, LOG_LEVEL),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
         self.logger = logging.getLogger("AgentOrchestrator")
 
+        # One file pair and writer thread per directory, however many loggers
+        self._log_writer = _get_writer(self.log_dir)
+        self._handles = self._log_writer.handles
+        self._tool_fh = self._handles["tool"]
+
+    def _enqueue(self, fh: BinaryIO, payload: bytes) -> None:
+        """Hand a serialized record to the shared writer thread"""
+        self._log_writer.enqueue(fh, payload)
+
+    def flush(self) -> None:
+        """Wait for queued records to be written, then flush them to disk"""
+        self._log_writer.flush()
+
+    def close(self) -> None:
+        """
+        Write out everything queued so far
+        The shared files stay open for other loggers on the directory; they
+        are closed at interpreter exit
+        """
+        self._log_writer.flush()
+
     def log_query(self, query: str) -> None:
         """Log incoming query"""
-        self.logger.info(f"New query: {query}")
-
-    def log_state(self, state: AgentState) -> None:
-        """Log agent state"""
-        trace_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "query": state.query,
-            "iteration": state.iteration,
-            "confidence": state.confidence_score,
-            "is_complete": state.is_complete,
-            "steps": len(state.reasoning_steps)
-        }
+        self.logger.info("New query: %s", query)
+
+    def log_state(self, state: AgentState, timestamp: Optional[str] = None) -> None:
+        """
+        Log agent state and commit every record buffered on it
+
+        Args:
+            state: Agent state to log
+            timestamp: Precomputed ISO time (defaults to now)
+        """
+        # Skip serialization entirely when trace records would be filtered out
+        if self.logger.isEnabledFor(logging.INFO):
+            trace_entry = {
+                "timestamp": timestamp or datetime.now().isoformat(),
+                "query": state.query,
+                "iteration": state.iteration,
+                "confidence": state.confidence_score,
+                "is_complete": state.is_complete,
+                "steps": len(state.reasoning_steps)
+            }
+            state.pending_log_entries.append(("trace", _encode_record(trace_entry)))
 
-        with open(self.trace_log, 'a') as f:
-            f.write(json.dumps(trace_entry) + "\n")
+        self.flush_state(state)
 
     def log_tool_call(
         self,
         tool_name: str,
         params: Dict[str, Any],
         result: Any,
-        success: bool
+        success: bool,
+        timestamp: Optional[str] = None,
+        state: Optional[AgentState] = None
     ) -> None:
-        """Log tool execution"""
+        """
+        Log tool execution
+
+        Args:
+            tool_name: Name of the executed tool
+            params: Parameters the tool was called with
+            result: Tool result (truncated in the log)
+            success: Whether the tool call succeeded
+            timestamp: Precomputed ISO time (defaults to now)
+            state: If given, buffer the record on the state until flush_state
+        """
+        # Same level gate as log_state: skip formatting the result when filtered out
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         tool_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "tool": tool_name,
             "params": params,
             "success": success,
-            "result": str(result)[:200]  # Truncate
+            "result": _preview_result(result)  # Truncate
         }
 
-        with open(self.tool_log, 'a') as f:
-            f.write(json.dumps(tool_entry) + "\n")
+        payload = _encode_record(tool_entry)
+        if state is not None:
+            state.pending_log_entries.append(("tool", payload))
+        else:
+            self._enqueue(self._tool_fh, payload)
+
+    def flush_state(self, state: AgentState, durable: bool = False) -> None:
+        """
+        Group-commit the records buffered on a state: one write per log file
+
+        Args:
+            state: State whose pending_log_entries should be written
+            durable: Wait for the write and fsync the log files
+        """
+        if state.pending_log_entries:
+            by_kind: Dict[str, list] = {}
+            for kind, payload in state.pending_log_entries:
+                by_kind.setdefault(kind, []).append(payload)
+            state.pending_log_entries.clear()
+
+            for kind, payloads in by_kind.items():
+                self._enqueue(self._handles[kind], b"".join(payloads))
+
+        if durable:
+            self.flush()
+            for fh in self._handles.values():
+                os.fsync(fh.fileno())
 
     def save_detailed_trace(self, state: AgentState) -> str:
         """Save detailed execution trace"""
-        filename = f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        now = datetime.now()
+        filename = f"trace_{now.strftime('%Y%m%d_%H%M%S')}.json"
         filepath = self.log_dir / filename
 
         trace_data = state.to_dict()
-        trace_data["timestamp"] = datetime.now().isoformat()
+        trace_data["timestamp"] = now.isoformat()
         trace_data["final_answer"] = state.current_answer
 
-        with open(filepath, 'w') as f:
-            json.dump(trace_data, f, indent=2)
+        write_bytes(filepath, orjson.dumps(trace_data, option=orjson.OPT_INDENT_2))
 
         return str(filepath)
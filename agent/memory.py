@@ -2,22 +2,29 @@
 Agent state and memory management
 Tracks reasoning history across iterations
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+import time
 
 
-@dataclass
+def _trunc(text: str, limit: int = 200) -> str:
+    """Return text unchanged if short enough, else its first `limit` chars plus '...'"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+@dataclass(slots=True)
 class ReasoningStep:
     """Single step in reasoning process"""
     step_number: int
     step_type: str  # "plan", "execute", "reflect", "revise"
     content: str
     metadata: Dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds, formatted in to_dict
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """
     Agent state across reasoning iterations
@@ -32,6 +39,12 @@ class AgentState:
     max_iterations: int = 5
     is_complete: bool = False
     reflection_feedback: List[str] = field(default_factory=list)
+    # Serialized log records ("trace"/"tool", bytes) awaiting a group commit
+    pending_log_entries: List[Tuple[str, bytes]] = field(default_factory=list)
+    # step_type -> steps in insertion order, maintained by add_step
+    _by_type: Dict[str, List[ReasoningStep]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False, compare=False
+    )
 
     def add_step(
         self,
@@ -47,10 +60,11 @@ class AgentState:
             metadata=metadata or {}
         )
         self.reasoning_steps.append(step)
+        self._by_type[step_type].append(step)
 
     def get_steps_by_type(self, step_type: str) -> List[ReasoningStep]:
-        """Get all steps of a specific type"""
-        return [step for step in self.reasoning_steps if step.step_type == step_type]
+        """Get all steps of a specific type (shared list, do not mutate)"""
+        return self._by_type.get(step_type, [])
 
     def increment_iteration(self) -> None:
         """Move to next iteration (revision)"""
@@ -82,7 +96,8 @@ class AgentState:
                 {
                     "number": step.step_number,
                     "type": step.step_type,
-                    "content": step.content[:200] + "..." if len(step.content) > 200 else step.content,
+                    "content": _trunc(step.content),
+                    "timestamp": datetime.fromtimestamp(step.timestamp).isoformat(),
                 }
                 for step in self.reasoning_steps
             ]
@@ -2,18 +2,21 @@
 Main agent orchestrator
 Coordinates all agent capabilities into unified workflow
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import threading
 from datetime import datetime
 
+from agent._client import CLIENT
 from agent.memory import AgentState, ReasoningStep
-from agent.reasoning import ReasoningPlanner
+from agent.reasoning import KNOWN_COLLECTIONS, ReasoningPlanner
 from agent.reflection import SelfReflectionCritic
 from agent.prompts import AGENT_SYSTEM_PROMPT, format_answer_prompt, format_revision_prompt
-from agent.logger import AgentLogger
-from rag.retriever import retrieve_relevant_chunks, format_retrieved_chunks
+from agent.logger import AgentLogger, write_bytes
+from rag.retriever import index_version, retrieve_relevant_chunks, format_retrieved_chunks
 from rag.config import (
-    OPENAI_API_KEY,
     AGENT_MODEL,
     AGENT_TEMPERATURE,
     MAX_REASONING_STEPS,
@@ -23,8 +26,40 @@ from rag.config import (
 from tools import get_global_registry
 from tools.base import ToolResult
 
+import orjson
 from openai import OpenAI
 
+# Built once and shared by every completion request
+_SYSTEM_MSG = {"role": "system", "content": AGENT_SYSTEM_PROMPT}
+
+# Upper bound on memoized retrieval results kept per orchestrator
+RETRIEVAL_CACHE_MAX = 128
+
+# Threads used to query collections concurrently (retrieval is I/O bound)
+RETRIEVAL_WORKERS = 8
+
+
+@dataclass(slots=True)
+class ContextView:
+    """
+    Retrieved documents plus the text slices each phase needs
+    Built once per retrieval and shared across attempts
+    """
+    docs: Tuple[Any, ...]
+    full_texts: Tuple[str, ...] = field(init=False)
+    preview_200: Tuple[str, ...] = field(init=False)  # Tool selection
+    preview_300: Tuple[str, ...] = field(init=False)  # Reflection
+    formatted: str = field(init=False)  # Generation, with citation headers
+
+    def __post_init__(self):
+        self.full_texts = tuple(doc.page_content for doc in self.docs)
+        self.preview_200 = tuple(text[:200] for text in self.full_texts[:2])
+        self.preview_300 = tuple(text[:300] for text in self.full_texts[:3])
+        self.formatted = (
+            format_retrieved_chunks(list(self.docs), include_scores=False)
+            if self.docs else ""
+        )
+
 
 class AgentOrchestrator:
     """
@@ -32,12 +67,51 @@ class AgentOrchestrator:
     Coordinates reasoning, RAG, tools, and reflection
     """
 
-    def __init__(self):
+    def __init__(self, client: Optional[OpenAI] = None):
+        """
+        Args:
+            client: OpenAI client for answer generation (defaults to the shared pool)
+        """
         self.planner = ReasoningPlanner()
         self.critic = SelfReflectionCritic()
         self.tool_registry = get_global_registry()
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+        # Registered tools don't change after startup, so build their schemas once
+        self._tool_schemas = self.tool_registry.get_tool_schemas()
+        self.client = client or CLIENT
         self.logger = AgentLogger()
+        # (query, sorted collections) -> retrieved docs, reused across revisions
+        self._retrieval_cache: Dict[Tuple[str, Tuple[str, ...]], ContextView] = {}
+        # Runs of one orchestrator may overlap (evaluation, demo examples)
+        self._retrieval_lock = threading.Lock()
+        self._retr_pool = ThreadPoolExecutor(
+            max_workers=RETRIEVAL_WORKERS, thread_name_prefix="agent-retrieve"
+        )
+
+    def prepare(self) -> None:
+        """
+        Warm up before a burst of queries (e.g. an evaluation run)
+        One search per collection (which also embeds a query and opens the
+        Chroma store) and a 1-token completion, all run concurrently, so the
+        first real queries don't pay the cold-start costs. Failures are
+        ignored: the real queries will report them.
+        """
+        warmups = [
+            self._retr_pool.submit(
+                retrieve_relevant_chunks, query="warmup", collection_name=collection, top_k=1
+            )
+            for collection in KNOWN_COLLECTIONS
+        ]
+        warmups.append(self._retr_pool.submit(
+            self.client.chat.completions.create,
+            model=AGENT_MODEL,
+            messages=[{"role": "user", "content": "ping"}],
+            max_tokens=1
+        ))
+        for future in as_completed(warmups):
+            try:
+                future.result()
+            except Exception:
+                pass
 
     def run(
         self,
@@ -72,21 +146,36 @@ class AgentOrchestrator:
         if verbose:
             print("🧠 Planning")
 
-        plan = self._plan(query, state, verbose)
+        # The plan only annotates the trace, so the planner's LLM call
+        # runs in the background while the first retrieval is fetched.
+        # Short single questions get a one-task plan without any LLM call
+        if self.planner.quick_classify(query) == "simple":
+            plan_future = None
+        else:
+            plan_future = self._retr_pool.submit(self.planner.plan, query)
 
         # Determine collections to search
         collections = self.planner.identify_collections(query)
-        if verbose:
-            print(f"   📚 Target collections: {', '.join(collections)}")
 
         # Check if tools are needed
         needs_tools = self.planner.should_use_tools(query)
+
+        prefetched = self._fetch_context(query, collections)
+
+        plan = self._plan(
+            query, state, verbose,
+            plan_future.result() if plan_future else self.planner.simple_plan(query)
+        )
+
         if verbose:
+            print(f"   📚 Target collections: {', '.join(collections)}")
             print(f"   🔧 Tools needed: {needs_tools}")
 
         # === Iterative Workflow Loop ===
         while state.should_continue():
             state.increment_attempt()
+            # One timestamp per attempt, shared by every record it logs
+            iter_ts = datetime.now().isoformat()
             if verbose:
                 print(f"\n🔄 Attempt {state.total_attempts}/{state.max_iterations}")
 
@@ -94,21 +183,18 @@ class AgentOrchestrator:
             if verbose:
                 print("   🔍 Retrieval")
 
-            context_docs = self._retrieve(query, collections, state, verbose)
-
-            # === TOOL CALLING ===
-            tool_results = []
-            if needs_tools:
-                if verbose:
-                    print("   🔧 Tool Calling")
-                tool_results = self._call_tools(query, context_docs, state, verbose)
+            context = self._retrieve(
+                query, collections, state, verbose, prefetched=prefetched
+            )
+            prefetched = None
 
-            # === GENERATION ===
+            # === GENERATION (+ TOOL CALLING in the same completion) ===
             if verbose:
                 print("   ✍️  Generation")
 
             answer = self._generate(
-                query, context_docs, tool_results, state, verbose
+                query, context, state, verbose,
+                use_tools=needs_tools, timestamp=iter_ts
             )
 
             state.current_answer = answer
@@ -118,7 +204,7 @@ class AgentOrchestrator:
                 if verbose:
                     print("   🤔 Reflection")
 
-                reflection = self._reflect(query, answer, context_docs, state, verbose)
+                reflection = self._reflect(query, answer, context, state, verbose)
 
                 # === REVISE? ===
                 should_revise = self.critic.should_revise(reflection)
@@ -131,6 +217,13 @@ class AgentOrchestrator:
                     feedback = self._format_reflection_feedback(reflection)
                     state.reflection_feedback.append(feedback)
 
+                    # Only a gap in the evidence warrants hitting the index again
+                    if reflection.missing_information:
+                        with self._retrieval_lock:
+                            self._retrieval_cache.pop(
+                                self._retrieval_key(query, collections), None
+                            )
+
                     state.increment_iteration()
                     continue  # Next iteration
                 else:
@@ -151,7 +244,7 @@ class AgentOrchestrator:
             print(f"Confidence: {state.confidence_score:.2f}")
             print(f"{'='*60}\n")
 
-        # Log final state
+        # Log final state (also commits the tool records buffered during the run)
         self.logger.log_state(state)
 
         return state
@@ -160,10 +253,12 @@ class AgentOrchestrator:
         self,
         query: str,
         state: AgentState,
-        verbose: bool
+        verbose: bool,
+        plan: Optional[Any] = None
     ) -> Any:
         """Planning phase"""
-        plan = self.planner.plan(query)
+        if plan is None:
+            plan = self.planner.plan(query)
 
         state.add_step("plan", f"Main goal: {plan.main_goal}", {
             "sub_tasks": plan.sub_tasks,
@@ -183,34 +278,119 @@ class AgentOrchestrator:
         query: str,
         collections: List[str],
         state: AgentState,
-        verbose: bool
-    ) -> List[Any]:
+        verbose: bool,
+        prefetched: Optional[Tuple[ContextView, Optional[List[str]]]] = None
+    ) -> ContextView:
         """Retrieval phase"""
-        all_docs = []
+        context, status = prefetched or self._fetch_context(query, collections)
 
-        for collection in collections:
+        if status is None:
+            if verbose:
+                print(f"      Reusing {len(context.docs)} cached documents")
+            state.add_step("retrieve", f"Retrieved {len(context.docs)} documents (cached)", {
+                "collections": collections,
+                "doc_count": len(context.docs),
+                "sources": self._doc_sources(context.docs),
+                "cached": True
+            })
+            return context
+
+        if verbose:
+            for line in status:
+                print(f"      {line}")
+
+        state.add_step("retrieve", f"Retrieved {len(context.docs)} documents", {
+            "collections": collections,
+            "doc_count": len(context.docs),
+            "sources": self._doc_sources(context.docs)
+        })
+
+        return context
+
+    def _fetch_context(
+        self,
+        query: str,
+        collections: List[str]
+    ) -> Tuple[ContextView, Optional[List[str]]]:
+        """
+        Search collections without touching state (memoized)
+        Returns the view and per-collection status lines, or None on a cache hit
+        """
+        cache_key = self._retrieval_key(query, collections)
+        with self._retrieval_lock:
+            cached = self._retrieval_cache.get(cache_key)
+        if cached is not None:
+            return cached, None
+
+        # Query every collection concurrently; total latency is the slowest one
+        results_by_collection: Dict[str, List[Any]] = {}
+        errors: Dict[str, Exception] = {}
+
+        if len(collections) == 1:
             try:
-                results = retrieve_relevant_chunks(
+                results_by_collection[collections[0]] = retrieve_relevant_chunks(
                     query=query,
-                    collection_name=collection,
+                    collection_name=collections[0],
                     top_k=TOP_K
                 )
-                all_docs.extend(results)
-
-                if verbose:
-                    print(f"      {collection}: {len(results)} documents")
-
             except Exception as e:
-                if verbose:
-                    print(f"      {collection}: Error - {e}")
+                errors[collections[0]] = e
+        else:
+            futures = {
+                self._retr_pool.submit(
+                    retrieve_relevant_chunks,
+                    query=query,
+                    collection_name=collection,
+                    top_k=TOP_K
+                ): collection
+                for collection in collections
+            }
+            for future in as_completed(futures):
+                collection = futures[future]
+                try:
+                    results_by_collection[collection] = future.result()
+                except Exception as e:
+                    errors[collection] = e
+
+        # Merge in the planner's collection order, independent of completion order
+        all_docs = []
+        status = []
+        for collection in collections:
+            if collection in results_by_collection:
+                results = results_by_collection[collection]
+                all_docs.extend(results)
+                status.append(f"{collection}: {len(results)} documents")
+            else:
+                status.append(f"{collection}: Error - {errors[collection]}")
 
         # Limit total docs to avoid overwhelming context (allow more from multiple collections)
         max_total_docs = TOP_K * 2
         all_docs = all_docs[:max_total_docs]
 
-        # Extract source information for display
+        context = ContextView(docs=tuple(all_docs))
+        if errors:
+            # Partial results are not memoized; the next run retries the failures
+            return context, status
+
+        with self._retrieval_lock:
+            full = len(self._retrieval_cache) >= RETRIEVAL_CACHE_MAX
+            if full and cache_key not in self._retrieval_cache:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._retrieval_cache.pop(next(iter(self._retrieval_cache)))
+            self._retrieval_cache[cache_key] = context
+
+        return context, status
+
+    @staticmethod
+    def _retrieval_key(query: str, collections: List[str]) -> Tuple[Any, ...]:
+        """Memo key of a retrieval; a reindex changes the version and retires old entries"""
+        return (query, tuple(sorted(collections)), index_version())
+
+    @staticmethod
+    def _doc_sources(docs: Tuple[Any, ...]) -> List[Dict[str, Any]]:
+        """Extract source information for display"""
         sources = []
-        for doc in all_docs:
+        for doc in docs:
             source_info = {
                 "source": doc.metadata.get("source", "unknown"),
                 "source_type": doc.metadata.get("source_type", "unknown")
@@ -220,136 +400,22 @@ class AgentOrchestrator:
             if "score" in doc.metadata:
                 source_info["score"] = doc.metadata.get("score")
             sources.append(source_info)
-
-        state.add_step("retrieve", f"Retrieved {len(all_docs)} documents", {
-            "collections": collections,
-            "doc_count": len(all_docs),
-            "sources": sources
-        })
-
-        return all_docs
-
-    def _call_tools(
-        self,
-        query: str,
-        context_docs: List[Any],
-        state: AgentState,
-        verbose: bool
-    ) -> List[Dict[str, Any]]:
-        """Tool calling phase using OpenAI function calling"""
-        tool_results = []
-
-        # Get available tool schemas
-        tool_schemas = self.tool_registry.get_tool_schemas()
-
-        if not tool_schemas:
-            return tool_results
-
-        # Prepare context for tool selection
-        context_preview = "\n".join([
-            doc.page_content[:200] for doc in context_docs[:2]
-        ]) if context_docs else ""
-
-        tool_selection_prompt = f"""Query: {query}
-
-Context preview:
-{context_preview}
-
-Based on this query, determine which tools (if any) should be called and with what parameters.
-Consider:
-- Does the query require calculations?
-- Does it need current date/time information?
-- Does it need formatting (table, list)?
-- Does it need additional database searches?
-"""
-
-        try:
-            # Use OpenAI function calling to select tools
-            response = self.client.chat.completions.create(
-                model=AGENT_MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant with access to tools. Decide which tools to call based on the user's query."},
-                    {"role": "user", "content": tool_selection_prompt}
-                ],
-                tools=tool_schemas,
-                tool_choice="auto",
-                temperature=0.3
-            )
-
-            # Check if tools were called
-            message = response.choices[0].message
-
-            if message.tool_calls:
-                if verbose:
-                    print(f"      Selected {len(message.tool_calls)} tools")
-
-                for tool_call in message.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_args = json.loads(tool_call.function.arguments)
-
-                    if verbose:
-                        print(f"      Calling {tool_name}...")
-
-                    # Execute tool
-                    result = self.tool_registry.execute(tool_name, **tool_args)
-
-                    # Log tool call
-                    self.logger.log_tool_call(
-                        tool_name=tool_name,
-                        params=tool_args,
-                        result=result.result,
-                        success=result.success
-                    )
-
-                    tool_results.append({
-                        "tool": tool_name,
-                        "success": result.success,
-                        "result": result.result,
-                        "error": result.error
-                    })
-
-                    if verbose:
-                        if result.success:
-                            result_str = str(result.result)
-                            print(f"         ✓ Success: {result_str[:100]}")
-                        else:
-                            print(f"         ✗ Error: {result.error}")
-            else:
-                if verbose:
-                    print("      No tools needed for this query")
-
-        except Exception as e:
-            if verbose:
-                print(f"      Tool calling error: {e}")
-
-        state.add_step("tool_call", f"Called {len(tool_results)} tools", {
-            "tools": [t["tool"] for t in tool_results]
-        })
-
-        return tool_results
+        return sources
 
     def _generate(
         self,
         query: str,
-        context_docs: List[Any],
-        tool_results: List[Dict[str, Any]],
+        context: ContextView,
         state: AgentState,
-        verbose: bool
+        verbose: bool,
+        use_tools: bool = False,
+        timestamp: Optional[str] = None
     ) -> str:
-        """Generation phase"""
-
-        # Prepare context with source metadata for citations
-        # Use formatted chunks that include document names and page numbers
-        if context_docs:
-            formatted_context = format_retrieved_chunks(context_docs, include_scores=False)
-            context_texts = [formatted_context]
-        else:
-            context_texts = []
-
-        # Add tool results to context
-        if tool_results:
-            tool_context = self._format_tool_results(tool_results)
-            context_texts.append(f"\n\nTool Results:\n{tool_context}")
+        """
+        Generation phase
+        Tools are offered in the answer completion itself; a second call is
+        made only to finalize the answer when the model actually calls tools
+        """
 
         # Choose prompt based on iteration
         if state.reflection_feedback:
@@ -358,26 +424,63 @@ Consider:
                 query=query,
                 previous_answer=state.current_answer or "",
                 feedback=state.reflection_feedback[-1],
-                context=context_texts
+                # Formatted chunks include document names and page numbers for citations
+                context=context.formatted
             )
         else:
             # Initial prompt
-            prompt = format_answer_prompt(query=query, context=context_texts)
+            prompt = format_answer_prompt(query=query, context=context.formatted)
 
-        # Generate answer
+        messages = [_SYSTEM_MSG, {"role": "user", "content": prompt}]
+
+        tool_schemas = self._tool_schemas if use_tools else []
+        tool_kwargs = {"tools": tool_schemas, "tool_choice": "auto"} if tool_schemas else {}
+
+        # Generate answer (the model may instead ask for tools first)
         response = self.client.chat.completions.create(
             model=AGENT_MODEL,
-            messages=[
-                {"role": "system", "content": AGENT_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=AGENT_TEMPERATURE
+            messages=messages,
+            temperature=AGENT_TEMPERATURE,
+            **tool_kwargs
         )
+        message = response.choices[0].message
+
+        tool_results = []
+        if message.tool_calls:
+            if verbose:
+                print("   🔧 Tool Calling")
+                print(f"      Selected {len(message.tool_calls)} tools")
+
+            messages.append(message.model_dump(exclude_none=True))
+            tool_results = self._execute_tool_calls(message.tool_calls, state, verbose, timestamp)
+            for tool_call, tool_result in zip(message.tool_calls, tool_results):
+                messages.append({
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": self._format_tool_result(tool_result)
+                })
+
+            # Finalize with the tool outputs in the conversation
+            response = self.client.chat.completions.create(
+                model=AGENT_MODEL,
+                messages=messages,
+                temperature=AGENT_TEMPERATURE,
+                tools=tool_schemas,
+                tool_choice="none"
+            )
+            message = response.choices[0].message
+        elif tool_schemas and verbose:
+            print("      No tools needed for this query")
+
+        if tool_schemas:
+            state.add_step("tool_call", f"Called {len(tool_results)} tools", {
+                "tools": [t["tool"] for t in tool_results]
+            })
 
-        answer = response.choices[0].message.content
+        answer = message.content or ""
 
         state.add_step("generate", answer[:200] + "...", {
-            "context_count": len(context_docs),
+            "context_count": len(context.docs),
             "tool_results_count": len(tool_results)
         })
 
@@ -386,18 +489,80 @@ Consider:
 
         return answer
 
+    def _execute_tool_calls(
+        self,
+        tool_calls: List[Any],
+        state: AgentState,
+        verbose: bool,
+        timestamp: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the tool calls requested by the model and log them
+        The calls of one turn are independent, so they execute concurrently;
+        logging and output happen afterwards, in the order they were requested
+        """
+        outcomes: List[Optional[Dict[str, Any]]] = []
+        pending: List[Tuple[int, str, Dict[str, Any]]] = []
+        for position, tool_call in enumerate(tool_calls):
+            tool_name = tool_call.function.name
+            try:
+                tool_args = json.loads(tool_call.function.arguments)
+            except json.JSONDecodeError as e:
+                if verbose:
+                    print(f"      Tool calling error: {e}")
+                outcomes.append({
+                    "tool": tool_name,
+                    "success": False,
+                    "result": None,
+                    "error": f"Invalid arguments: {e}"
+                })
+                continue
+
+            if verbose:
+                print(f"      Calling {tool_name}...")
+            outcomes.append(None)
+            pending.append((position, tool_name, tool_args))
+
+        # Execute tools
+        results = self.tool_registry.execute_many([(name, args) for _, name, args in pending])
+
+        for (position, tool_name, tool_args), result in zip(pending, results):
+            # Log tool call
+            self.logger.log_tool_call(
+                tool_name=tool_name,
+                params=tool_args,
+                result=result.result,
+                success=result.success,
+                timestamp=timestamp,
+                state=state
+            )
+
+            if verbose:
+                if result.success:
+                    result_str = str(result.result)
+                    print(f"         ✓ {tool_name}: {result_str[:100]}")
+                else:
+                    print(f"         ✗ {tool_name}: {result.error}")
+
+            outcomes[position] = {
+                "tool": tool_name,
+                "success": result.success,
+                "result": result.result,
+                "error": result.error
+            }
+
+        return outcomes
+
     def _reflect(
         self,
         query: str,
         answer: str,
-        context_docs: List[Any],
+        context: ContextView,
         state: AgentState,
         verbose: bool
     ) -> Any:
         """Reflection phase"""
-        context_texts = [doc.page_content[:300] for doc in context_docs[:3]]
-
-        reflection = self.critic.reflect(query, answer, context_texts)
+        reflection = self.critic.reflect(query, answer, list(context.preview_300))
 
         state.confidence_score = reflection.confidence_score
 
@@ -437,15 +602,11 @@ Consider:
 
         return "\n".join(feedback_parts)
 
-    def _format_tool_results(self, tool_results: List[Dict[str, Any]]) -> str:
-        """Format tool results for context"""
-        formatted = []
-        for tr in tool_results:
-            if tr["success"]:
-                formatted.append(f"- {tr['tool']}: {tr['result']}")
-            else:
-                formatted.append(f"- {tr['tool']}: Error - {tr['error']}")
-        return "\n".join(formatted)
+    def _format_tool_result(self, tool_result: Dict[str, Any]) -> str:
+        """Format a tool result as the content of a tool message"""
+        if tool_result["success"]:
+            return str(tool_result["result"])
+        return f"Error - {tool_result['error']}"
 
     def save_trace(self, state: AgentState, output_path: str = None) -> str:
         """Save execution trace to file"""
@@ -454,8 +615,7 @@ Consider:
             trace["timestamp"] = datetime.now().isoformat()
             trace["final_answer"] = state.current_answer
 
-            with open(output_path, 'w') as f:
-                json.dump(trace, f, indent=2)
+            write_bytes(output_path, orjson.dumps(trace, option=orjson.OPT_INDENT_2))
 
             print(f"✓ Trace saved to {output_path}")
             return output_path
@@ -1,6 +1,7 @@
 """
 Prompts for agent reasoning, reflection, and revision
 """
+from string import Template
 from typing import List
 
 AGENT_SYSTEM_PROMPT = """You are an intelligent AI agent with access to a knowledge base about AI Academy course materials.
@@ -21,14 +22,10 @@ Your approach:
 IMPORTANT: Always cite your sources with document names and page numbers. This builds trust and allows verification."""
 
 
-ANSWER_GENERATION_PROMPT = """Based on the retrieved context below, answer the user's query.
-
-Query: {query}
-
-Retrieved Context:
-{context}
-
-Your task:
+# Static instruction blocks, shared by the single-message prompts below and by
+# the cache-friendly system prefixes (identical leading tokens on every call
+# let OpenAI's automatic prompt caching skip re-processing them)
+ANSWER_INSTRUCTIONS = """Your task:
 1. Synthesize the information from the context
 2. Answer the query directly and clearly
 3. **ALWAYS cite sources** - include document name and page number for EVERY claim
@@ -43,57 +40,154 @@ CITATION FORMAT:
 EXAMPLE:
 "Retrieval-augmented generation (RAG) is a technique that enhances language models by retrieving relevant information from external sources [rag-intro.pdf, page 3]. As explained in [week2-embeddings.pdf, page 5]: 'RAG combines the strengths of retrieval systems and generative models.'"
 
-Remember: Each chunk header shows [Chunk X from source, page Y] - use this information to cite properly.
+Remember: Each chunk header shows [Chunk X from source, page Y] - use this information to cite properly."""
+
+
+REVISION_INSTRUCTIONS = """IMPORTANT REMINDERS:
+- ALWAYS cite sources with document names and page numbers
+- Use format: [document.pdf, page X]
+- Include direct quotes when appropriate
+- Ensure every major claim has a citation"""
+
+
+ANSWER_GENERATION_PROMPT = """Based on the retrieved context below, answer the user's query.
+
+Query: $query
+
+Retrieved Context:
+$context
+
+""" + ANSWER_INSTRUCTIONS + """
 
 Answer:"""
 
 
 REVISION_PROMPT = """You previously answered a query, but reflection identified areas for improvement.
 
-Original Query: {query}
+Original Query: $query
 
 Previous Answer:
-{previous_answer}
+$previous_answer
 
 Reflection Feedback:
-{feedback}
+$feedback
 
 Retrieved Context (may include new information):
-{context}
+$context
 
 Provide an improved answer that addresses the feedback.
 
-IMPORTANT REMINDERS:
-- ALWAYS cite sources with document names and page numbers
-- Use format: [document.pdf, page X]
-- Include direct quotes when appropriate
-- Ensure every major claim has a citation
+""" + REVISION_INSTRUCTIONS + """
 
 Improved Answer:"""
 
 
-def format_answer_prompt(query: str, context: List[str]) -> str:
-    """Format prompt for answer generation"""
-    context_str = "\n\n---\n\n".join(context)
-    return ANSWER_GENERATION_PROMPT.format(
-        query=query,
-        context=context_str
-    )
+# Appended to the request when a streamed answer ran long without citing anything
+CITATION_REMINDER = """
+
+Your previous attempt did not cite any sources. Cite the supporting document and page, e.g. [document.pdf, page X], from the first sentences on."""
+
+
+# System prompts with every static instruction up front; only the short
+# per-call request (see format_*_request) goes in the user message
+ANSWER_SYSTEM_PROMPT = AGENT_SYSTEM_PROMPT + """
+
+When given a query with retrieved context, answer the query based on that context.
+
+""" + ANSWER_INSTRUCTIONS
+
+REVISION_SYSTEM_PROMPT = AGENT_SYSTEM_PROMPT + """
+
+When given a previous answer with reflection feedback, provide an improved answer that addresses the feedback.
+
+""" + REVISION_INSTRUCTIONS
+
+# Critique of a revised answer and, if it still falls short, the next revision
+# in the same call (the context is only sent and processed once)
+CRITIQUE_AND_REVISE_SYSTEM_PROMPT = """You are a critical AI assistant that evaluates answer quality and improves weak answers.
+
+Assess the answer based on:
+1. Accuracy - Is the information correct?
+2. Completeness - Does it fully address the query?
+3. Clarity - Is it well-explained?
+4. Relevance - Does it stay on topic?
+5. Evidence - Is it supported by the context?
+
+If the answer is not satisfactory, write an improved answer that addresses the weaknesses using the retrieved context.
+
+Respond with a JSON object with these keys:
+- confidence_score: float (0.0-1.0) for the given answer
+- is_satisfactory: boolean
+- strengths: array of strings
+- weaknesses: array of strings
+- suggestions: array of strings
+- missing_information: array of strings
+- improved_answer: string (empty if the answer is satisfactory)
+
+For the improved answer:
+""" + REVISION_INSTRUCTIONS
+
+# Split once at import around $context: only the short head has placeholders,
+# the long instruction tail is appended verbatim
+_ANSWER_HEAD, _ANSWER_TAIL = ANSWER_GENERATION_PROMPT.split("$context")
+_ANSWER_HEAD_TPL = Template(_ANSWER_HEAD)
+_REVISION_HEAD, _REVISION_TAIL = REVISION_PROMPT.split("$context")
+_REVISION_HEAD_TPL = Template(_REVISION_HEAD)
+
+
+def join_context(chunks: List[str]) -> str:
+    """
+    Join retrieved chunks into the context block of the generation prompts
+    Join once per retrieval and pass the result to every format_* call
+    """
+    return "\n\n---\n\n".join(chunks)
+
+
+def format_answer_prompt(query: str, context: str) -> str:
+    """Format prompt for answer generation (context joined by join_context)"""
+    return "".join((
+        _ANSWER_HEAD_TPL.substitute(query=query),
+        context,
+        _ANSWER_TAIL
+    ))
 
 
 def format_revision_prompt(
     query: str,
     previous_answer: str,
     feedback: str,
-    context: List[str]
+    context: str
+) -> str:
+    """Format prompt for answer revision (context joined by join_context)"""
+    return "".join((
+        _REVISION_HEAD_TPL.substitute(
+            query=query,
+            previous_answer=previous_answer,
+            feedback=feedback
+        ),
+        context,
+        _REVISION_TAIL
+    ))
+
+
+def format_answer_request(query: str, context: str) -> str:
+    """Per-call user message to pair with ANSWER_SYSTEM_PROMPT"""
+    return f"Query: {query}\n\nRetrieved Context:\n{context}\n\nAnswer:"
+
+
+def format_revision_request(
+    query: str,
+    previous_answer: str,
+    feedback: str,
+    context: str
 ) -> str:
-    """Format prompt for answer revision"""
-    context_str = "\n\n---\n\n".join(context)
-    return REVISION_PROMPT.format(
-        query=query,
-        previous_answer=previous_answer,
-        feedback=feedback,
-        context=context_str
+    """Per-call user message to pair with REVISION_SYSTEM_PROMPT"""
+    return (
+        f"Original Query: {query}\n\n"
+        f"Previous Answer:\n{previous_answer}\n\n"
+        f"Reflection Feedback:\n{feedback}\n\n"
+        f"Retrieved Context (may include new information):\n{context}\n\n"
+        "Improved Answer:"
     )
 
 
@@ -117,6 +211,9 @@ Learn more about Ciklum's AI initiatives: https://www.ciklum.com/
 
 #Ciklum #AIAcademy #MachineLearning #ArtificialIntelligence #EngineeringPath"""
 
+# Single placeholder: split once and concatenate instead of running str.format
+_LINKEDIN_HEAD, _LINKEDIN_TAIL = LINKEDIN_POST_TEMPLATE.split("{custom_closing}")
+
 
 def format_linkedin_post(custom_closing: str = "") -> str:
     """
@@ -128,4 +225,4 @@ def format_linkedin_post(custom_closing: str = "") -> str:
     Returns:
         Formatted LinkedIn post text
     """
-    return LINKEDIN_POST_TEMPLATE.format(custom_closing=custom_closing)
+    return "".join((_LINKEDIN_HEAD, custom_closing, _LINKEDIN_TAIL))
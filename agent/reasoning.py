@@ -1,15 +1,90 @@
 """
 Agent reasoning and planning capabilities
 """
-from typing import List, Dict, Any
-import json
-from openai import OpenAI
-from dataclasses import dataclass
+from __future__ import annotations
 
-from rag.config import OPENAI_API_KEY, AGENT_MODEL, AGENT_TEMPERATURE
+from typing import List, Dict, Any, Tuple
+import re
+from functools import lru_cache
+from dataclasses import dataclass, fields
 
+import orjson
 
-@dataclass
+from rag.config import AGENT_MODEL, AGENT_TEMPERATURE
+
+
+PLANNER_SYSTEM_PROMPT = """You are an AI planning assistant. Given a user query, decompose it into a structured plan.
+
+Analyze:
+1. What is the main goal?
+2. What sub-tasks are needed?
+3. What information must be retrieved?
+4. How complex is this query? (simple, moderate, or complex)
+
+Respond with a JSON object with these keys:
+- main_goal: string
+- sub_tasks: array of strings
+- required_information: array of strings
+- complexity: string ("simple", "moderate", or "complex")
+
+Be specific and actionable."""
+
+
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile keywords into one case-insensitive alternation (substring match)"""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+# Keyword buckets matched in a single regex scan each (compiled at import)
+_TOOL_KEYWORDS = _keyword_pattern([
+    "calculate", "compute", "math",
+    "search", "find", "lookup",
+    "date", "time", "today",
+    "format", "table", "list"
+])
+
+# "lecture" is in both buckets, so each collection keeps its own pattern
+_COLLECTION_KEYWORDS = [
+    # AI Academy/course indicators
+    ("ai_academy_course", _keyword_pattern([
+        "academy", "course", "lesson", "week", "homework", "lecture", "material"
+    ])),
+    # Transcript indicators
+    ("transcripts", _keyword_pattern([
+        "video", "transcript", "lecture", "recording"
+    ])),
+]
+
+# Every collection the planner can route a query to
+KNOWN_COLLECTIONS = tuple(name for name, _ in _COLLECTION_KEYWORDS)
+
+
+# Queries this short with no multi-part markers are answered without an LLM plan
+SIMPLE_QUERY_MAX_TOKENS = 12
+
+# Words that signal several sub-questions or a comparison (whole words only)
+_MULTI_PART_MARKERS = re.compile(
+    r"\b(?:and|then|compare|comparison|versus|vs|difference|between|steps?)\b",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1024)
+def analyze_query(query: str) -> Tuple[bool, Tuple[str, ...]]:
+    """
+    Keyword analysis of a query in one pass: (needs_tools, collections)
+    Memoized, since the orchestrator and evaluators ask about the same query repeatedly
+    """
+    needs_tools = _TOOL_KEYWORDS.search(query) is not None
+    collections = tuple(
+        name for name, pattern in _COLLECTION_KEYWORDS
+        if pattern.search(query)
+    )
+    # Default to ai_academy_course if unclear
+    return needs_tools, collections or ("ai_academy_course",)
+
+
+@dataclass(slots=True, frozen=True)
 class TaskDecomposition:
     """Structured output for task decomposition"""
     main_goal: str
@@ -18,6 +93,10 @@ class TaskDecomposition:
     complexity: str  # "simple", "moderate", or "complex"
 
 
+# JSON keys decoded straight into TaskDecomposition; anything else is ignored
+_PLAN_KEYS = frozenset(f.name for f in fields(TaskDecomposition))
+
+
 class ReasoningPlanner:
     """
     Plans how to approach a query
@@ -25,86 +104,87 @@ class ReasoningPlanner:
     """
 
     def __init__(self):
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+        # Imported here: keyword analysis alone shouldn't pay for loading openai
+        from agent._client import CLIENT
+        self.client = CLIENT
+
+    @property
+    def async_client(self):
+        """Async client of the running event loop"""
+        from agent._client import get_async_client
+        return get_async_client()
 
     def plan(self, query: str) -> TaskDecomposition:
         """
         Create a plan for answering the query using JSON mode
         """
-        system_prompt = """You are an AI planning assistant. Given a user query, decompose it into a structured plan.
-
-Analyze:
-1. What is the main goal?
-2. What sub-tasks are needed?
-3. What information must be retrieved?
-4. How complex is this query? (simple, moderate, or complex)
-
-Respond with a JSON object with these keys:
-- main_goal: string
-- sub_tasks: array of strings
-- required_information: array of strings
-- complexity: string ("simple", "moderate", or "complex")
-
-Be specific and actionable."""
+        response = self.client.chat.completions.create(**self._plan_request(query))
+        return self._parse_plan(response.choices[0].message.content)
 
-        response = self.client.chat.completions.create(
-            model=AGENT_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
+    async def aplan(self, query: str) -> TaskDecomposition:
+        """
+        Async variant of plan, for overlapping with other I/O
+        """
+        response = await self.async_client.chat.completions.create(
+            **self._plan_request(query)
+        )
+        return self._parse_plan(response.choices[0].message.content)
+
+    def _plan_request(self, query: str) -> Dict[str, Any]:
+        """Chat completion arguments shared by plan and aplan"""
+        return {
+            "model": AGENT_MODEL,
+            "messages": [
+                {"role": "system", "content": PLANNER_SYSTEM_PROMPT},
                 {"role": "user", "content": f"Query: {query}"}
             ],
-            temperature=AGENT_TEMPERATURE,
-            response_format={"type": "json_object"}
+            "temperature": AGENT_TEMPERATURE,
+            "response_format": {"type": "json_object"}
+        }
+
+    def _parse_plan(self, content: str) -> TaskDecomposition:
+        """Parse JSON response into dataclass"""
+        result = orjson.loads(content)
+        # Every field is required: a missing key raises TypeError, as KeyError did before
+        return TaskDecomposition(
+            **{key: value for key, value in result.items() if key in _PLAN_KEYS}
         )
 
-        # Parse JSON response into dataclass
-        result = json.loads(response.choices[0].message.content)
+    def quick_classify(self, query: str) -> str:
+        """
+        Classify a query without calling the LLM
+        Returns "simple" for short single questions, otherwise "unknown"
+        (meaning the LLM planner should decide)
+        """
+        if (
+            len(query.split()) <= SIMPLE_QUERY_MAX_TOKENS
+            and query.count("?") <= 1
+            and _MULTI_PART_MARKERS.search(query) is None
+        ):
+            return "simple"
+        return "unknown"
+
+    def simple_plan(self, query: str) -> TaskDecomposition:
+        """Plan for a query classified "simple": a single task, no LLM call"""
         return TaskDecomposition(
-            main_goal=result["main_goal"],
-            sub_tasks=result["sub_tasks"],
-            required_information=result["required_information"],
-            complexity=result["complexity"]
+            main_goal=query,
+            sub_tasks=[query],
+            required_information=[],
+            complexity="simple"
         )
 
     def should_use_tools(self, query: str) -> bool:
         """
         Determine if query requires tool calling
         """
-        tool_keywords = [
-            "calculate", "compute", "math",
-            "search", "find", "lookup",
-            "date", "time", "today",
-            "format", "table", "list"
-        ]
-
-        query_lower = query.lower()
-        return any(keyword in query_lower for keyword in tool_keywords)
+        return analyze_query(query)[0]
 
     def identify_collections(self, query: str) -> List[str]:
         """
         Identify which collections to search based on query
         """
-        collections = []
-
-        query_lower = query.lower()
-
-        # Check for AI Academy/course indicators
-        if any(word in query_lower for word in [
-            "academy", "course", "lesson", "week", "homework", "lecture", "material"
-        ]):
-            collections.append("ai_academy_course")
-
-        # Check for transcript indicators
-        if any(word in query_lower for word in [
-            "video", "transcript", "lecture", "recording"
-        ]):
-            collections.append("transcripts")
-
-        # Default to ai_academy_course if unclear
-        if not collections:
-            collections = ["ai_academy_course"]
-
-        return collections
+        # Fresh list, so callers can't mutate the memoized result
+        return list(analyze_query(query)[1])
 
 
 # CLI for testing
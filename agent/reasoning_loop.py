@@ -1,27 +1,154 @@
 """
 Complete reasoning loop integrating planning, execution, reflection, and revision
 """
-from typing import Optional, List
-from openai import OpenAI
+import asyncio
+import heapq
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
 
 from agent.memory import AgentState
 from agent.reasoning import ReasoningPlanner
-from agent.reflection import SelfReflectionCritic
+from agent.reflection import SelfReflectionCritic, join_critic_context
 from agent.prompts import (
-    AGENT_SYSTEM_PROMPT,
-    format_answer_prompt,
-    format_revision_prompt
+    ANSWER_SYSTEM_PROMPT,
+    REVISION_SYSTEM_PROMPT,
+    CITATION_REMINDER,
+    join_context,
+    format_answer_request,
+    format_revision_request
 )
-from rag.retriever import retrieve_relevant_chunks
 from rag.config import (
-    OPENAI_API_KEY,
     AGENT_MODEL,
     AGENT_TEMPERATURE,
     MAX_REASONING_STEPS,
     TOP_K,
-    REFLECTION_ENABLED
+    TWO_LEVEL_RETRIEVAL,
+    REFLECTION_ENABLED,
+    SELF_CONSISTENCY_SAMPLES,
+    AGENT_CONCURRENCY
 )
 
+# Streaming guard: if no candidate has cited a source after this many tokens,
+# the generation is abandoned and retried once with a stricter reminder
+CITATION_CHECK_TOKENS = 600
+_CITATION_RE = re.compile(r"\[[^\]\n]+\.\w{2,4}(?:,\s*page\s*\d+)?\]")
+
+# Static system messages, built once so every call sends an identical prefix
+_ANSWER_SYSTEM_MSG = {"role": "system", "content": ANSWER_SYSTEM_PROMPT}
+_REVISION_SYSTEM_MSG = {"role": "system", "content": REVISION_SYSTEM_PROMPT}
+
+
+# Retrievals kept for revision passes (least recently used evicted)
+RETRIEVAL_CACHE_SIZE = 256
+
+# (query, collections, index version) -> retrieved documents
+_retrieval_cache: "OrderedDict[Tuple[str, Tuple[str, ...], int], Tuple]" = OrderedDict()
+_retrieval_lock = threading.Lock()
+
+
+def _retrieve_cached(
+    query: str,
+    collections: Tuple[str, ...]
+) -> Tuple[Tuple, Tuple[Tuple[str, str], ...]]:
+    """
+    Retrieve top chunks for a query from each collection (memoized)
+
+    Revision passes reuse the same query, so they hit the cache instead of
+    re-embedding and re-querying the index. Only complete retrievals are
+    cached: if a collection failed, the next call tries again. Entries are
+    keyed by the index version, so anything indexed since is picked up.
+
+    Returns:
+        (documents, errors) - the TOP_K best scoring documents, and
+        (collection, message) pairs for collections that failed
+    """
+    from rag.collections import index_version
+
+    key = (query, collections, index_version())
+    with _retrieval_lock:
+        cached = _retrieval_cache.get(key)
+        if cached is not None:
+            _retrieval_cache.move_to_end(key)
+            return cached, ()
+
+    top, errors = _retrieve(query, collections)
+    if not errors:
+        with _retrieval_lock:
+            _retrieval_cache[key] = top
+            while len(_retrieval_cache) > RETRIEVAL_CACHE_SIZE:
+                _retrieval_cache.popitem(last=False)
+    return top, errors
+
+
+def _retrieve(
+    query: str,
+    collections: Tuple[str, ...]
+) -> Tuple[Tuple, Tuple[Tuple[str, str], ...]]:
+    """
+    Retrieve top chunks for a query from each collection
+
+    The query is embedded once and the collections are searched in parallel.
+
+    Returns:
+        (documents, errors) as for _retrieve_cached
+    """
+    # Deferred until the first retrieval: loads chromadb and the embeddings client
+    import numpy as np
+    from rag.embeddings import embed_query
+    from rag.retriever import retrieve_relevant_chunks, select_sources
+
+    # Converted once: every collection (and both retrieval levels) is queried
+    # with the same vector, which chromadb would otherwise convert per call
+    query_embedding = np.asarray(embed_query(query), dtype=np.float32)
+    per_collection = 3
+
+    def _search(collection: str):
+        # Level 1: narrow to documents whose names match the query
+        if TWO_LEVEL_RETRIEVAL:
+            try:
+                sources = select_sources(query, collection)
+            except Exception:
+                sources = []  # Catalog unavailable: search everything
+            if sources:
+                results = retrieve_relevant_chunks(
+                    query=query,
+                    collection_name=collection,
+                    top_k=per_collection,
+                    query_embedding=query_embedding,
+                    sources=sources
+                )
+                if len(results) >= per_collection:
+                    return results
+
+        # Level 2 only (or fallback): search the whole collection
+        return retrieve_relevant_chunks(
+            query=query,
+            collection_name=collection,
+            top_k=per_collection,
+            query_embedding=query_embedding
+        )
+
+    with ThreadPoolExecutor(max_workers=len(collections)) as pool:
+        futures = [pool.submit(_search, collection) for collection in collections]
+
+    all_results = []
+    errors = []
+    for collection, future in zip(collections, futures):
+        try:
+            all_results.extend(future.result())
+        except Exception as e:
+            errors.append((collection, str(e)))
+
+    # Similarities come from the same distance metric in every collection, so
+    # the overall top-k is a partial selection over the merged hits (ties keep
+    # collection order)
+    top = heapq.nlargest(TOP_K, all_results, key=lambda doc: doc.metadata.get("score", 0.0))
+    return tuple(top), tuple(errors)
+
 
 class ReasoningAgent:
     """
@@ -32,9 +159,36 @@ class ReasoningAgent:
     def __init__(self):
         self.planner = ReasoningPlanner()
         self.critic = SelfReflectionCritic()
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+        # One loop for all sync runs, so its async client's connections
+        # stay open between calls
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def run(self, query: str, verbose: bool = True) -> AgentState:
+        """
+        Execute full reasoning loop for a query (blocking wrapper around arun)
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.arun(query, verbose=verbose))
+
+    async def run_many(
+        self,
+        queries: List[str],
+        concurrency: int = AGENT_CONCURRENCY
+    ) -> List[AgentState]:
+        """
+        Run several queries concurrently, at most `concurrency` at a time
+        Results are returned in the same order as `queries`
+        """
+        semaphore = asyncio.Semaphore(concurrency)
 
-    def run(self, query: str) -> AgentState:
+        async def _run_one(query: str) -> AgentState:
+            async with semaphore:
+                return await self.arun(query, verbose=False)
+
+        return await asyncio.gather(*(_run_one(q) for q in queries))
+
+    async def arun(self, query: str, verbose: bool = True) -> AgentState:
         """
         Execute full reasoning loop for a query
         """
@@ -44,36 +198,97 @@ class ReasoningAgent:
             max_iterations=MAX_REASONING_STEPS
         )
 
-        # Planning
-        print("🧠 Planning")
-        plan = self.planner.plan(query)
+        # Identify collections to search
+        collections = self.planner.identify_collections(query)
+
+        # Planning; the first retrieval doesn't depend on the plan, so it
+        # runs on a worker thread while the planner call is in flight
+        if verbose:
+            print("🧠 Planning")
+        retrieval = asyncio.to_thread(self._retrieve_context, query, collections, verbose)
+        llm_planned = self.planner.quick_classify(query) != "simple"
+        if llm_planned:
+            plan, prefetched = await asyncio.gather(self.planner.aplan(query), retrieval)
+        else:
+            # Short single question: decomposing it isn't worth an LLM round-trip
+            plan, prefetched = self.planner.simple_plan(query), await retrieval
         state.add_step("plan", f"Main goal: {plan.main_goal}", {
             "sub_tasks": plan.sub_tasks,
-            "complexity": plan.complexity
+            "complexity": plan.complexity,
+            "llm_planned": llm_planned
         })
 
-        # Identify collections to search
-        collections = self.planner.identify_collections(query)
-        print(f"   📚 Will search collections: {', '.join(collections)}")
+        if verbose:
+            print(f"   📚 Will search collections: {', '.join(collections)}")
+
+        # Revision already written by a fused critique, used instead of generating
+        pending_answer = None
 
         # Reasoning loop
         while state.should_continue():
-            print(f"\n🔄 Iteration {state.iteration + 1}/{state.max_iterations}")
+            if verbose:
+                print(f"\n🔄 Iteration {state.iteration + 1}/{state.max_iterations}")
 
             # Execution (Retrieve + Generate)
-            print("   🔍 Retrieval")
-            context_docs = self._retrieve_context(query, collections)
+            if verbose:
+                print("   🔍 Retrieval")
+            if prefetched is not None:
+                context_docs, prefetched = prefetched, None
+            else:
+                context_docs = await asyncio.to_thread(
+                    self._retrieve_context, query, collections, verbose
+                )
             context_texts = [doc.page_content for doc in context_docs]
-
-            print("   ✍️  Generation")
-            answer = self._generate_answer(query, context_texts, state)
-            state.current_answer = answer
-            state.add_step("execute", answer, {"context_count": len(context_docs)})
+            # Joined once per pass and shared by generation and every critic call
+            context_str = join_context(context_texts)
+            critic_context = join_critic_context(context_texts)
+
+            # First pass samples several candidates in one request (self-consistency);
+            # revisions, if still needed, fall back to one answer per call
+            samples = 1
+            if REFLECTION_ENABLED and not state.reflection_feedback:
+                samples = max(1, SELF_CONSISTENCY_SAMPLES)
+
+            if pending_answer is not None:
+                answers, first_token_ms, pending_answer = [pending_answer], None, None
+            else:
+                if verbose:
+                    print("   ✍️  Generation")
+                answers, first_token_ms = await self._generate_answer(
+                    query, context_str, state, n=samples
+                )
 
             # Reflection
             if REFLECTION_ENABLED:
-                print("   🤔 Reflection")
-                reflection = self.critic.reflect(query, answer, context_texts[:3])
+                if verbose:
+                    print("   🤔 Reflection")
+                if len(answers) > 1:
+                    selection = await self.critic.areflect_batch(query, answers, critic_context)
+                    answer = selection.answer
+                    reflection = selection.reflection
+                    if selection.candidate_scores:
+                        reflection.confidence_score = max(
+                            reflection.confidence_score, *selection.candidate_scores
+                        )
+                    if verbose:
+                        print(f"      Picked candidate {selection.best_index + 1}/{len(answers)}")
+                elif state.iteration == 0:
+                    answer = answers[0]
+                    reflection = await self.critic.areflect(query, answer, critic_context)
+                else:
+                    # Revisions: critique and the next revision come from one call
+                    answer = answers[0]
+                    critique = await self.critic.acritique_and_revise(
+                        query, answer, critic_context
+                    )
+                    reflection = critique.reflection
+                    pending_answer = critique.improved_answer or None
+                state.current_answer = answer
+                state.add_step("execute", answer, {
+                    "context_count": len(context_docs),
+                    "samples": len(answers),
+                    "first_token_ms": first_token_ms
+                })
                 state.confidence_score = reflection.confidence_score
 
                 reflection_summary = f"Confidence: {reflection.confidence_score:.2f}"
@@ -85,12 +300,14 @@ class ReasoningAgent:
                     "suggestions": reflection.suggestions
                 })
 
-                print(f"      Confidence: {reflection.confidence_score:.2f}")
-                print(f"      Satisfactory: {reflection.is_satisfactory}")
+                if verbose:
+                    print(f"      Confidence: {reflection.confidence_score:.2f}")
+                    print(f"      Satisfactory: {reflection.is_satisfactory}")
 
                 # Decide whether to revise
                 if self.critic.should_revise(reflection) and state.should_continue():
-                    print("   🔄 Revision needed")
+                    if verbose:
+                        print("   🔄 Revision needed")
                     state.increment_iteration()
 
                     # Generate revision prompt with feedback
@@ -101,15 +318,23 @@ class ReasoningAgent:
                     ])
 
                     state.reflection_feedback.append(feedback)
+                    if verbose and pending_answer is not None:
+                        print("      Revised together with the critique")
 
                     # Continue to next iteration with revision
                     continue
                 else:
-                    print("   ✅ Answer is satisfactory")
+                    if verbose:
+                        print("   ✅ Answer is satisfactory")
                     state.is_complete = True
                     break
             else:
                 # No reflection enabled, accept answer
+                state.current_answer = answers[0]
+                state.add_step("execute", answers[0], {
+                    "context_count": len(context_docs),
+                    "first_token_ms": first_token_ms
+                })
                 state.is_complete = True
                 break
 
@@ -118,55 +343,109 @@ class ReasoningAgent:
     def _retrieve_context(
         self,
         query: str,
-        collections: List[str]
+        collections: List[str],
+        verbose: bool = True
     ) -> List:
         """Retrieve relevant context from specified collections"""
-        all_results = []
+        try:
+            results, errors = _retrieve_cached(query, tuple(collections))
+        except Exception as e:
+            # Embedding failed; nothing is cached so the next pass retries
+            results, errors = (), tuple((collection, str(e)) for collection in collections)
 
-        for collection in collections:
-            try:
-                results = retrieve_relevant_chunks(
-                    query=query,
-                    collection_name=collection,
-                    top_k=3
-                )
-                all_results.extend(results)
-            except Exception as e:
-                # Skip collection if it doesn't exist or has errors
-                print(f"      Warning: Could not retrieve from {collection}: {e}")
-                continue
+        # Collections that don't exist or have errors are skipped
+        if verbose:
+            for collection, error in errors:
+                print(f"      Warning: Could not retrieve from {collection}: {error}")
 
-        return all_results[:TOP_K]
+        return list(results)
 
-    def _generate_answer(
+    async def _generate_answer(
         self,
         query: str,
-        context: List[str],
-        state: AgentState
-    ) -> str:
-        """Generate answer using LLM"""
+        context: str,
+        state: AgentState,
+        n: int = 1
+    ) -> Tuple[List[str], Optional[float]]:
+        """
+        Generate `n` candidate answers using LLM (sampled in a single request)
+        Static instructions live in the system message and only the query,
+        context and feedback vary, so repeated calls share a cacheable prefix
+
+        `context` is the retrieved chunks joined by join_context
+        Returns the answers and the time to first token in milliseconds
+        """
 
         # Use revision prompt if we have feedback
         if state.reflection_feedback:
-            prompt = format_revision_prompt(
+            system_msg = _REVISION_SYSTEM_MSG
+            cache_key = f"{AGENT_MODEL}:revise"
+            prompt = format_revision_request(
                 query=query,
                 previous_answer=state.current_answer or "",
                 feedback=state.reflection_feedback[-1],
                 context=context
             )
         else:
-            prompt = format_answer_prompt(query=query, context=context)
+            system_msg = _ANSWER_SYSTEM_MSG
+            cache_key = f"{AGENT_MODEL}:answer"
+            prompt = format_answer_request(query=query, context=context)
 
-        response = self.client.chat.completions.create(
-            model=AGENT_MODEL,
-            messages=[
-                {"role": "system", "content": AGENT_SYSTEM_PROMPT},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=AGENT_TEMPERATURE
+        # Citations can only be demanded when there is context to cite
+        answers, first_token_ms = await self._stream_answers(
+            system_msg, prompt, cache_key, n, guard=bool(context)
         )
+        if answers is None:
+            answers, first_token_ms = await self._stream_answers(
+                system_msg, prompt + CITATION_REMINDER, cache_key, n, guard=False
+            )
+        return answers, first_token_ms
 
-        return response.choices[0].message.content
+    async def _stream_answers(
+        self,
+        system_msg: dict,
+        prompt: str,
+        cache_key: str,
+        n: int,
+        guard: bool
+    ) -> Tuple[Optional[List[str]], Optional[float]]:
+        """
+        Stream `n` completions, aborting early if none cites a source in time
+        Returns (None, ttft) when the guard aborted the stream
+        """
+        start = time.perf_counter()
+        first_token_ms = None
+        buffers: List[List[str]] = [[] for _ in range(n)]
+        token_counts = [0] * n
+        checked = not guard
+
+        from agent._client import get_async_client
+        stream = await get_async_client().chat.completions.create(
+            model=AGENT_MODEL,
+            messages=[system_msg, {"role": "user", "content": prompt}],
+            temperature=AGENT_TEMPERATURE,
+            n=n,
+            stream=True,
+            # Routes requests with the same prefix to the same cache
+            extra_body={"prompt_cache_key": cache_key}
+        )
+        async for chunk in stream:
+            for choice in chunk.choices:
+                piece = choice.delta.content
+                if not piece:
+                    continue
+                if first_token_ms is None:
+                    first_token_ms = (time.perf_counter() - start) * 1000
+                buffers[choice.index].append(piece)
+                token_counts[choice.index] += 1  # One content delta is ~one token
+
+            if not checked and min(token_counts) >= CITATION_CHECK_TOKENS:
+                checked = True
+                if not any(_CITATION_RE.search("".join(b)) for b in buffers):
+                    await stream.close()
+                    return None, first_token_ms
+
+        return ["".join(b) for b in buffers], first_token_ms
 
 
 # CLI for testing
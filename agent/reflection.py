@@ -2,23 +2,103 @@
 Self-reflection and critique capabilities
 Agent evaluates its own outputs
 """
-from typing import List, Optional
-import json
-from openai import OpenAI
-from dataclasses import dataclass
+from __future__ import annotations
 
-from rag.config import OPENAI_API_KEY, AGENT_MODEL, MIN_CONFIDENCE_SCORE
+from typing import List, Dict, Any, Optional, Union
+from dataclasses import dataclass, field, fields
 
+import orjson
 
-@dataclass
+from agent import reflection_cache
+from agent.prompts import CRITIQUE_AND_REVISE_SYSTEM_PROMPT
+from rag.config import AGENT_MODEL, MIN_CONFIDENCE_SCORE
+
+
+CRITIC_SYSTEM_PROMPT = """You are a critical AI assistant that evaluates answer quality.
+
+Assess the answer based on:
+1. Accuracy - Is the information correct?
+2. Completeness - Does it fully address the query?
+3. Clarity - Is it well-explained?
+4. Relevance - Does it stay on topic?
+5. Evidence - Is it supported by the context?
+
+Respond with a JSON object with these keys:
+- confidence_score: float (0.0-1.0)
+- is_satisfactory: boolean
+- strengths: array of strings
+- weaknesses: array of strings
+- suggestions: array of strings
+- missing_information: array of strings
+
+Be honest and constructive. Identify both strengths and areas for improvement."""
+
+
+SELECTION_SYSTEM_PROMPT = """You are a critical AI assistant that compares candidate answers to the same query.
+
+Assess each candidate on accuracy, completeness, clarity, relevance and evidence,
+then pick the best one. If combining candidates gives a clearly better answer,
+write that merged answer (keep every citation); otherwise leave it empty.
+
+Respond with a JSON object with these keys:
+- candidate_scores: array of floats (0.0-1.0), one per candidate, in order
+- best_index: integer (0-based index of the best candidate)
+- merged_answer: string (empty if the best candidate should be used as is)
+- confidence_score: float (0.0-1.0) for the final answer
+- is_satisfactory: boolean
+- strengths: array of strings
+- weaknesses: array of strings
+- suggestions: array of strings
+- missing_information: array of strings
+
+Be honest and constructive."""
+
+
+# Retrieved chunks, or the critic's context block already built by join_critic_context
+CriticContext = Union[List[str], str]
+
+
+def join_critic_context(retrieved_context: Optional[CriticContext]) -> str:
+    """
+    Context block shown to the critic (the top 3 chunks)
+    Build it once per retrieval and pass the string to every critic call
+    """
+    if not retrieved_context:
+        return ""
+    if isinstance(retrieved_context, str):
+        return retrieved_context
+    return "\n---\n".join(retrieved_context[:3])
+
+
+@dataclass(slots=True)
 class ReflectionResult:
-    """Structured output for self-reflection"""
-    confidence_score: float  # 0.0-1.0
-    is_satisfactory: bool
-    strengths: List[str]
-    weaknesses: List[str]
-    suggestions: List[str]
-    missing_information: List[str]
+    """Structured output for self-reflection (defaults cover keys the model omits)"""
+    confidence_score: float = 0.5  # 0.0-1.0
+    is_satisfactory: bool = False
+    strengths: List[str] = field(default_factory=list)
+    weaknesses: List[str] = field(default_factory=list)
+    suggestions: List[str] = field(default_factory=list)
+    missing_information: List[str] = field(default_factory=list)
+
+
+# JSON keys decoded straight into ReflectionResult; anything else is ignored
+_REFLECTION_KEYS = frozenset(f.name for f in fields(ReflectionResult))
+
+
+@dataclass(slots=True)
+class CandidateSelection:
+    """Structured output for self-consistency selection over sampled answers"""
+    best_index: int
+    answer: str  # Merged answer, or the best candidate verbatim
+    candidate_scores: List[float]
+    reflection: ReflectionResult  # Critique of `answer`
+
+
+@dataclass(slots=True)
+class CritiqueAndRevision:
+    """Structured output for a critique fused with the next revision"""
+    reflection: ReflectionResult  # Critique of the given answer
+    improved_answer: str  # Empty if the answer was satisfactory
 
 
 class SelfReflectionCritic:
@@ -28,66 +108,260 @@ class SelfReflectionCritic:
     """
 
     def __init__(self):
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+        # Imported here, so using the result types doesn't load openai
+        from agent._client import CLIENT
+        self.client = CLIENT
+
+    @property
+    def async_client(self):
+        """Async client of the running event loop"""
+        from agent._client import get_async_client
+        return get_async_client()
 
     def reflect(
         self,
         query: str,
         answer: str,
-        retrieved_context: Optional[List[str]] = None
+        retrieved_context: Optional[CriticContext] = None
     ) -> ReflectionResult:
         """
         Perform self-reflection on generated answer using JSON mode
         """
-        system_prompt = """You are a critical AI assistant that evaluates answer quality.
+        request = self._reflect_request(query, answer, retrieved_context)
+        key = self._cache_key("reflect", request)
+        cached = reflection_cache.get(key) if key else None
+        if cached is not None:
+            return self._parse_reflection(cached)
+        response = self.client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        # Parse before caching so malformed or empty replies are never replayed
+        result = self._parse_reflection(content)
+        if key:
+            reflection_cache.put(key, content)
+        return result
+
+    async def areflect(
+        self,
+        query: str,
+        answer: str,
+        retrieved_context: Optional[CriticContext] = None
+    ) -> ReflectionResult:
+        """
+        Async variant of reflect, for overlapping with other I/O
+        """
+        request = self._reflect_request(query, answer, retrieved_context)
+        key = self._cache_key("reflect", request)
+        cached = reflection_cache.get(key) if key else None
+        if cached is not None:
+            return self._parse_reflection(cached)
+        response = await self.async_client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        result = self._parse_reflection(content)
+        if key:
+            reflection_cache.put(key, content)
+        return result
+
+    @staticmethod
+    def _cache_key(kind: str, request: Dict[str, Any]) -> Optional[str]:
+        """Cache key of a critic call (None when caching is disabled)"""
+        if not reflection_cache.enabled():
+            return None
+        return reflection_cache.make_key(kind, request)
+
+    def _reflect_request(
+        self,
+        query: str,
+        answer: str,
+        retrieved_context: Optional[CriticContext] = None
+    ) -> Dict[str, Any]:
+        """Chat completion arguments shared by reflect and areflect"""
+        context_str = ""
+        critic_context = join_critic_context(retrieved_context)
+        if critic_context:
+            context_str = "\n\nRetrieved Context:\n" + critic_context
 
-Assess the answer based on:
-1. Accuracy - Is the information correct?
-2. Completeness - Does it fully address the query?
-3. Clarity - Is it well-explained?
-4. Relevance - Does it stay on topic?
-5. Evidence - Is it supported by the context?
+        user_prompt = f"""Query: {query}
 
-Respond with a JSON object with these keys:
-- confidence_score: float (0.0-1.0)
-- is_satisfactory: boolean
-- strengths: array of strings
-- weaknesses: array of strings
-- suggestions: array of strings
-- missing_information: array of strings
+Answer: {answer}
+{context_str}
 
-Be honest and constructive. Identify both strengths and areas for improvement."""
+Evaluate this answer critically."""
+
+        return {
+            "model": AGENT_MODEL,
+            "messages": [
+                {"role": "system", "content": CRITIC_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0,  # Deterministic critique, so results can be cached
+            "response_format": {"type": "json_object"}
+        }
+
+    def _parse_reflection(self, content: str) -> ReflectionResult:
+        """Parse JSON response into dataclass"""
+        return self._reflection_from_dict(orjson.loads(content))
+
+    @staticmethod
+    def _reflection_from_dict(result: Dict[str, Any]) -> ReflectionResult:
+        """Build a ReflectionResult from decoded JSON (other keys are ignored)"""
+        reflection = ReflectionResult(
+            **{key: value for key, value in result.items() if key in _REFLECTION_KEYS}
+        )
+        # Models occasionally return numbers as strings or 0/1 for booleans
+        reflection.confidence_score = float(reflection.confidence_score)
+        reflection.is_satisfactory = bool(reflection.is_satisfactory)
+        return reflection
 
+    def reflect_batch(
+        self,
+        query: str,
+        answers: List[str],
+        retrieved_context: Optional[CriticContext] = None
+    ) -> CandidateSelection:
+        """
+        Critique several sampled answers in one call and pick (or merge) the best
+        """
+        request = self._select_request(query, answers, retrieved_context)
+        key = self._cache_key("select", request)
+        cached = reflection_cache.get(key) if key else None
+        if cached is not None:
+            return self._parse_selection(cached, answers)
+        response = self.client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        result = self._parse_selection(content, answers)
+        if key:
+            reflection_cache.put(key, content)
+        return result
+
+    async def areflect_batch(
+        self,
+        query: str,
+        answers: List[str],
+        retrieved_context: Optional[CriticContext] = None
+    ) -> CandidateSelection:
+        """
+        Async variant of reflect_batch
+        """
+        request = self._select_request(query, answers, retrieved_context)
+        key = self._cache_key("select", request)
+        cached = reflection_cache.get(key) if key else None
+        if cached is not None:
+            return self._parse_selection(cached, answers)
+        response = await self.async_client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        result = self._parse_selection(content, answers)
+        if key:
+            reflection_cache.put(key, content)
+        return result
+
+    def _select_request(
+        self,
+        query: str,
+        answers: List[str],
+        retrieved_context: Optional[CriticContext] = None
+    ) -> Dict[str, Any]:
+        """Chat completion arguments shared by reflect_batch and areflect_batch"""
         context_str = ""
-        if retrieved_context:
-            context_str = "\n\nRetrieved Context:\n" + "\n---\n".join(retrieved_context[:3])
+        critic_context = join_critic_context(retrieved_context)
+        if critic_context:
+            context_str = "\n\nRetrieved Context:\n" + critic_context
 
+        candidates = "\n\n".join(
+            f"Candidate {i}:\n{answer}" for i, answer in enumerate(answers)
+        )
         user_prompt = f"""Query: {query}
 
-Answer: {answer}
+{candidates}
 {context_str}
 
-Evaluate this answer critically."""
+Compare the candidates critically."""
 
-        response = self.client.chat.completions.create(
-            model=AGENT_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
+        return {
+            "model": AGENT_MODEL,
+            "messages": [
+                {"role": "system", "content": SELECTION_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
-            temperature=0.3,  # Lower temperature for more consistent critique
-            response_format={"type": "json_object"}
+            "temperature": 0,  # Deterministic critique, so results can be cached
+            "response_format": {"type": "json_object"}
+        }
+
+    def _parse_selection(self, content: str, answers: List[str]) -> CandidateSelection:
+        """Parse JSON selection; out-of-range indices fall back to the first candidate"""
+        result = orjson.loads(content)
+
+        best_index = result.get("best_index", 0)
+        if not isinstance(best_index, int) or not 0 <= best_index < len(answers):
+            best_index = 0
+
+        return CandidateSelection(
+            best_index=best_index,
+            answer=result.get("merged_answer") or answers[best_index],
+            candidate_scores=[float(s) for s in result.get("candidate_scores", [])],
+            reflection=self._reflection_from_dict(result)
         )
 
-        # Parse JSON response into dataclass
-        result = json.loads(response.choices[0].message.content)
-        return ReflectionResult(
-            confidence_score=float(result.get("confidence_score", 0.5)),
-            is_satisfactory=bool(result.get("is_satisfactory", False)),
-            strengths=result.get("strengths", []),
-            weaknesses=result.get("weaknesses", []),
-            suggestions=result.get("suggestions", []),
-            missing_information=result.get("missing_information", [])
+    def critique_and_revise(
+        self,
+        query: str,
+        answer: str,
+        retrieved_context: Optional[CriticContext] = None
+    ) -> CritiqueAndRevision:
+        """
+        Critique an answer and, if it falls short, revise it in the same call
+        """
+        request = self._critique_request(query, answer, retrieved_context)
+        key = self._cache_key("critique_revise", request)
+        cached = reflection_cache.get(key) if key else None
+        if cached is not None:
+            return self._parse_critique(cached)
+        response = self.client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        result = self._parse_critique(content)
+        if key:
+            reflection_cache.put(key, content)
+        return result
+
+    async def acritique_and_revise(
+        self,
+        query: str,
+        answer: str,
+        retrieved_context: Optional[CriticContext] = None
+    ) -> CritiqueAndRevision:
+        """
+        Async variant of critique_and_revise
+        """
+        request = self._critique_request(query, answer, retrieved_context)
+        key = self._cache_key("critique_revise", request)
+        cached = reflection_cache.get(key) if key else None
+        if cached is not None:
+            return self._parse_critique(cached)
+        response = await self.async_client.chat.completions.create(**request)
+        content = response.choices[0].message.content
+        result = self._parse_critique(content)
+        if key:
+            reflection_cache.put(key, content)
+        return result
+
+    def _critique_request(
+        self,
+        query: str,
+        answer: str,
+        retrieved_context: Optional[CriticContext] = None
+    ) -> Dict[str, Any]:
+        """Chat completion arguments shared by critique_and_revise and acritique_and_revise"""
+        request = self._reflect_request(query, answer, retrieved_context)
+        request["messages"][0] = {"role": "system", "content": CRITIQUE_AND_REVISE_SYSTEM_PROMPT}
+        return request
+
+    def _parse_critique(self, content: str) -> CritiqueAndRevision:
+        """Parse JSON critique; the improved answer is dropped for satisfactory answers"""
+        result = orjson.loads(content)
+        reflection = self._reflection_from_dict(result)
+        improved_answer = result.get("improved_answer") or ""
+        return CritiqueAndRevision(
+            reflection=reflection,
+            improved_answer="" if reflection.is_satisfactory else improved_answer
         )
 
     def should_revise(self, reflection: ReflectionResult) -> bool:
@@ -0,0 +1,44 @@
+"""
+Disk-backed cache of critic results
+Re-running evaluations asks the critic about the same answers again; with a
+deterministic critic these calls can be answered from disk instead
+"""
+import hashlib
+from typing import Any, Dict, Optional
+
+import orjson
+
+from agent.response_cache import ResponseCache
+from rag.config import REFLECTION_CACHE_DIR, REFLECTION_CACHE_TTL_DAYS
+
+_cache = ResponseCache(
+    REFLECTION_CACHE_DIR / "reflections.db",
+    table="reflections",
+    ttl_days=REFLECTION_CACHE_TTL_DAYS
+)
+
+
+def enabled() -> bool:
+    """Whether the cache is switched on (REFLECTION_CACHE_TTL_DAYS > 0)"""
+    return REFLECTION_CACHE_TTL_DAYS > 0
+
+
+def make_key(kind: str, request: Dict[str, Any]) -> str:
+    """
+    Stable hash of everything that determines a critic response
+    The whole chat completion request is hashed (model, prompts, temperature,
+    response format), so editing a critic prompt retires its cached results;
+    `kind` separates single reflections from candidate selections
+    """
+    payload = kind.encode("utf-8") + orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def get(key: str) -> Optional[str]:
+    """Return the cached raw critic response, or None if missing or expired"""
+    return _cache.get(key)
+
+
+def put(key: str, value: str) -> None:
+    """Store a raw critic response"""
+    _cache.put(key, value)
@@ -0,0 +1,78 @@
+"""
+Disk-backed cache of raw LLM responses
+A small SQLite table with expiry and least-recently-used eviction, shared by
+the critic and the evaluation judge (deterministic calls whose inputs repeat
+across runs)
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# Least recently used entries beyond this are evicted
+MAX_ENTRIES = 10_000
+
+
+class ResponseCache:
+    """
+    Key -> raw response text, persisted in an SQLite file
+    The file is opened on first use; all access is serialized by a lock
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: str = "responses",
+        ttl_days: float = 7,
+        max_entries: int = MAX_ENTRIES
+    ):
+        self.path = Path(path)
+        self.table = table
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create the cache connection (lazy initialization)"""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            row = conn.execute(
+                f"SELECT value FROM {self.table} WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+        return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        """Store a response and evict expired / least recently used entries"""
+        now = time.time()
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now)
+            )
+            conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (now,))
+            conn.execute(
+                f"DELETE FROM {self.table} WHERE key NOT IN ("
+                f"SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+            conn.commit()
@@ -10,8 +10,13 @@ It does NOT post to LinkedIn or any social media platform.
 All content must be manually copied and posted by the user.
 """
 
+from agent.logger import write_bytes
 from agent.prompts import format_linkedin_post
 
+# The post without a custom closing never changes, so it is built once
+_DEFAULT_POST = format_linkedin_post("")
+_DEFAULT_POST_BYTES = _DEFAULT_POST.encode('utf-8')
+
 
 class SocialPostGenerator:
     """
@@ -52,6 +57,8 @@ class SocialPostGenerator:
             >>> post = generator.generate_post()
             >>> print(post)
         """
+        if not custom_closing:
+            return _DEFAULT_POST
         return format_linkedin_post(custom_closing=custom_closing)
 
     def save_post(self, post_text: str, filename: str) -> None:
@@ -70,9 +77,13 @@ class SocialPostGenerator:
             >>> post = generator.generate_post()
             >>> generator.save_post(post, "linkedin_post.txt")
         """
+        if post_text is _DEFAULT_POST:
+            data = _DEFAULT_POST_BYTES
+        else:
+            data = post_text.encode('utf-8')
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(post_text)
+            # A single small write: skip the text/buffered IO layers entirely
+            write_bytes(filename, data)
         except Exception as e:
             raise IOError(f"Failed to save post to {filename}: {e}")
 
@@ -7,16 +7,58 @@ This module orchestrates agent evaluation:
 - Generate detailed per-query reports
 - Create aggregate summary statistics
 - Save results to evaluation/reports/
+- Optionally generate answers offline through the OpenAI Batch API
 """
 
+import asyncio
 import json
+import logging
+import os
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
+import orjson
+from openai import OpenAI
+from pydantic import ValidationError
+from tqdm import tqdm
+
+from agent._client import CLIENT
 from agent.orchestrator import AgentOrchestrator
-from evaluation.metrics import AgentEvaluator, EvaluationReport
-from rag.config import EVAL_DATASET
+from agent.memory import AgentState
+from agent.reasoning import ReasoningPlanner
+from agent.reflection import SelfReflectionCritic
+from agent.prompts import (
+    ANSWER_SYSTEM_PROMPT,
+    REVISION_SYSTEM_PROMPT,
+    join_context,
+    format_answer_request,
+    format_revision_request
+)
+from evaluation.metrics import AgentEvaluator, AnswerEvaluation, EvaluationReport
+from evaluation.rate_limit import AGENT_RUN_REQUESTS, AsyncRateLimiter, estimate_agent_run_tokens
+from rag.retriever import retrieve_relevant_chunks
+from rag.config import (
+    AGENT_MODEL,
+    AGENT_TEMPERATURE,
+    MAX_REASONING_STEPS,
+    TOP_K,
+    EVAL_DATASET,
+    EVAL_CONCURRENCY,
+    EVAL_JUDGE_BATCH_SIZE,
+    EVAL_MAX_REQUESTS_PER_MINUTE,
+    EVAL_MAX_TOKENS_PER_MINUTE
+)
+
+# Batch jobs in these states will not produce (more) output
+BATCH_TERMINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+# First batch status check; the interval then doubles up to poll_interval
+BATCH_INITIAL_POLL_SECONDS = 5.0
+
+# Per-query detail; the console shows a progress bar instead
+logger = logging.getLogger("eval")
 
 
 class EvaluationRunner:
@@ -24,107 +66,320 @@ class EvaluationRunner:
     Run evaluation on test query dataset
     """
 
-    def __init__(self, test_queries_path: str = None):
+    def __init__(self, test_queries_path: str = None, use_cache: bool = True):
         """
         Initialize evaluation runner
 
         Args:
             test_queries_path: Path to test queries JSON file
+            use_cache: Reuse LLM-as-judge results for answers judged before
         """
         self.test_queries_path = test_queries_path or str(EVAL_DATASET)
-        self.orchestrator = AgentOrchestrator()
-        self.evaluator = AgentEvaluator()
+        # Agent and judge share one connection pool, so TLS sessions carry over
+        self.orchestrator = AgentOrchestrator(client=CLIENT)
+        self.evaluator = AgentEvaluator(use_cache=use_cache, client=CLIENT)
+        # Kept across runs so the loop's async client keeps its connections open
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # (file mtime, parsed queries): repeated runs skip re-reading the dataset
+        self._test_queries: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        # Report directories already created by save_results
+        self._report_dirs: set = set()
 
     def load_test_queries(self) -> List[Dict[str, Any]]:
         """
-        Load test queries from JSON
+        Load test queries from JSON (cached until the file changes)
 
         Returns:
             List of test query dictionaries
         """
-        with open(self.test_queries_path, 'r') as f:
-            data = json.load(f)
-        return data["test_queries"]
-
-    def run_evaluation(self, verbose: bool = False) -> Dict[str, Any]:
+        mtime = os.stat(self.test_queries_path).st_mtime
+        if self._test_queries is not None and self._test_queries[0] == mtime:
+            return list(self._test_queries[1])
+
+        # Raw bytes straight into orjson: no text decoding layer, C parser
+        data = orjson.loads(Path(self.test_queries_path).read_bytes())
+        test_queries = data["test_queries"]
+        # Topic lists become tuples once here, so topic coverage can use them
+        # as its lowercase-cache key without copying per query
+        for test_query in test_queries:
+            test_query["expected_topics"] = tuple(test_query.get("expected_topics", ()))
+        self._test_queries = (mtime, test_queries)
+        return list(test_queries)
+
+    def run_evaluation(
+        self,
+        verbose: bool = False,
+        concurrency: int = EVAL_CONCURRENCY,
+        judge_batch_size: int = EVAL_JUDGE_BATCH_SIZE
+    ) -> Dict[str, Any]:
         """
         Run evaluation on all test queries
 
+        Queries are evaluated concurrently (the work is almost entirely
+        waiting on the OpenAI API); judge calls share a client-side rate limiter.
+
         Args:
             verbose: Whether to show verbose output during execution
+            concurrency: Maximum number of queries in flight at once
+            judge_batch_size: Answers scored per LLM-as-judge call
 
         Returns:
             Dictionary with evaluation results and summary
         """
+        started = datetime.now()
         test_queries = self.load_test_queries()
-        results = []
 
         print(f"🧪 Running evaluation on {len(test_queries)} queries...")
         print("=" * 60)
 
-        for i, test_query in enumerate(test_queries, 1):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        results = self._loop.run_until_complete(
+            self._arun_evaluation(test_queries, max(1, concurrency), max(1, judge_batch_size))
+        )
+
+        return self._compile_results(test_queries, results, started)
+
+    async def _arun_evaluation(
+        self,
+        test_queries: List[Dict[str, Any]],
+        concurrency: int,
+        judge_batch_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate all queries, at most `concurrency` agent runs at a time
+        Answers are judged `judge_batch_size` per call; results keep input order
+        """
+        # Cold-start costs (store open, first embedding, TLS) off the measured runs
+        await asyncio.to_thread(self.orchestrator.prepare)
+
+        semaphore = asyncio.Semaphore(concurrency)
+        rate_limiter = AsyncRateLimiter(EVAL_MAX_REQUESTS_PER_MINUTE, EVAL_MAX_TOKENS_PER_MINUTE)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(test_queries)
+        states: List[Optional[AgentState]] = [None] * len(test_queries)
+        ready: List[int] = []  # Finished runs waiting for a judge call
+        judge_tasks: List[asyncio.Task] = []
+
+        async def _judge(indices: List[int]) -> None:
+            items = [
+                {
+                    "id": test_queries[j]["id"],
+                    "query": test_queries[j]["query"],
+                    "answer": states[j].current_answer,
+                    "expected_topics": test_queries[j].get("expected_topics", [])
+                }
+                for j in indices
+            ]
+            if judge_batch_size <= 1:
+                item = items[0]
+                evaluations = {item["id"]: await self.evaluator.aevaluate_answer(
+                    item["query"], item["answer"], item["expected_topics"],
+                    rate_limiter=rate_limiter
+                )}
+            else:
+                evaluations = await self.evaluator.aevaluate_answers_batched(
+                    items, k=len(items), rate_limiter=rate_limiter
+                )
+            for j in indices:
+                self._add_answer_eval(
+                    results[j], states[j], evaluations[test_queries[j]["id"]], progress
+                )
+
+        def _flush_ready() -> None:
+            judge_tasks.append(asyncio.create_task(_judge(ready[:])))
+            ready.clear()
+
+        async def _eval_one(index: int, test_query: Dict[str, Any]) -> None:
             query = test_query["query"]
-            expected_topics = test_query.get("expected_topics", [])
-            query_id = test_query["id"]
+            async with semaphore:
+                logger.info("[%d/%d] %s: %s...", index + 1, len(test_queries), test_query["id"], query[:60])
+
+                # Agent calls draw on the same budget as the judge, admitted per run
+                await rate_limiter.acquire(
+                    estimate_agent_run_tokens(query, AGENT_MODEL), requests=AGENT_RUN_REQUESTS
+                )
+
+                # The orchestrator is synchronous; run it on a worker thread
+                states[index] = await asyncio.to_thread(self.orchestrator.run, query, verbose=False)
+
+            # Judged outside the semaphore, so later agent runs go on meanwhile;
+            # a judge call starts as soon as enough answers are ready
+            results[index] = self._state_result(test_query, states[index])
+            ready.append(index)
+            if len(ready) >= judge_batch_size:
+                _flush_ready()
+
+        with tqdm(total=len(test_queries), desc="Eval", unit="query") as progress:
+            await asyncio.gather(*(_eval_one(i, q) for i, q in enumerate(test_queries)))
+            if ready:
+                _flush_ready()
+            await asyncio.gather(*judge_tasks)
+        return results
+
+    def run_batch_evaluation(self, poll_interval: float = 60.0) -> Dict[str, Any]:
+        """
+        Run evaluation with answers generated through the OpenAI Batch API
 
-            print(f"\n[{i}/{len(test_queries)}] {query_id}: {query[:60]}...")
+        Half the cost of run_evaluation, but each batch round may take up to
+        24h. The LLM-as-judge scoring runs as a final batch round too. Tool
+        calling is not exercised in this mode.
 
-            # Run agent orchestrator
-            state = self.orchestrator.run(query, verbose=False)
+        Args:
+            poll_interval: Maximum seconds between batch status checks
 
-            # Evaluate answer quality (LLM-as-judge)
-            answer_eval = self.evaluator.evaluate_answer(
-                query=query,
-                answer=state.current_answer,
-                expected_topics=expected_topics
-            )
+        Returns:
+            Dictionary with evaluation results and summary
+        """
+        started = datetime.now()
+        test_queries = self.load_test_queries()
 
-            # Evaluate tool usage
-            tool_eval = self.evaluator.evaluate_tool_usage(state)
+        print(f"🧪 Running batch evaluation on {len(test_queries)} queries...")
+        print("=" * 60)
 
-            # Evaluate reasoning efficiency
-            reasoning_eval = self.evaluator.evaluate_reasoning_efficiency(state)
+        batch_evaluator = BatchEvaluator()
+        states = batch_evaluator.run(test_queries, poll_interval=poll_interval)
+        answer_evals = batch_evaluator.judge(
+            test_queries, states, self.evaluator, poll_interval=poll_interval
+        )
 
-            # Calculate topic coverage
-            topic_coverage = self.evaluator.calculate_topic_coverage(
-                state.current_answer,
-                expected_topics
-            )
+        results = []
+        with tqdm(total=len(test_queries), desc="Eval", unit="query") as progress:
+            for i, test_query in enumerate(test_queries, 1):
+                logger.info("[%d/%d] %s: %s...", i, len(test_queries), test_query["id"], test_query["query"][:60])
+                state = states[test_query["id"]]
+                answer_eval = answer_evals.get(test_query["id"])
+                if answer_eval is None:
+                    # Judge request failed in the batch: score it directly
+                    results.append(self._evaluate_state(test_query, state, progress))
+                else:
+                    result = self._state_result(test_query, state)
+                    results.append(self._add_answer_eval(result, state, answer_eval, progress))
+
+        return self._compile_results(test_queries, results, started)
+
+    def _evaluate_state(
+        self,
+        test_query: Dict[str, Any],
+        state: AgentState,
+        progress: Optional[tqdm] = None
+    ) -> Dict[str, Any]:
+        """
+        Score one finished agent run
 
-            # Compile result
-            result = {
-                "query_id": query_id,
-                "query": query,
-                "category": test_query.get("category", "unknown"),
-                "difficulty": test_query.get("difficulty", "unknown"),
-                "requires_tools": test_query.get("requires_tools", False),
-                "answer": state.current_answer,
-                "answer_eval": {
-                    "relevance_score": answer_eval.relevance_score,
-                    "accuracy_score": answer_eval.accuracy_score,
-                    "completeness_score": answer_eval.completeness_score,
-                    "coherence_score": answer_eval.coherence_score,
-                    "overall_score": answer_eval.overall_score,
-                    "reasoning": answer_eval.reasoning
-                },
-                "topic_coverage": topic_coverage,
-                "tools": tool_eval,
-                "reasoning": reasoning_eval
-            }
+        Args:
+            test_query: Test query dictionary from the dataset
+            state: Final agent state for that query
+            progress: Optional progress bar showing the latest scores
+
+        Returns:
+            Per-query result dictionary
+        """
+        # Evaluate answer quality (LLM-as-judge)
+        answer_eval = self.evaluator.evaluate_answer(
+            query=test_query["query"],
+            answer=state.current_answer,
+            expected_topics=test_query.get("expected_topics", [])
+        )
+        result = self._state_result(test_query, state)
+        return self._add_answer_eval(result, state, answer_eval, progress)
+
+    def _state_result(self, test_query: Dict[str, Any], state: AgentState) -> Dict[str, Any]:
+        """
+        Per-query result with every metric that needs no LLM call
+
+        Args:
+            test_query: Test query dictionary from the dataset
+            state: Final agent state for that query
+
+        Returns:
+            Per-query result dictionary, without "answer_eval"
+        """
+        query = test_query["query"]
+        expected_topics = test_query.get("expected_topics", [])
+
+        # Evaluate tool usage
+        tool_eval = self.evaluator.evaluate_tool_usage(state)
+
+        # Evaluate reasoning efficiency
+        reasoning_eval = self.evaluator.evaluate_reasoning_efficiency(state)
+
+        # Calculate topic coverage
+        topic_coverage = self.evaluator.calculate_topic_coverage(
+            state.current_answer,
+            expected_topics
+        )
+
+        # Compile result ("answer_eval" is filled in by _add_answer_eval)
+        return {
+            "query_id": test_query["id"],
+            "query": query,
+            "category": test_query.get("category", "unknown"),
+            "difficulty": test_query.get("difficulty", "unknown"),
+            "requires_tools": test_query.get("requires_tools", False),
+            "answer": state.current_answer,
+            "answer_eval": None,
+            "topic_coverage": topic_coverage,
+            "tools": tool_eval,
+            "reasoning": reasoning_eval
+        }
+
+    def _add_answer_eval(
+        self,
+        result: Dict[str, Any],
+        state: AgentState,
+        answer_eval: AnswerEvaluation,
+        progress: Optional[tqdm] = None
+    ) -> Dict[str, Any]:
+        """
+        Attach the judge's verdict to a per-query result and report its summary
+
+        Args:
+            result: Result from _state_result
+            state: Final agent state for that query
+            answer_eval: LLM-as-judge evaluation of the final answer
+            progress: Optional progress bar, advanced and given the latest scores
 
-            results.append(result)
+        Returns:
+            The completed result dictionary
+        """
+        result["answer_eval"] = {
+            "relevance_score": answer_eval.relevance_score,
+            "accuracy_score": answer_eval.accuracy_score,
+            "completeness_score": answer_eval.completeness_score,
+            "coherence_score": answer_eval.coherence_score,
+            "overall_score": answer_eval.overall_score,
+            "reasoning": answer_eval.reasoning
+        }
+
+        # Log summary for this query (tagged: concurrent runs finish out of order)
+        logger.info(
+            "[%s] Overall: %.2f | Confidence: %.2f | Iterations: %d | Topics: %.2f",
+            result["query_id"], answer_eval.overall_score, state.confidence_score,
+            state.iteration, result["topic_coverage"]
+        )
+        if progress is not None:
+            progress.set_postfix(
+                overall=f"{answer_eval.overall_score:.2f}",
+                conf=f"{state.confidence_score:.2f}",
+                refresh=False
+            )
+            progress.update(1)
 
-            # Print summary for this query
-            print(f"  Overall: {answer_eval.overall_score:.2f} | "
-                  f"Confidence: {state.confidence_score:.2f} | "
-                  f"Iterations: {state.iteration} | "
-                  f"Topics: {topic_coverage:.2f}")
+        return result
 
+    def _compile_results(
+        self,
+        test_queries: List[Dict[str, Any]],
+        results: List[Dict[str, Any]],
+        started: datetime
+    ) -> Dict[str, Any]:
+        """Attach summary statistics to per-query results, stamped with the run's start"""
         # Generate summary statistics
         summary = EvaluationReport.generate_summary(results)
 
         evaluation_results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": started.isoformat(),
             "total_queries": len(test_queries),
             "summary": summary,
             "detailed_results": results
@@ -135,7 +390,8 @@ class EvaluationRunner:
     def save_results(
         self,
         results: Dict[str, Any],
-        output_path: str = None
+        output_path: str = None,
+        human: bool = True
     ) -> str:
         """
         Save evaluation results to file
@@ -143,25 +399,322 @@ class EvaluationRunner:
         Args:
             results: Evaluation results dictionary
             output_path: Optional custom output path
+            human: Indent the JSON for reading; False writes it compact
 
         Returns:
             Path where results were saved
         """
         if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = f"evaluation/reports/eval_{timestamp}.json"
+            # Named after the run's own timestamp, so file and report agree
+            started = (
+                datetime.fromisoformat(results["timestamp"])
+                if "timestamp" in results else datetime.now()
+            )
+            output_path = f"evaluation/reports/eval_{started.strftime('%Y%m%d_%H%M%S')}.json"
 
-        # Ensure directory exists
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        # Ensure directory exists (once per directory)
+        parent = Path(output_path).parent
+        if parent not in self._report_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._report_dirs.add(parent)
 
-        # Save JSON with indentation
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        # Serialize once with orjson and write through a 64 KB buffer
+        option = orjson.OPT_INDENT_2 if human else 0
+        with open(output_path, 'wb', buffering=1 << 16) as f:
+            f.write(orjson.dumps(results, option=option | orjson.OPT_NON_STR_KEYS))
 
         print(f"\n✓ Results saved to {output_path}")
         return output_path
 
 
+class BatchEvaluator:
+    """
+    Generate agent answers for a whole dataset through the OpenAI Batch API
+
+    Reflection and revision are sequential per query, so the workflow runs in
+    rounds, each one batch over every query still in play:
+      1. plan + first-pass answer (independent, submitted together)
+      2. critique of every answer
+      3. revision of answers the critic rejects
+      4. critique of the revised answers
+    Retrieval runs locally while building round 1.
+    """
+
+    def __init__(self, client: Optional[OpenAI] = None):
+        self.client = client or CLIENT
+        self.planner = ReasoningPlanner()
+        self.critic = SelfReflectionCritic()
+
+    def submit(self, requests: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Upload chat completion requests and start a batch job
+
+        Args:
+            requests: Mapping of custom_id ("<query_id>:<phase>") to request body
+
+        Returns:
+            Batch job ID
+        """
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            })
+            for custom_id, body in requests.items()
+        ]
+        batch_file = self.client.files.create(
+            file=("requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+
+    def poll_and_collect(self, batch_id: str, poll_interval: float = 60.0) -> Dict[str, str]:
+        """
+        Wait for a batch job and collect the completion text of each request
+
+        Args:
+            batch_id: Batch job ID returned by submit
+            poll_interval: Maximum seconds between status checks (checks back
+                off exponentially from BATCH_INITIAL_POLL_SECONDS)
+
+        Returns:
+            Mapping of custom_id to message content (failed requests are omitted)
+
+        Raises:
+            RuntimeError: If the batch ends without an output file
+        """
+        delay = min(BATCH_INITIAL_POLL_SECONDS, poll_interval)
+        batch = self.client.batches.retrieve(batch_id)
+        while batch.status not in BATCH_TERMINAL_STATES:
+            time.sleep(delay)
+            delay = min(delay * 2, poll_interval)
+            batch = self.client.batches.retrieve(batch_id)
+
+        if not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch_id} ended as '{batch.status}' with no output")
+
+        outputs = {}
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                continue
+            outputs[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return outputs
+
+    def judge(
+        self,
+        test_queries: List[Dict[str, Any]],
+        states: Dict[str, AgentState],
+        evaluator: AgentEvaluator,
+        poll_interval: float = 60.0
+    ) -> Dict[str, AnswerEvaluation]:
+        """
+        Score every final answer with the LLM-as-judge in one batch
+
+        Args:
+            test_queries: Test query dictionaries (need "id", "query")
+            states: Final agent state per query ID
+            evaluator: Evaluator whose judge prompt is used
+            poll_interval: Maximum seconds between batch status checks
+
+        Returns:
+            Mapping of query ID to answer evaluation (failed requests are omitted)
+        """
+        answer_evals = {}
+        requests = {}
+        keys = {}
+        for test_query in test_queries:
+            qid = test_query["id"]
+            judge_args = {
+                "query": test_query["query"],
+                "answer": states[qid].current_answer,
+                "expected_topics": test_query.get("expected_topics", [])
+            }
+            keys[qid] = evaluator.judge_cache_key(**judge_args)
+            cached = evaluator.cached_judgement(keys[qid])
+            if cached is not None:
+                answer_evals[qid] = evaluator._parse_answer_eval(cached)
+            else:
+                requests[f"{qid}:judge"] = evaluator._answer_eval_request(**judge_args)
+
+        if requests:
+            outputs = self.poll_and_collect(self.submit(requests), poll_interval)
+            for custom_id, content in outputs.items():
+                qid = custom_id.rsplit(":", 1)[0]
+                try:
+                    answer_evals[qid] = evaluator._parse_answer_eval(content)
+                except ValidationError as e:
+                    # Left out, so the caller judges this answer directly
+                    logger.warning("Unusable batch verdict for %s: %s", qid, e)
+                    continue
+                evaluator.store_judgement(keys[qid], content)
+        return answer_evals
+
+    def run(
+        self,
+        test_queries: List[Dict[str, Any]],
+        poll_interval: float = 60.0
+    ) -> Dict[str, AgentState]:
+        """
+        Run all batch rounds and rebuild an AgentState per query
+
+        Args:
+            test_queries: Test query dictionaries (need "id" and "query")
+            poll_interval: Seconds between batch status checks
+
+        Returns:
+            Mapping of query ID to final agent state
+        """
+        states: Dict[str, AgentState] = {}
+        contexts: Dict[str, List[str]] = {}
+        retrievals: Dict[str, Dict[str, Any]] = {}
+
+        # Round 1: plan + answer
+        requests = {}
+        for test_query in test_queries:
+            qid, query = test_query["id"], test_query["query"]
+            state = AgentState(query=query, max_iterations=MAX_REASONING_STEPS)
+            state.increment_attempt()
+            states[qid] = state
+            contexts[qid], retrievals[qid] = self._retrieve_context(query)
+
+            requests[f"{qid}:plan"] = self.planner._plan_request(query)
+            requests[f"{qid}:generate"] = self._chat_body(
+                ANSWER_SYSTEM_PROMPT, format_answer_request(query, join_context(contexts[qid]))
+            )
+        outputs = self.poll_and_collect(self.submit(requests), poll_interval)
+
+        for qid, state in states.items():
+            # Same step order as the live workflow: plan, retrieve, generate
+            if f"{qid}:plan" in outputs:
+                plan = self.planner._parse_plan(outputs[f"{qid}:plan"])
+                state.add_step("plan", f"Main goal: {plan.main_goal}", {
+                    "sub_tasks": plan.sub_tasks,
+                    "complexity": plan.complexity,
+                    "required_information": plan.required_information
+                })
+            state.add_step(
+                "retrieve", f"Retrieved {retrievals[qid]['doc_count']} documents", retrievals[qid]
+            )
+            self._record_answer(state, outputs.get(f"{qid}:generate"), len(contexts[qid]))
+
+        # Round 2: critique first-pass answers
+        to_revise = self._reflect_round(states, contexts, poll_interval)
+
+        # Round 3: revise rejected answers, then critique again (round 4)
+        revisable = {qid: states[qid] for qid in to_revise if states[qid].should_continue()}
+        if revisable:
+            requests = {}
+            for qid, state in revisable.items():
+                state.increment_attempt()
+                requests[f"{qid}:revise"] = self._chat_body(
+                    REVISION_SYSTEM_PROMPT,
+                    format_revision_request(
+                        query=state.query,
+                        previous_answer=state.current_answer or "",
+                        feedback=state.reflection_feedback[-1],
+                        context=join_context(contexts[qid])
+                    )
+                )
+            outputs = self.poll_and_collect(self.submit(requests), poll_interval)
+            for qid, state in revisable.items():
+                self._record_answer(state, outputs.get(f"{qid}:revise"), len(contexts[qid]))
+            self._reflect_round(revisable, contexts, poll_interval)
+
+        for state in states.values():
+            state.is_complete = True
+        return states
+
+    def _reflect_round(
+        self,
+        states: Dict[str, AgentState],
+        contexts: Dict[str, List[str]],
+        poll_interval: float
+    ) -> List[str]:
+        """Critique every current answer in one batch; returns IDs needing revision"""
+        requests = {
+            f"{qid}:reflect": self.critic._reflect_request(
+                state.query, state.current_answer or "", contexts[qid][:3]
+            )
+            for qid, state in states.items()
+            if state.current_answer
+        }
+        if not requests:
+            return []
+        outputs = self.poll_and_collect(self.submit(requests), poll_interval)
+
+        to_revise = []
+        for qid, state in states.items():
+            content = outputs.get(f"{qid}:reflect")
+            if content is None:
+                continue
+            reflection = self.critic._parse_reflection(content)
+            state.confidence_score = reflection.confidence_score
+            state.add_step("reflect", f"Confidence: {reflection.confidence_score:.2f}", {
+                "satisfactory": reflection.is_satisfactory,
+                "strengths": reflection.strengths,
+                "weaknesses": reflection.weaknesses,
+                "suggestions": reflection.suggestions
+            })
+            if self.critic.should_revise(reflection):
+                state.reflection_feedback.append("\n".join(
+                    [f"- {w}" for w in reflection.weaknesses]
+                    + [f"Suggestion: {s}" for s in reflection.suggestions]
+                ))
+                state.increment_iteration()
+                to_revise.append(qid)
+        return to_revise
+
+    def _retrieve_context(self, query: str) -> Tuple[List[str], Dict[str, Any]]:
+        """Retrieve context locally; returns texts and retrieve-step metadata"""
+        collections = self.planner.identify_collections(query)
+        docs = []
+        for collection in collections:
+            try:
+                docs.extend(retrieve_relevant_chunks(
+                    query=query,
+                    collection_name=collection,
+                    top_k=TOP_K
+                ))
+            except Exception as e:
+                print(f"  Warning: Could not retrieve from {collection}: {e}")
+        docs = docs[:TOP_K * 2]
+
+        metadata = {"collections": collections, "doc_count": len(docs)}
+        return [doc.page_content for doc in docs], metadata
+
+    def _chat_body(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """Request body for an answer or revision completion"""
+        return {
+            "model": AGENT_MODEL,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": AGENT_TEMPERATURE
+        }
+
+    def _record_answer(self, state: AgentState, answer: Optional[str], context_count: int) -> None:
+        """Store a generated answer on the state"""
+        if answer is None:
+            return
+        state.current_answer = answer
+        state.add_step("generate", answer[:200] + "...", {
+            "context_count": context_count,
+            "tool_results_count": 0
+        })
+
+
 # CLI for running evaluation
 if __name__ == "__main__":
     runner = EvaluationRunner()
@@ -7,16 +7,116 @@ This module defines metrics for agent performance evaluation:
 - Topic coverage analysis
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import asyncio
+import hashlib
 import json
+from collections import Counter
 from dataclasses import dataclass
-from openai import OpenAI
+from functools import lru_cache
 
-from rag.config import OPENAI_API_KEY, EVAL_MODEL
+import numpy as np
+
+from openai import OpenAI, AsyncOpenAI
+from openai.lib._parsing import type_to_response_format_param
+from pydantic import BaseModel, Field, ValidationError
+
+from agent._client import CLIENT, get_async_client
+from agent.response_cache import ResponseCache
+from rag.config import EVAL_MODEL, JUDGE_CACHE_DIR, EVAL_JUDGE_BATCH_SIZE
 from agent.memory import AgentState
+from evaluation.rate_limit import AsyncRateLimiter, estimate_tokens
+
+
+JUDGE_RUBRIC = """You are an expert evaluator assessing AI-generated answers.
+
+Evaluate based on:
+1. Relevance: Does it directly address the query?
+2. Accuracy: Is the information correct and factual?
+3. Completeness: Are all aspects of the query covered?
+4. Coherence: Is it well-structured, clear, and logically organized?"""
+
+JUDGE_SCORE_KEYS = """- relevance_score: float (0.0-1.0)
+- accuracy_score: float (0.0-1.0)
+- completeness_score: float (0.0-1.0)
+- coherence_score: float (0.0-1.0)
+- overall_score: float (0.0-1.0, weighted average)
+- reasoning: string explaining the scores"""
+
+JUDGE_SYSTEM_PROMPT = JUDGE_RUBRIC + """
+
+Respond with a JSON object with these keys:
+""" + JUDGE_SCORE_KEYS
+
+# Several answers per call: the rubric is sent once instead of once per answer
+BATCH_JUDGE_SYSTEM_PROMPT = JUDGE_RUBRIC + """
+
+You will be given several numbered answers. Evaluate each one independently.
+
+Respond with a JSON object {"evaluations": [...]} holding one object per answer with these keys:
+- id: string (the answer's ID, exactly as given)
+""" + JUDGE_SCORE_KEYS
+
+# Re-judging a revised answer: only its changed ending is sent, with the old verdict
+DELTA_JUDGE_SYSTEM_PROMPT = JUDGE_RUBRIC + """
+
+You evaluated an earlier version of this answer before. Only its ending has changed since:
+you will be given your previous evaluation, how many paragraphs were removed from the end
+and the paragraphs that now end the answer. Update the evaluation for the revised answer.
+
+Respond with a JSON object with these keys:
+""" + JUDGE_SCORE_KEYS
+
+# Minimum Jaccard overlap of paragraph sets for a revision to be judged as a delta
+JUDGE_DELTA_MIN_OVERLAP = 0.8
+
+
+def _paragraph_hashes(paragraphs: List[str]) -> List[bytes]:
+    """SHA-256 digest of each paragraph, in order"""
+    return [hashlib.sha256(paragraph.encode("utf-8")).digest() for paragraph in paragraphs]
+
+
+def _is_tail(indices: List[int], length: int) -> bool:
+    """Whether ascending `indices` are exactly the last len(indices) positions"""
+    return indices == list(range(length - len(indices), length))
+
+
+@lru_cache(maxsize=256)
+def _topic_terms(expected_topics: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+    """
+    Lowercased distinct topics with how often each occurs in the list
+    The same topic lists recur for every run over a dataset, so this is built once
+    """
+    return tuple(Counter(topic.lower() for topic in expected_topics).items())
+
+
+# Judge response schemas; docstrings become schema descriptions the judge sees
+class JudgeVerdict(BaseModel):
+    """Scores and reasoning for one evaluated answer"""
+    relevance_score: float = Field(ge=0.0, le=1.0)
+    accuracy_score: float = Field(ge=0.0, le=1.0)
+    completeness_score: float = Field(ge=0.0, le=1.0)
+    coherence_score: float = Field(ge=0.0, le=1.0)
+    overall_score: float = Field(ge=0.0, le=1.0)
+    reasoning: str
+
+
+class IdentifiedJudgeVerdict(JudgeVerdict):
+    """Scores and reasoning for one of several evaluated answers"""
+    id: str
+
+
+class BatchJudgeVerdict(BaseModel):
+    """One evaluation per given answer"""
+    evaluations: List[IdentifiedJudgeVerdict]
 
 
-@dataclass
+# Strict json_schema response formats, built once (also valid in Batch API requests)
+JUDGE_RESPONSE_FORMAT = type_to_response_format_param(JudgeVerdict)
+BATCH_JUDGE_RESPONSE_FORMAT = type_to_response_format_param(BatchJudgeVerdict)
+
+
+@dataclass(slots=True)
 class AnswerEvaluation:
     """Structured evaluation of an answer"""
     relevance_score: float  # 0.0-1.0
@@ -32,8 +132,32 @@ class AgentEvaluator:
     Evaluate agent performance using LLM-as-judge and state analysis
     """
 
-    def __init__(self):
-        self.client = OpenAI(api_key=OPENAI_API_KEY)
+    def __init__(
+        self,
+        use_cache: bool = True,
+        client: Optional[OpenAI] = None,
+        async_client: Optional[AsyncOpenAI] = None
+    ):
+        """
+        Args:
+            use_cache: Reuse judge results for answers judged before
+            client: OpenAI client for judge calls (defaults to the shared pool)
+            async_client: Async client for concurrent judge calls (defaults to
+                the running event loop's shared client)
+        """
+        self.client = client or CLIENT
+        self._async_client = async_client
+        self._cache = (
+            ResponseCache(JUDGE_CACHE_DIR / "judgements.db", table="judgements", ttl_days=30)
+            if use_cache else None
+        )
+        # Previous-judgement key -> {"answer", "verdict"} of the last answer judged
+        self._prev: Dict[str, Dict[str, str]] = {}
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """The injected async client, or the running event loop's shared one"""
+        return self._async_client or get_async_client()
 
     def evaluate_answer(
         self,
@@ -52,22 +176,351 @@ class AgentEvaluator:
         Returns:
             AnswerEvaluation with scores and reasoning
         """
-        system_prompt = """You are an expert evaluator assessing AI-generated answers.
+        key = self.judge_cache_key(query, answer, expected_topics)
+        content = self.cached_judgement(key)
+        if content is None:
+            response = self.client.chat.completions.create(
+                **self._judge_request(query, answer, expected_topics)
+            )
+            content = response.choices[0].message.content
+            # Validated before storing, so a malformed verdict is never replayed
+            evaluation = self._parse_answer_eval(content)
+            self.store_judgement(key, content)
+            self._remember(query, answer, expected_topics, content)
+            return evaluation
+        return self._parse_answer_eval(content)
+
+    async def aevaluate_answer(
+        self,
+        query: str,
+        answer: str,
+        expected_topics: Optional[List[str]] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None
+    ) -> AnswerEvaluation:
+        """
+        Async variant of evaluate_answer, for judging several answers concurrently
 
-Evaluate based on:
-1. Relevance: Does it directly address the query?
-2. Accuracy: Is the information correct and factual?
-3. Completeness: Are all aspects of the query covered?
-4. Coherence: Is it well-structured, clear, and logically organized?
+        Args:
+            rate_limiter: Optional limiter shared by concurrent callers; the
+                request waits for budget before it is sent
+        """
+        key = self.judge_cache_key(query, answer, expected_topics)
+        content = self.cached_judgement(key)
+        if content is None:
+            request = self._judge_request(query, answer, expected_topics)
+            if rate_limiter is not None:
+                await rate_limiter.acquire(estimate_tokens(request))
+            response = await self.async_client.chat.completions.create(**request)
+            content = response.choices[0].message.content
+            evaluation = self._parse_answer_eval(content)
+            self.store_judgement(key, content)
+            self._remember(query, answer, expected_topics, content)
+            return evaluation
+        return self._parse_answer_eval(content)
+
+    def evaluate_answers_batched(
+        self,
+        items: List[Dict[str, Any]],
+        k: int = EVAL_JUDGE_BATCH_SIZE
+    ) -> Dict[str, AnswerEvaluation]:
+        """
+        Evaluate many answers, `k` per judge call
 
-Respond with a JSON object with these keys:
-- relevance_score: float (0.0-1.0)
-- accuracy_score: float (0.0-1.0)
-- completeness_score: float (0.0-1.0)
-- coherence_score: float (0.0-1.0)
-- overall_score: float (0.0-1.0, weighted average)
-- reasoning: string explaining the scores"""
+        Args:
+            items: Dicts with "id", "query", "answer" and optional "expected_topics"
+            k: Answers packed into one judge prompt
+
+        Returns:
+            Mapping of item ID to AnswerEvaluation
+        """
+        evaluations, pending = self._split_cached(items)
+        pending, deltas = self._split_deltas(pending)
+        for item in deltas:
+            evaluations[item["id"]] = self.evaluate_answer(
+                item["query"], item["answer"], item.get("expected_topics")
+            )
+        for start in range(0, len(pending), max(1, k)):
+            chunk = pending[start:start + max(1, k)]
+            response = self.client.chat.completions.create(**self._batched_request(chunk))
+            evaluations.update(self._parse_batched(response.choices[0].message.content, chunk))
+
+        # Answers the judge skipped are evaluated on their own
+        for item in pending:
+            if item["id"] not in evaluations:
+                evaluations[item["id"]] = self.evaluate_answer(
+                    item["query"], item["answer"], item.get("expected_topics")
+                )
+        return evaluations
+
+    async def aevaluate_answers_batched(
+        self,
+        items: List[Dict[str, Any]],
+        k: int = EVAL_JUDGE_BATCH_SIZE,
+        rate_limiter: Optional[AsyncRateLimiter] = None
+    ) -> Dict[str, AnswerEvaluation]:
+        """
+        Async variant of evaluate_answers_batched (chunks are judged concurrently)
+        """
+        evaluations, pending = self._split_cached(items)
+        pending, deltas = self._split_deltas(pending)
+
+        async def _judge_delta(item: Dict[str, Any]) -> Tuple[str, AnswerEvaluation]:
+            return item["id"], await self.aevaluate_answer(
+                item["query"], item["answer"], item.get("expected_topics"),
+                rate_limiter=rate_limiter
+            )
+
+        async def _judge_chunk(chunk: List[Dict[str, Any]]) -> Dict[str, AnswerEvaluation]:
+            request = self._batched_request(chunk)
+            if rate_limiter is not None:
+                await rate_limiter.acquire(estimate_tokens(request, replies=len(chunk)))
+            response = await self.async_client.chat.completions.create(**request)
+            return self._parse_batched(response.choices[0].message.content, chunk)
+
+        step = max(1, k)
+        delta_task = asyncio.gather(*(_judge_delta(item) for item in deltas))
+        for chunk_evaluations in await asyncio.gather(*(
+            _judge_chunk(pending[start:start + step]) for start in range(0, len(pending), step)
+        )):
+            evaluations.update(chunk_evaluations)
+        evaluations.update(await delta_task)
+
+        # Answers the judge skipped are evaluated on their own
+        for item in pending:
+            if item["id"] not in evaluations:
+                evaluations[item["id"]] = await self.aevaluate_answer(
+                    item["query"], item["answer"], item.get("expected_topics"),
+                    rate_limiter=rate_limiter
+                )
+        return evaluations
+
+    def _split_cached(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, AnswerEvaluation], List[Dict[str, Any]]]:
+        """Answer already cached evaluations; returns (evaluations, items still to judge)"""
+        evaluations = {}
+        pending = []
+        for item in items:
+            key = self.judge_cache_key(item["query"], item["answer"], item.get("expected_topics"))
+            content = self.cached_judgement(key)
+            if content is None:
+                pending.append(item)
+            else:
+                evaluations[item["id"]] = self._parse_answer_eval(content)
+        return evaluations, pending
+
+    def _split_deltas(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Separate revisions that qualify for a delta judgement; returns (full, delta)"""
+        full, deltas = [], []
+        for item in items:
+            if self._delta_request(item["query"], item["answer"], item.get("expected_topics")):
+                deltas.append(item)
+            else:
+                full.append(item)
+        return full, deltas
+
+    def _batched_request(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Chat completion arguments judging several answers in one call"""
+        blocks = []
+        for i, item in enumerate(items, 1):
+            block = (
+                f"Answer ID: {item['id']}\n"
+                f"Query {i}: {item['query']}\n\n"
+                f"Answer {i}: {item['answer']}"
+            )
+            if item.get("expected_topics"):
+                block += f"\nExpected topics {i}: {', '.join(item['expected_topics'])}"
+            blocks.append(block)
+
+        user_prompt = (
+            f"Evaluate the following {len(items)} answers.\n\n"
+            + "\n\n---\n\n".join(blocks)
+        )
+        return {
+            "model": EVAL_MODEL,
+            "messages": [
+                {"role": "system", "content": BATCH_JUDGE_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0.2,
+            "response_format": BATCH_JUDGE_RESPONSE_FORMAT
+        }
+
+    def _parse_batched(
+        self,
+        content: str,
+        items: List[Dict[str, Any]]
+    ) -> Dict[str, AnswerEvaluation]:
+        """
+        Parse a batched judge response, matched back by ID (unknown IDs are ignored)
+        An empty, refused or malformed response yields no evaluations, so every
+        answer of the chunk falls back to a judge call of its own
+        """
+        by_id = {str(item["id"]): item for item in items}
+        evaluations = {}
+        try:
+            verdicts = BatchJudgeVerdict.model_validate_json(content).evaluations
+        except ValidationError:
+            return evaluations
+        for verdict in verdicts:
+            item = by_id.get(verdict.id)
+            if item is None:
+                continue
+            # Cached in the single-answer format, so either path can reuse it
+            content = verdict.model_dump_json(exclude={"id"})
+            self.store_judgement(
+                self.judge_cache_key(item["query"], item["answer"], item.get("expected_topics")),
+                content
+            )
+            self._remember(item["query"], item["answer"], item.get("expected_topics"), content)
+            evaluations[item["id"]] = self._answer_eval_from_verdict(verdict)
+        return evaluations
+
+    def judge_cache_key(
+        self,
+        query: str,
+        answer: str,
+        expected_topics: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Exact-match cache key of a judge call (None when caching is off)
+        Hashes the full judge request, so rubric, schema or model changes
+        retire earlier verdicts; topic order does not matter
+        """
+        if self._cache is None:
+            return None
+        request = self._answer_eval_request(query, answer, sorted(expected_topics or []))
+        payload = json.dumps(request, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def cached_judgement(self, key: Optional[str]) -> Optional[str]:
+        """Raw judge response stored under `key`, if any"""
+        if key is None:
+            return None
+        return self._cache.get(key)
+
+    def store_judgement(self, key: Optional[str], content: str) -> None:
+        """Remember a raw judge response (no-op when caching is off)"""
+        if key is not None:
+            self._cache.put(key, content)
+
+    def _previous_key(self, query: str, expected_topics: Optional[List[str]] = None) -> str:
+        """Key of the last judgement made for a query"""
+        payload = f"{EVAL_MODEL}|previous|{query}|{sorted(expected_topics or [])}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _remember(
+        self,
+        query: str,
+        answer: str,
+        expected_topics: Optional[List[str]],
+        content: str
+    ) -> None:
+        """Keep a fresh judgement as the baseline for judging later revisions"""
+        key = self._previous_key(query, expected_topics)
+        self._prev[key] = {"answer": answer or "", "verdict": content}
+        # Persisted with the judge cache, so a re-run can judge its revisions as deltas
+        if self._cache is not None:
+            self._cache.put(key, json.dumps(self._prev[key]))
+
+    def _previous(
+        self,
+        query: str,
+        expected_topics: Optional[List[str]] = None
+    ) -> Optional[Dict[str, str]]:
+        """Last answer judged for a query and its verdict, if any"""
+        key = self._previous_key(query, expected_topics)
+        previous = self._prev.get(key)
+        if previous is None and self._cache is not None:
+            raw = self._cache.get(key)
+            if raw is not None:
+                previous = self._prev[key] = json.loads(raw)
+        return previous
+
+    def _judge_request(
+        self,
+        query: str,
+        answer: str,
+        expected_topics: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Delta request for a revision of the last judged answer, else the full request"""
+        return (
+            self._delta_request(query, answer, expected_topics)
+            or self._answer_eval_request(query, answer, expected_topics)
+        )
+
+    def _delta_request(
+        self,
+        query: str,
+        answer: str,
+        expected_topics: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Chat completion arguments judging only the changed ending of an answer
+
+        Applies when the paragraphs of `answer` overlap those of the last answer
+        judged for the query by at least JUDGE_DELTA_MIN_OVERLAP (Jaccard) and
+        both the removed and the added paragraphs sit at the end.
+
+        Returns:
+            Request dict, or None when the answer must be judged in full
+        """
+        previous = self._previous(query, expected_topics)
+        answer = answer or ""
+        if previous is None or previous["answer"] == answer:
+            return None
+
+        old_paragraphs = previous["answer"].split("\n\n")
+        new_paragraphs = answer.split("\n\n")
+        old_hashes = _paragraph_hashes(old_paragraphs)
+        new_hashes = _paragraph_hashes(new_paragraphs)
+        old_set, new_set = set(old_hashes), set(new_hashes)
+        if len(old_set & new_set) / len(old_set | new_set) < JUDGE_DELTA_MIN_OVERLAP:
+            return None
+
+        removed = [i for i, digest in enumerate(old_hashes) if digest not in new_set]
+        added = [i for i, digest in enumerate(new_hashes) if digest not in old_set]
+        if not _is_tail(removed, len(old_hashes)) or not _is_tail(added, len(new_hashes)):
+            return None
 
+        expected_topics_str = ""
+        if expected_topics:
+            expected_topics_str = f"\nExpected topics: {', '.join(expected_topics)}"
+        new_ending = "\n\n".join(new_paragraphs[i] for i in added) or "(none)"
+
+        user_prompt = f"""Query: {query}
+{expected_topics_str}
+
+Previous evaluation: {previous["verdict"]}
+
+Paragraphs removed from the end: {len(removed)}
+
+New ending of the answer:
+{new_ending}
+
+Evaluate the revised answer."""
+
+        return {
+            "model": EVAL_MODEL,
+            "messages": [
+                {"role": "system", "content": DELTA_JUDGE_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": 0.2,
+            "response_format": JUDGE_RESPONSE_FORMAT
+        }
+
+    def _answer_eval_request(
+        self,
+        query: str,
+        answer: str,
+        expected_topics: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Chat completion arguments shared by evaluate_answer and aevaluate_answer"""
         expected_topics_str = ""
         if expected_topics:
             expected_topics_str = f"\nExpected topics: {', '.join(expected_topics)}"
@@ -79,25 +532,30 @@ Answer: {answer}
 
 Evaluate this answer."""
 
-        response = self.client.chat.completions.create(
-            model=EVAL_MODEL,
-            messages=[
-                {"role": "system", "content": system_prompt},
+        return {
+            "model": EVAL_MODEL,
+            "messages": [
+                {"role": "system", "content": JUDGE_SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
-            temperature=0.2,
-            response_format={"type": "json_object"}
-        )
+            "temperature": 0.2,
+            "response_format": JUDGE_RESPONSE_FORMAT
+        }
+
+    def _parse_answer_eval(self, content: str) -> AnswerEvaluation:
+        """Parse JSON response into dataclass"""
+        return self._answer_eval_from_verdict(JudgeVerdict.model_validate_json(content))
 
-        # Parse JSON response into dataclass
-        result = json.loads(response.choices[0].message.content)
+    @staticmethod
+    def _answer_eval_from_verdict(verdict: JudgeVerdict) -> AnswerEvaluation:
+        """Build an AnswerEvaluation from a schema-validated judge verdict"""
         return AnswerEvaluation(
-            relevance_score=float(result.get("relevance_score", 0.5)),
-            accuracy_score=float(result.get("accuracy_score", 0.5)),
-            completeness_score=float(result.get("completeness_score", 0.5)),
-            coherence_score=float(result.get("coherence_score", 0.5)),
-            overall_score=float(result.get("overall_score", 0.5)),
-            reasoning=result.get("reasoning", "")
+            relevance_score=verdict.relevance_score,
+            accuracy_score=verdict.accuracy_score,
+            completeness_score=verdict.completeness_score,
+            coherence_score=verdict.coherence_score,
+            overall_score=verdict.overall_score,
+            reasoning=verdict.reasoning
         )
 
     def evaluate_tool_usage(self, state: AgentState) -> Dict[str, Any]:
@@ -120,22 +578,14 @@ Evaluate this answer."""
                 "tool_list": []
             }
 
-        # Extract tool information from metadata
-        all_tools = []
-        successful_calls = 0
-        total_calls = 0
-
-        for step in tool_steps:
-            tools = step.metadata.get("tools", [])
-            if tools:
-                all_tools.extend(tools)
-                successful_calls += len(tools)
-            total_calls += 1
+        # Flatten the tools of every step once; counts and the list all come from it
+        all_tools = [tool for step in tool_steps for tool in step.metadata.get("tools", ())]
+        total_calls = len(tool_steps)
 
         return {
             "tools_used": len(set(all_tools)),  # Unique tools
             "tool_calls": total_calls,
-            "success_rate": successful_calls / total_calls if total_calls > 0 else 0.0,
+            "success_rate": len(all_tools) / total_calls,
             "tool_list": all_tools
         }
 
@@ -163,14 +613,14 @@ Evaluate this answer."""
     def calculate_topic_coverage(
         self,
         answer: str,
-        expected_topics: List[str]
+        expected_topics: Sequence[str]
     ) -> float:
         """
         Calculate what percentage of expected topics are mentioned
 
         Args:
             answer: The generated answer
-            expected_topics: List of topics that should be covered
+            expected_topics: Topics that should be covered (a tuple skips a copy)
 
         Returns:
             Coverage ratio (0.0-1.0)
@@ -178,10 +628,12 @@ Evaluate this answer."""
         if not expected_topics:
             return 1.0
 
-        answer_lower = answer.lower()
+        # Topics are lowercased once per list (cached); the answer once per call.
+        # One pass per distinct topic; str's `in` is a C substring search
+        answer_lower = (answer or "").lower()
         covered = sum(
-            1 for topic in expected_topics
-            if topic.lower() in answer_lower
+            count for topic, count in _topic_terms(tuple(expected_topics))
+            if topic in answer_lower
         )
         return covered / len(expected_topics)
 
@@ -203,27 +655,39 @@ class EvaluationReport:
         if not results:
             return {}
 
-        # Average scores
-        avg_relevance = sum(r["answer_eval"]["relevance_score"] for r in results) / len(results)
-        avg_accuracy = sum(r["answer_eval"]["accuracy_score"] for r in results) / len(results)
-        avg_completeness = sum(r["answer_eval"]["completeness_score"] for r in results) / len(results)
-        avg_coherence = sum(r["answer_eval"]["coherence_score"] for r in results) / len(results)
-        avg_overall = sum(r["answer_eval"]["overall_score"] for r in results) / len(results)
-
-        # Reasoning stats
-        avg_iterations = sum(r["reasoning"]["iterations"] for r in results) / len(results)
-        avg_confidence = sum(r["reasoning"]["confidence_final"] for r in results) / len(results)
-        avg_efficiency = sum(r["reasoning"]["efficiency_score"] for r in results) / len(results)
-
-        # Tool stats
-        queries_with_tools = sum(1 for r in results if r["tools"]["tools_used"] > 0)
-        avg_tool_success = sum(r["tools"]["success_rate"] for r in results) / len(results)
-
-        # Topic coverage
-        avg_topic_coverage = sum(r["topic_coverage"] for r in results) / len(results)
+        n = len(results)
+
+        # One (N, 11) matrix of per-result metrics, reduced column-wise in one call
+        metrics = np.fromiter(
+            (
+                (
+                    r["answer_eval"]["relevance_score"],
+                    r["answer_eval"]["accuracy_score"],
+                    r["answer_eval"]["completeness_score"],
+                    r["answer_eval"]["coherence_score"],
+                    r["answer_eval"]["overall_score"],
+                    r["reasoning"]["iterations"],
+                    r["reasoning"]["confidence_final"],
+                    r["reasoning"]["efficiency_score"],
+                    r["tools"]["tools_used"] > 0,
+                    r["tools"]["success_rate"],
+                    r["topic_coverage"]
+                )
+                for r in results
+            ),
+            dtype=np.dtype((np.float64, 11)),
+            count=n
+        )
+        sums = metrics.sum(axis=0)
+        (
+            avg_relevance, avg_accuracy, avg_completeness, avg_coherence, avg_overall,
+            avg_iterations, avg_confidence, avg_efficiency,
+            _, avg_tool_success, avg_topic_coverage
+        ) = (sums / n).tolist()
+        queries_with_tools = int(sums[8])
 
         return {
-            "total_queries": len(results),
+            "total_queries": n,
             "answer_quality": {
                 "relevance": round(avg_relevance, 3),
                 "accuracy": round(avg_accuracy, 3),
@@ -238,7 +702,7 @@ class EvaluationReport:
             },
             "tools": {
                 "queries_using_tools": queries_with_tools,
-                "tool_usage_rate": round(queries_with_tools / len(results), 3),
+                "tool_usage_rate": round(queries_with_tools / n, 3),
                 "avg_success_rate": round(avg_tool_success, 3)
             },
             "topic_coverage": {
@@ -0,0 +1,141 @@
+"""Client-side rate limiting for concurrent evaluation calls.
+
+Token buckets for requests and tokens per minute, modeled on the
+openai-cookbook parallel request processor: each bucket refills
+continuously up to one minute's budget, and a call waits until both
+buckets can cover it.
+"""
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+import tiktoken
+
+from rag.config import CHUNK_SIZE, TOP_K
+
+# Rough size of a judge reply, counted against the token budget up front
+EXPECTED_COMPLETION_TOKENS = 300
+
+# Chat format overhead per message (role and separators)
+TOKENS_PER_MESSAGE = 4
+
+# Completion calls of one agent run: plan, answer, critique
+AGENT_RUN_REQUESTS = 3
+
+
+@lru_cache(maxsize=8)
+def _encoder(model: str) -> Optional[Callable[[str], List[int]]]:
+    """Tokenizer of a model (None if tiktoken has no encoding available for it)"""
+    try:
+        try:
+            encoding = tiktoken.encoding_for_model(model)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        # Encodings are downloaded on first use; fall back when offline
+        return None
+    return encoding.encode
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Tokens of `text` for `model` (about 4 characters per token without tiktoken)"""
+    encode = _encoder(model)
+    if encode is None:
+        return len(text) // 4
+    return len(encode(text, disallowed_special=()))
+
+
+def estimate_tokens(request: Dict[str, Any], replies: int = 1) -> int:
+    """
+    Estimate tokens of a chat completion request
+
+    Args:
+        request: Chat completion arguments with "model" and "messages"
+        replies: Judge replies expected in the completion
+
+    Returns:
+        Estimated prompt + completion tokens
+    """
+    prompt = sum(
+        count_tokens(message["content"], request["model"]) + TOKENS_PER_MESSAGE
+        for message in request["messages"]
+    )
+    return prompt + EXPECTED_COMPLETION_TOKENS * replies
+
+
+def estimate_agent_run_tokens(query: str, model: str) -> int:
+    """
+    Rough token cost of one agent run, before any of its prompts exist
+
+    The answer and critique prompts each carry the query and up to TOP_K
+    retrieved chunks; every call gets a judge-sized completion.
+    """
+    context = TOP_K * CHUNK_SIZE // 4
+    return (
+        AGENT_RUN_REQUESTS * (count_tokens(query, model) + EXPECTED_COMPLETION_TOKENS)
+        + 2 * context
+    )
+
+
+class AsyncRateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter for asyncio tasks
+    """
+
+    def __init__(self, max_requests_per_minute: float, max_tokens_per_minute: float):
+        """
+        Initialize rate limiter
+
+        Args:
+            max_requests_per_minute: Request budget per minute
+            max_tokens_per_minute: Token budget (prompt + completion) per minute
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self._requests = max_requests_per_minute
+        self._tokens = max_tokens_per_minute
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """Add the budget accrued since the last update"""
+        now = time.monotonic()
+        elapsed_minutes = (now - self._updated) / 60.0
+        self._updated = now
+        self._requests = min(
+            self.max_requests_per_minute,
+            self._requests + elapsed_minutes * self.max_requests_per_minute
+        )
+        self._tokens = min(
+            self.max_tokens_per_minute,
+            self._tokens + elapsed_minutes * self.max_tokens_per_minute
+        )
+
+    async def acquire(self, tokens: int, requests: int = 1) -> None:
+        """
+        Wait until `requests` requests of `tokens` estimated tokens fit the budget
+
+        Args:
+            tokens: Estimated tokens the request(s) will consume
+            requests: Number of API requests being admitted together
+        """
+        # Requests larger than a minute's budget would never fit otherwise
+        tokens = min(tokens, self.max_tokens_per_minute)
+        requests = min(requests, self.max_requests_per_minute)
+
+        # The lock keeps waiters first-come, first-served
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._requests >= requests and self._tokens >= tokens:
+                    self._requests -= requests
+                    self._tokens -= tokens
+                    return
+                # Sleep roughly until the scarcer bucket has refilled enough
+                wait_minutes = max(
+                    (requests - self._requests) / self.max_requests_per_minute,
+                    (tokens - self._tokens) / self.max_tokens_per_minute
+                )
+                await asyncio.sleep(max(wait_minutes * 60.0, 0.01))
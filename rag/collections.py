@@ -4,28 +4,90 @@ This module provides basic functions for creating, listing, and managing
 collections without heavy abstractions. Keeps it simple and functional.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 import chromadb
 from chromadb.config import Settings
 
-from rag.config import CHROMA_DB_DIR
+from rag.config import CHROMA_DB_DIR, HNSW_M, HNSW_CONSTRUCTION_EF, HNSW_SEARCH_EF
+
+# Upper bound on threads reading collection counts in get_all_stats
+MAX_STATS_WORKERS = 32
+
+_client = None
+_client_lock = threading.Lock()
+
+# Bumped whenever this process creates, writes to, clears or deletes a
+# collection, so caches of search results and collection names can tell
+# that they are stale
+_index_version = 0
+_index_version_lock = threading.Lock()
+
+
+def bump_index_version() -> None:
+    """Mark every index as changed."""
+    global _index_version
+    with _index_version_lock:
+        _index_version += 1
+
+
+def index_version() -> int:
+    """Number of index changes made by this process so far.
+
+    Returns:
+        A value that changes whenever indexed content may have changed
+    """
+    return _index_version
 
 
 def get_client() -> chromadb.Client:
-    """Get ChromaDB client (reusable across collections).
+    """Get ChromaDB client (created once, reused across collections and calls).
 
     Returns:
         Configured ChromaDB persistent client
     """
-    CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
-
-    return chromadb.PersistentClient(
-        path=str(CHROMA_DB_DIR),
-        settings=Settings(
-            anonymized_telemetry=False,
-            allow_reset=True,
-        ),
-    )
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
+
+                _client = chromadb.PersistentClient(
+                    path=str(CHROMA_DB_DIR),
+                    settings=Settings(
+                        anonymized_telemetry=False,
+                        allow_reset=True,
+                    ),
+                )
+    return _client
+
+
+def hnsw_configuration(
+    m: Optional[int] = None,
+    construction_ef: Optional[int] = None,
+    search_ef: Optional[int] = None
+) -> Dict[str, Any]:
+    """HNSW index configuration for a new collection.
+
+    ChromaDB only applies it when the collection is created; an existing
+    collection keeps the graph it was built with.
+
+    Args:
+        m: Neighbors per vector (default: HNSW_M)
+        construction_ef: Candidates while inserting (default: HNSW_CONSTRUCTION_EF)
+        search_ef: Candidates per query (default: HNSW_SEARCH_EF)
+
+    Returns:
+        Collection configuration for get_or_create_collection
+    """
+    return {
+        "hnsw": {
+            "max_neighbors": m or HNSW_M,
+            "ef_construction": construction_ef or HNSW_CONSTRUCTION_EF,
+            "ef_search": search_ef or HNSW_SEARCH_EF,
+        }
+    }
 
 
 def create_collection(
@@ -44,10 +106,13 @@ def create_collection(
     if client is None:
         client = get_client()
 
-    return client.get_or_create_collection(
+    collection = client.get_or_create_collection(
         name=collection_name,
+        configuration=hnsw_configuration(),
         metadata={"description": f"Collection: {collection_name}"}
     )
+    bump_index_version()
+    return collection
 
 
 def list_collections(client: Optional[chromadb.Client] = None) -> List[str]:
@@ -113,9 +178,25 @@ def delete_collection(
         client = get_client()
 
     client.delete_collection(name=collection_name)
+    bump_index_version()
     print(f"✓ Deleted collection: {collection_name}")
 
 
+def _handle_stats(collection: chromadb.Collection) -> Dict[str, Any]:
+    """Stats of an already opened collection (errors are reported, not raised)."""
+    try:
+        return {
+            "name": collection.name,
+            "count": collection.count(),
+            "metadata": collection.metadata
+        }
+    except Exception as e:
+        return {
+            "name": collection.name,
+            "error": str(e)
+        }
+
+
 def get_all_stats(client: Optional[chromadb.Client] = None) -> Dict[str, Dict[str, Any]]:
     """Get stats for all collections.
 
@@ -128,11 +209,17 @@ def get_all_stats(client: Optional[chromadb.Client] = None) -> Dict[str, Dict[st
     if client is None:
         client = get_client()
 
-    stats = {}
-    for collection_name in list_collections(client):
-        stats[collection_name] = get_collection_stats(collection_name, client)
+    # The listing already returns collection handles; no lookup by name needed
+    collections = client.list_collections()
+    if len(collections) <= 1:
+        return {collection.name: _handle_stats(collection) for collection in collections}
 
-    return stats
+    # Counts are independent reads; issue them concurrently
+    with ThreadPoolExecutor(max_workers=min(MAX_STATS_WORKERS, len(collections))) as pool:
+        return {
+            collection.name: stats
+            for collection, stats in zip(collections, pool.map(_handle_stats, collections))
+        }
 
 
 # CLI for testing
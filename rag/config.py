@@ -42,6 +42,19 @@ def _get_env_var(key: str, default: Optional[str] = None, required: bool = False
     return value
 
 
+def _get_bool_env_var(key: str, default: bool) -> bool:
+    """Get a true/false environment variable (anything but "true" is False).
+
+    Args:
+        key: Environment variable name
+        default: Value used when the variable is not set
+
+    Returns:
+        The parsed flag
+    """
+    return _get_env_var(key, default="true" if default else "false").lower() == "true"
+
+
 # ============================================================================
 # OpenAI API Configuration
 # ============================================================================
@@ -90,6 +103,26 @@ CHUNK_OVERLAP: int = int(_get_env_var("CHUNK_OVERLAP", default="200"))
 Helps maintain context continuity across chunk boundaries.
 """
 
+LOAD_DOCUMENTS_NUM_WORKERS: int = int(_get_env_var("LOAD_DOCUMENTS_NUM_WORKERS", default="0"))
+"""Number of worker processes parsing PDFs (and threads transcribing MP4s)
+while loading documents. 0 uses one less than the number of CPUs.
+"""
+
+HNSW_M: int = int(_get_env_var("HNSW_M", default="32"))
+"""HNSW graph neighbors per vector (max_neighbors) for newly created collections.
+Higher values improve recall on large indexes at the cost of memory.
+"""
+
+HNSW_CONSTRUCTION_EF: int = int(_get_env_var("HNSW_CONSTRUCTION_EF", default="200"))
+"""HNSW candidate list size while inserting into newly created collections.
+Higher values build a better graph but make indexing slower.
+"""
+
+HNSW_SEARCH_EF: int = int(_get_env_var("HNSW_SEARCH_EF", default="100"))
+"""HNSW candidate list size per query for newly created collections.
+Higher values improve recall but make queries slower.
+"""
+
 # ============================================================================
 # Retrieval Parameters
 # ============================================================================
@@ -99,6 +132,12 @@ TOP_K: int = int(_get_env_var("TOP_K", default="5"))
 Higher values provide more context but increase token usage.
 """
 
+TWO_LEVEL_RETRIEVAL: bool = _get_bool_env_var("TWO_LEVEL_RETRIEVAL", default=True)
+"""Narrow vector search to the source documents whose names match the query
+(e.g. "week 3") before searching chunks. Falls back to the whole collection
+when no document name matches or too few chunks are found.
+"""
+
 # ============================================================================
 # Agent Configuration
 # ============================================================================
@@ -123,7 +162,7 @@ MAX_REASONING_STEPS: int = int(_get_env_var("MAX_REASONING_STEPS", default="5"))
 Prevents infinite loops while allowing multi-step reasoning.
 """
 
-REFLECTION_ENABLED: bool = _get_env_var("REFLECTION_ENABLED", default="true").lower() == "true"
+REFLECTION_ENABLED: bool = _get_bool_env_var("REFLECTION_ENABLED", default=True)
 """Enable self-reflection loop where agent critiques its own outputs.
 Improves quality but increases API calls and latency.
 """
@@ -133,6 +172,26 @@ MIN_CONFIDENCE_SCORE: float = float(_get_env_var("MIN_CONFIDENCE_SCORE", default
 Higher values make agent more cautious.
 """
 
+SELF_CONSISTENCY_SAMPLES: int = int(_get_env_var("SELF_CONSISTENCY_SAMPLES", default="3"))
+"""Number of candidate answers sampled in one request on the first reasoning pass.
+The critic picks or merges the best in a single call, which usually avoids
+revision round-trips. Set to 1 to disable.
+"""
+
+AGENT_CONCURRENCY: int = int(_get_env_var("AGENT_CONCURRENCY", default="4"))
+"""Maximum number of queries run concurrently by ReasoningAgent.run_many.
+Keep low enough to stay within your OpenAI rate limits.
+"""
+
+REFLECTION_CACHE_DIR: Path = Path(_get_env_var("REFLECTION_CACHE_DIR", default="./.reflect_cache"))
+"""Directory of the on-disk cache of critic results.
+Reflections on an already seen (query, answer, context) are reused across runs.
+"""
+
+REFLECTION_CACHE_TTL_DAYS: int = int(_get_env_var("REFLECTION_CACHE_TTL_DAYS", default="7"))
+"""Days a cached reflection stays valid. Set to 0 to disable the cache.
+"""
+
 # ============================================================================
 # Tool Calling Configuration
 # ============================================================================
@@ -142,7 +201,20 @@ TOOL_TIMEOUT_SECONDS: int = int(_get_env_var("TOOL_TIMEOUT_SECONDS", default="30
 Prevents hanging on long-running or stuck operations.
 """
 
-ALLOW_DANGEROUS_TOOLS: bool = _get_env_var("ALLOW_DANGEROUS_TOOLS", default="false").lower() == "true"
+TOOL_RETRY_BASE_DELAY: float = float(_get_env_var("TOOL_RETRY_BASE_DELAY", default="1.0"))
+"""Seconds before the first retry of a failed tool call; doubles per attempt.
+"""
+
+TOOL_RETRY_MAX_DELAY: float = float(_get_env_var("TOOL_RETRY_MAX_DELAY", default="30.0"))
+"""Upper bound in seconds on a single retry delay (before jitter).
+"""
+
+TOOL_RETRY_JITTER: float = float(_get_env_var("TOOL_RETRY_JITTER", default="0.5"))
+"""Random spread of retry delays as a fraction (0.5 = +/-50%).
+Keeps concurrent retries of the same tool from firing in lockstep.
+"""
+
+ALLOW_DANGEROUS_TOOLS: bool = _get_bool_env_var("ALLOW_DANGEROUS_TOOLS", default=False)
 """Allow tools that can modify filesystem or make network requests.
 Should be False for production/untrusted environments.
 """
@@ -159,7 +231,7 @@ Options: DEBUG, INFO, WARNING, ERROR, CRITICAL
 LOG_DIR: Path = Path(_get_env_var("LOG_DIR", default="./logs"))
 """Directory for storing agent execution logs and traces."""
 
-AGENT_TRACE_ENABLED: bool = _get_env_var("AGENT_TRACE_ENABLED", default="true").lower() == "true"
+AGENT_TRACE_ENABLED: bool = _get_bool_env_var("AGENT_TRACE_ENABLED", default=True)
 """Enable detailed tracing of agent reasoning steps.
 Useful for debugging and evaluation but increases log size.
 """
@@ -168,18 +240,47 @@ Useful for debugging and evaluation but increases log size.
 # Evaluation Configuration
 # ============================================================================
 
-EVAL_MODEL: str = _get_env_var("EVAL_MODEL", default="gpt-4-turbo-preview")
+EVAL_MODEL: str = _get_env_var("EVAL_MODEL", default="gpt-4o")
 """GPT model to use for LLM-as-judge evaluation.
 Should be a strong model for accurate assessment.
+Must support structured outputs: judge replies are requested as a strict JSON schema.
 """
 
 EVAL_DATASET: Path = Path(_get_env_var("EVAL_DATASET", default="./evaluation/test_queries.json"))
 """Path to JSON file containing test queries for evaluation."""
 
+JUDGE_CACHE_DIR: Path = Path(_get_env_var("JUDGE_CACHE_DIR", default="./evaluation/.judge_cache"))
+"""Directory of the on-disk cache of LLM-as-judge results.
+An already judged (query, answer, expected topics) is not sent to the judge again.
+Disable per run with `evaluate.py run --no-cache`.
+"""
+
+EVAL_JUDGE_BATCH_SIZE: int = int(_get_env_var("EVAL_JUDGE_BATCH_SIZE", default="10"))
+"""Number of answers scored per LLM-as-judge call.
+The rubric is sent once per call instead of once per answer. Set to 1 to judge
+each answer separately (as soon as its agent run finishes).
+"""
+
+EVAL_CONCURRENCY: int = int(_get_env_var("EVAL_CONCURRENCY", default="4"))
+"""Maximum number of test queries evaluated concurrently.
+"""
+
+EVAL_MAX_REQUESTS_PER_MINUTE: float = float(_get_env_var("EVAL_MAX_REQUESTS_PER_MINUTE", default="500"))
+"""Client-side request budget for LLM-as-judge calls during evaluation.
+"""
+
+EVAL_MAX_TOKENS_PER_MINUTE: float = float(_get_env_var("EVAL_MAX_TOKENS_PER_MINUTE", default="150000"))
+"""Client-side token budget for LLM-as-judge calls during evaluation.
+Set both budgets a little below your OpenAI account limits.
+"""
+
 # ============================================================================
 # Configuration Validation
 # ============================================================================
 
+_CONFIGURED = False
+
+
 def validate_config() -> None:
     """Validate configuration and check for common issues.
 
@@ -231,6 +332,7 @@ def print_config() -> None:
     print(f"Reflection Enabled: {REFLECTION_ENABLED}")
     print(f"Min Confidence Score: {MIN_CONFIDENCE_SCORE}")
     print(f"Tool Timeout (seconds): {TOOL_TIMEOUT_SECONDS}")
+    print(f"Tool Retry Delay (seconds): {TOOL_RETRY_BASE_DELAY} base, {TOOL_RETRY_MAX_DELAY} max, +/-{TOOL_RETRY_JITTER:.0%} jitter")
     print(f"Allow Dangerous Tools: {ALLOW_DANGEROUS_TOOLS}")
     print(f"Log Level: {LOG_LEVEL}")
     print(f"Log Directory: {LOG_DIR.absolute()}")
@@ -240,10 +342,19 @@ def print_config() -> None:
     print("=" * 40)
 
 
-# Validate configuration on module import
-try:
-    validate_config()
-except ValueError as e:
-    # Don't fail import, but warn user
-    import warnings
-    warnings.warn(f"Configuration validation warning: {e}")
+def configure() -> None:
+    """Validate configuration once per process (called by the CLI entry points).
+
+    Validation touches the filesystem, so it no longer runs on import: library
+    code and tests that only read a constant skip it. Problems are reported as
+    a warning rather than an error, so commands that don't need them still run.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+    try:
+        validate_config()
+    except ValueError as e:
+        import warnings
+        warnings.warn(f"Configuration validation warning: {e}")
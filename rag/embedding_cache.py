@@ -0,0 +1,121 @@
+"""Persistent cache of document embeddings.
+
+This module keeps a small SQLite table of chunk embeddings keyed by the
+SHA-256 of the chunk text, the embedding provider and the model. Indexing
+looks every batch up here first and only sends the missing texts to the
+embedding API, so rebuilding an index from unchanged documents costs no
+API calls:
+- Vectors are stored as float32 BLOBs (4 bytes per dimension)
+- A different EMBEDDING_MODEL never reuses another model's vectors
+
+The cache lives next to the ChromaDB storage but survives `--rebuild`,
+which only clears collections.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from rag.config import CHROMA_DB_DIR, EMBEDDING_MODEL
+
+# Embeddings are generated through the OpenAI API
+PROVIDER = "openai"
+
+# Hashes per SELECT, safely below SQLite's bound-parameter limit
+_LOOKUP_CHUNK = 500
+
+_conn = None
+_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get or create the cache connection (lazy initialization).
+
+    Returns:
+        sqlite3.Connection: Connection with the cache table created
+    """
+    global _conn
+    if _conn is None:
+        CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(
+            str(CHROMA_DB_DIR / "embedding_cache.db"), check_same_thread=False
+        )
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            "hash BLOB NOT NULL, provider TEXT NOT NULL, model TEXT NOT NULL, "
+            "vector BLOB NOT NULL, PRIMARY KEY (hash, provider, model))"
+        )
+    return _conn
+
+
+def text_hash(text: str) -> bytes:
+    """SHA-256 digest identifying a chunk text.
+
+    Args:
+        text: Chunk text
+
+    Returns:
+        32-byte digest
+    """
+    return hashlib.sha256(text.encode("utf-8")).digest()
+
+
+def get_many(
+    hashes: Sequence[bytes],
+    model: str = EMBEDDING_MODEL,
+) -> Dict[bytes, List[float]]:
+    """Look up cached vectors.
+
+    Args:
+        hashes: Digests from text_hash
+        model: Embedding model the vectors must come from
+
+    Returns:
+        Mapping of digest to vector for the hashes that are cached
+    """
+    found = {}
+    unique = list(dict.fromkeys(hashes))
+    with _lock:
+        conn = _get_connection()
+        for start in range(0, len(unique), _LOOKUP_CHUNK):
+            chunk = unique[start:start + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                "SELECT hash, vector FROM embedding_cache "
+                f"WHERE provider = ? AND model = ? AND hash IN ({placeholders})",
+                (PROVIDER, model, *chunk),
+            ).fetchall()
+            for digest, blob in rows:
+                found[digest] = np.frombuffer(blob, dtype=np.float32).tolist()
+    return found
+
+
+def put_many(
+    hashes: Sequence[bytes],
+    vectors: Sequence[Sequence[float]],
+    model: str = EMBEDDING_MODEL,
+) -> None:
+    """Store vectors for later builds.
+
+    Args:
+        hashes: Digests from text_hash
+        vectors: Embedding of each hashed text, in the same order
+        model: Embedding model that produced the vectors
+    """
+    rows = [
+        (digest, PROVIDER, model, np.asarray(vector, dtype=np.float32).tobytes())
+        for digest, vector in zip(hashes, vectors)
+    ]
+    if not rows:
+        return
+    with _lock:
+        conn = _get_connection()
+        conn.executemany(
+            "INSERT OR REPLACE INTO embedding_cache (hash, provider, model, vector) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
@@ -4,7 +4,8 @@ This module handles generation of vector embeddings using OpenAI's embedding mod
 It provides functions for embedding both individual queries and batches of documents.
 """
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 import warnings
 
 from langchain_openai import OpenAIEmbeddings
@@ -16,8 +17,12 @@ from tenacity import (
 )
 from openai import APIError, RateLimitError, APITimeoutError
 
+from rag import embedding_cache
 from rag.config import OPENAI_API_KEY, EMBEDDING_MODEL
 
+# Distinct query embeddings kept in memory (repeated questions skip the API)
+QUERY_CACHE_SIZE = 512
+
 
 # Global embeddings client (lazy initialization)
 _embeddings_client = None
@@ -97,16 +102,72 @@ def embed_texts(texts: List[str]) -> List[List[float]]:
         raise Exception(f"Error generating embeddings: {e}")
 
 
+def embed_texts_cached(texts: List[str]) -> List[List[float]]:
+    """Generate embeddings for a list of texts, reusing cached vectors.
+
+    Texts embedded before with the same model are served from the persistent
+    embedding cache; only the rest are sent to the API (in one embed_texts
+    call) and then cached.
+
+    Args:
+        texts: List of non-empty text strings to embed
+
+    Returns:
+        List of embedding vectors, one per input text and in the same order
+
+    Raises:
+        ValueError: If texts list is empty
+        Exception: If OpenAI API call fails after retries
+    """
+    if not texts:
+        raise ValueError("Cannot embed empty list of texts")
+
+    hashes = [embedding_cache.text_hash(text) for text in texts]
+    vectors = embedding_cache.get_many(hashes)
+
+    # Each distinct missing text is embedded once
+    missing = {digest: text for digest, text in zip(hashes, texts) if digest not in vectors}
+    if missing:
+        new_vectors = embed_texts(list(missing.values()))
+        embedding_cache.put_many(list(missing), new_vectors)
+        vectors.update(zip(missing, new_vectors))
+
+    return [vectors[digest] for digest in hashes]
+
+
 @retry(
     retry=retry_if_exception_type((RateLimitError, APITimeoutError, APIError)),
     wait=wait_exponential(multiplier=1, min=2, max=60),
     stop=stop_after_attempt(5),
 )
+def _embed_query_uncached(query: str) -> List[float]:
+    """Embed a single query with the OpenAI API (retried on transient errors)."""
+    try:
+        client = _get_embeddings_client()
+        # LangChain's embed_query is optimized for single queries
+        embedding = client.embed_query(query)
+        return embedding
+
+    except (RateLimitError, APITimeoutError) as e:
+        # Let tenacity retry handle these
+        raise
+    except Exception as e:
+        raise Exception(f"Error generating query embedding: {e}")
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _embed_query_cached(query: str) -> Tuple[float, ...]:
+    """Process-wide memo of query embeddings (tuples, so no caller can mutate them)."""
+    return tuple(_embed_query_uncached(query))
+
+
 def embed_query(query: str) -> List[float]:
     """Generate embedding for a single query string.
 
     Optimized for embedding user queries. Uses the same model as document
-    embeddings to ensure compatibility.
+    embeddings to ensure compatibility. The last QUERY_CACHE_SIZE distinct
+    queries are remembered, so asking the same question again (interactive
+    mode, re-running examples) makes no API call.
 
     Args:
         query: Query string to embed
@@ -127,17 +188,7 @@ def embed_query(query: str) -> List[float]:
     if not query or not query.strip():
         raise ValueError("Cannot embed empty query")
 
-    try:
-        client = _get_embeddings_client()
-        # LangChain's embed_query is optimized for single queries
-        embedding = client.embed_query(query)
-        return embedding
-
-    except (RateLimitError, APITimeoutError) as e:
-        # Let tenacity retry handle these
-        raise
-    except Exception as e:
-        raise Exception(f"Error generating query embedding: {e}")
+    return list(_embed_query_cached(query))
 
 
 def get_embedding_dimension() -> int:
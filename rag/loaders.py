@@ -6,14 +6,17 @@ This module handles loading and processing of PDF and MP4 files:
 - All text is chunked into semantically meaningful pieces for embedding
 """
 
+import multiprocessing
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 import warnings
 
 from langchain_core.documents import Document
-from langchain_community.document_loaders import PyPDFLoader
+from langchain_core.documents.base import Blob
+from langchain_community.document_loaders.parsers.pdf import PyPDFParser
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from tqdm import tqdm
 import ffmpeg
@@ -23,6 +26,7 @@ from rag.config import (
     DATA_DIR,
     CHUNK_SIZE,
     CHUNK_OVERLAP,
+    LOAD_DOCUMENTS_NUM_WORKERS,
     OPENAI_API_KEY,
     WHISPER_MODEL,
 )
@@ -32,6 +36,32 @@ from rag.config import (
 _openai_client = None
 
 
+def find_source_files(data_dir: Path) -> Tuple[List[Path], List[Path]]:
+    """Find the PDF and MP4 files of a data directory.
+
+    One directory scan with case-insensitive extensions, so "*.MP4" files are
+    found without a second glob and never counted twice on case-insensitive
+    filesystems.
+
+    Args:
+        data_dir: Directory containing source documents
+
+    Returns:
+        Tuple of (pdf_files, mp4_files) in directory order
+    """
+    pdf_files, mp4_files = [], []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            extension = os.path.splitext(entry.name)[1].lower()
+            if extension == ".pdf":
+                pdf_files.append(Path(entry.path))
+            elif extension == ".mp4":
+                mp4_files.append(Path(entry.path))
+    return pdf_files, mp4_files
+
+
 def _get_openai_client() -> OpenAI:
     """Get or create OpenAI client (lazy initialization)."""
     global _openai_client
@@ -188,47 +218,99 @@ def _cleanup_partial_transcripts(mp4_path: Path, data_dir: Path) -> None:
         warnings.warn(f"Error cleaning up partial transcripts: {e}")
 
 
+def _resolve_workers(workers: Optional[int] = None) -> int:
+    """Number of parallel loading workers (LOAD_DOCUMENTS_NUM_WORKERS when not given).
+
+    Args:
+        workers: Requested worker count; 0 or None means automatic
+
+    Returns:
+        Worker count, at least 1
+    """
+    if not workers:
+        workers = LOAD_DOCUMENTS_NUM_WORKERS
+    if not workers:
+        workers = (os.cpu_count() or 2) - 1
+    return max(1, workers)
+
+
 # ============================================================================
 # Part A: PDF Processing
 # ============================================================================
 
+# PDFs up to this size are read into memory in one call and parsed from there;
+# larger ones are streamed from disk so RAM isn't spent on a second copy
+PDF_IN_MEMORY_MAX_BYTES = 100 * 1024 * 1024
 
-def _load_pdfs(data_dir: Path) -> List[Document]:
-    """Load all PDF files from the data directory.
+
+def _load_single_pdf(pdf_path: Path) -> Tuple[Path, List[Document], Optional[str]]:
+    """Parse one PDF (runs in a worker process).
 
     Args:
-        data_dir: Directory containing PDF files
+        pdf_path: Path of the PDF file
 
     Returns:
-        List of Document objects with text and metadata (source, page)
+        Tuple of (path, page documents, error message or None)
     """
-    pdf_files = list(data_dir.glob("*.pdf"))
+    try:
+        # Same parser as LangChain's PyPDFLoader, but fed from one bulk read:
+        # pypdf seeks around the file and does many small reads otherwise
+        if pdf_path.stat().st_size <= PDF_IN_MEMORY_MAX_BYTES:
+            blob = Blob.from_data(pdf_path.read_bytes(), path=str(pdf_path))
+        else:
+            blob = Blob.from_path(str(pdf_path))
+        documents = PyPDFParser().parse(blob)
+    except Exception as e:
+        return pdf_path, [], str(e)
+
+    # Add source filename to metadata
+    for doc in documents:
+        doc.metadata["source"] = pdf_path.name
+        doc.metadata["source_type"] = "pdf"
+    return pdf_path, documents, None
+
+
+def _iter_pdfs(data_dir: Path, workers: Optional[int] = None) -> Iterator[Document]:
+    """Yield the pages of all PDF files in the data directory.
+
+    PDF parsing is CPU-bound, so files are parsed in parallel worker processes;
+    pages keep their order and files keep directory order. Pages of a file are
+    yielded as soon as it is parsed.
+
+    Args:
+        data_dir: Directory containing PDF files
+        workers: Worker processes (default: LOAD_DOCUMENTS_NUM_WORKERS)
+
+    Yields:
+        Document objects with text and metadata (source, page)
+    """
+    pdf_files, _ = find_source_files(data_dir)
     if not pdf_files:
         warnings.warn(f"No PDF files found in {data_dir}")
-        return []
+        return
 
-    all_documents = []
+    workers = min(_resolve_workers(workers), len(pdf_files))
 
     print(f"\nLoading {len(pdf_files)} PDF file(s)...")
-    for pdf_path in tqdm(pdf_files, desc="Loading PDFs"):
-        try:
-            # Use LangChain's PyPDFLoader
-            loader = PyPDFLoader(str(pdf_path))
-            documents = loader.load()
+    if workers == 1:
+        results = map(_load_single_pdf, pdf_files)
+        pool = None
+    else:
+        pool = multiprocessing.Pool(workers)
+        results = pool.imap(_load_single_pdf, pdf_files)
 
-            # Add source filename to metadata
-            for doc in documents:
-                doc.metadata["source"] = pdf_path.name
-                doc.metadata["source_type"] = "pdf"
+    try:
+        for pdf_path, documents, error in tqdm(results, total=len(pdf_files), desc="Loading PDFs"):
+            if error is not None:
+                warnings.warn(f"Error loading PDF {pdf_path.name}: {error}")
+                continue
 
-            all_documents.extend(documents)
             print(f"  ✓ {pdf_path.name}: {len(documents)} pages")
-
-        except Exception as e:
-            warnings.warn(f"Error loading PDF {pdf_path.name}: {e}")
-            continue
-
-    return all_documents
+            yield from documents
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
 
 
 # ============================================================================
@@ -434,85 +516,102 @@ def _transcribe_audio_with_whisper(
                 pass
 
 
-def _load_mp4s(data_dir: Path) -> List[Document]:
-    """Load all MP4 files from the data directory and transcribe audio.
+def _load_single_mp4(mp4_path: Path, data_dir: Path) -> Optional[Document]:
+    """Transcribe one MP4, or reuse its cached transcript (runs in a worker thread).
 
     Args:
-        data_dir: Directory containing MP4 files
+        mp4_path: Path of the MP4 file
+        data_dir: Data directory holding the transcript cache
 
     Returns:
-        List of Document objects with transcribed text and metadata
+        Document with the transcript, or None if processing failed
     """
-    mp4_files = list(data_dir.glob("*.mp4")) + list(data_dir.glob("*.MP4"))
-    if not mp4_files:
-        warnings.warn(f"No MP4 files found in {data_dir}")
-        return []
+    temp_audio_path = None
+    transcript = None
 
-    all_documents = []
+    try:
+        # Check for cached transcript first
+        cache_path = _get_transcript_cache_path(mp4_path, data_dir)
+        cached_transcript = _load_cached_transcript(cache_path, mp4_path)
+
+        if cached_transcript:
+            # Use cached transcript
+            print(f"\n  ✓ Using cached transcript for {mp4_path.name}")
+            transcript = cached_transcript
+        else:
+            # Need to transcribe
+            # Create temporary WAV file
+            with tempfile.NamedTemporaryFile(
+                suffix=".wav", delete=False
+            ) as temp_file:
+                temp_audio_path = Path(temp_file.name)
+
+            # Step 1: Extract audio from MP4
+            print(f"\n  Extracting audio from {mp4_path.name}...")
+            _extract_audio_from_mp4(mp4_path, temp_audio_path)
+
+            # Step 2: Transcribe with Whisper
+            print(f"  Transcribing {mp4_path.name} with Whisper...")
+            transcript = _transcribe_audio_with_whisper(
+                temp_audio_path,
+                source_filename=mp4_path.name,
+                mp4_path=mp4_path,
+                data_dir=data_dir
+            )
 
-    print(f"\nProcessing {len(mp4_files)} MP4 file(s)...")
-    for mp4_path in tqdm(mp4_files, desc="Transcribing MP4s"):
-        temp_audio_path = None
-        transcript = None
+            # Step 3: Save transcript to cache
+            _save_transcript_cache(cache_path, transcript)
+            print(f"  ✓ {mp4_path.name}: transcribed {len(transcript)} characters")
+
+        # Create Document with metadata
+        doc = Document(
+            page_content=transcript,
+            metadata={
+                "source": mp4_path.name,
+                "source_type": "mp4",
+                "transcription_length": len(transcript),
+            },
+        )
+        return doc
 
-        try:
-            # Check for cached transcript first
-            cache_path = _get_transcript_cache_path(mp4_path, data_dir)
-            cached_transcript = _load_cached_transcript(cache_path, mp4_path)
-
-            if cached_transcript:
-                # Use cached transcript
-                print(f"\n  ✓ Using cached transcript for {mp4_path.name}")
-                transcript = cached_transcript
-            else:
-                # Need to transcribe
-                # Create temporary WAV file
-                with tempfile.NamedTemporaryFile(
-                    suffix=".wav", delete=False
-                ) as temp_file:
-                    temp_audio_path = Path(temp_file.name)
-
-                # Step 1: Extract audio from MP4
-                print(f"\n  Extracting audio from {mp4_path.name}...")
-                _extract_audio_from_mp4(mp4_path, temp_audio_path)
-
-                # Step 2: Transcribe with Whisper
-                print(f"  Transcribing {mp4_path.name} with Whisper...")
-                transcript = _transcribe_audio_with_whisper(
-                    temp_audio_path,
-                    source_filename=mp4_path.name,
-                    mp4_path=mp4_path,
-                    data_dir=data_dir
-                )
+    except Exception as e:
+        warnings.warn(f"Error processing MP4 {mp4_path.name}: {e}")
+        return None
 
-                # Step 3: Save transcript to cache
-                _save_transcript_cache(cache_path, transcript)
-                print(f"  ✓ {mp4_path.name}: transcribed {len(transcript)} characters")
-
-            # Create Document with metadata
-            doc = Document(
-                page_content=transcript,
-                metadata={
-                    "source": mp4_path.name,
-                    "source_type": "mp4",
-                    "transcription_length": len(transcript),
-                },
-            )
-            all_documents.append(doc)
+    finally:
+        # Clean up temporary audio file
+        if temp_audio_path and temp_audio_path.exists():
+            try:
+                os.unlink(temp_audio_path)
+            except Exception:
+                pass
 
-        except Exception as e:
-            warnings.warn(f"Error processing MP4 {mp4_path.name}: {e}")
-            continue
 
-        finally:
-            # Clean up temporary audio file
-            if temp_audio_path and temp_audio_path.exists():
-                try:
-                    os.unlink(temp_audio_path)
-                except Exception:
-                    pass
+def _iter_mp4s(data_dir: Path, workers: Optional[int] = None) -> Iterator[Document]:
+    """Yield the transcripts of all MP4 files in the data directory.
 
-    return all_documents
+    Files are processed concurrently; documents keep directory order.
+
+    Args:
+        data_dir: Directory containing MP4 files
+        workers: Worker threads (default: LOAD_DOCUMENTS_NUM_WORKERS)
+
+    Yields:
+        Document objects with transcribed text and metadata
+    """
+    _, mp4_files = find_source_files(data_dir)
+    if not mp4_files:
+        warnings.warn(f"No MP4 files found in {data_dir}")
+        return
+
+    print(f"\nProcessing {len(mp4_files)} MP4 file(s)...")
+    # Extraction runs in ffmpeg and transcription in the Whisper API, so threads suffice
+    workers = min(_resolve_workers(workers), len(mp4_files))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="load-mp4") as pool:
+        results = pool.map(lambda mp4_path: _load_single_mp4(mp4_path, data_dir), mp4_files)
+        for doc in tqdm(results, total=len(mp4_files), desc="Transcribing MP4s"):
+            if doc is not None:
+                yield doc
 
 
 # ============================================================================
@@ -520,18 +619,15 @@ def _load_mp4s(data_dir: Path) -> List[Document]:
 # ============================================================================
 
 
-def _chunk_documents(documents: List[Document]) -> List[Document]:
-    """Split documents into smaller chunks for embedding.
+def _iter_chunks(documents: Iterable[Document]) -> Iterator[Document]:
+    """Split documents into chunks, one document at a time.
 
     Args:
-        documents: List of Document objects to chunk
+        documents: Document objects to chunk (consumed lazily)
 
-    Returns:
-        List of chunked Document objects with preserved metadata
+    Yields:
+        Chunked Document objects with preserved metadata
     """
-    if not documents:
-        return []
-
     # Use LangChain's RecursiveCharacterTextSplitter
     # Splits at natural boundaries: paragraphs, sentences, words
     text_splitter = RecursiveCharacterTextSplitter(
@@ -541,13 +637,10 @@ def _chunk_documents(documents: List[Document]) -> List[Document]:
         separators=["\n\n", "\n", ". ", " ", ""],
     )
 
-    print(f"\nChunking {len(documents)} documents...")
-    chunked_documents = []
-
     # Track global chunk counter per source file
     source_counters = {}
 
-    for doc in tqdm(documents, desc="Chunking documents"):
+    for doc in documents:
         try:
             # Split document into chunks
             chunks = text_splitter.split_documents([doc])
@@ -569,14 +662,11 @@ def _chunk_documents(documents: List[Document]) -> List[Document]:
                 # Increment global counter for this source
                 source_counters[source] += 1
 
-            chunked_documents.extend(chunks)
-
         except Exception as e:
             warnings.warn(f"Error chunking document from {doc.metadata.get('source')}: {e}")
             continue
 
-    print(f"  ✓ Created {len(chunked_documents)} chunks from {len(documents)} documents")
-    return chunked_documents
+        yield from chunks
 
 
 # ============================================================================
@@ -584,23 +674,27 @@ def _chunk_documents(documents: List[Document]) -> List[Document]:
 # ============================================================================
 
 
-def load_and_chunk_documents(data_dir: Optional[Path] = None) -> List[Document]:
-    """Main pipeline: Load PDFs and MP4s, transcribe audio, and chunk all text.
+def iter_chunked_documents(
+    data_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> Iterator[Document]:
+    """Streaming pipeline: Load PDFs and MP4s, transcribe audio, and chunk all text.
 
-    This is the primary entry point for data ingestion. It:
-    1. Loads all PDF files and extracts text
-    2. Loads all MP4 files, extracts audio, and transcribes with Whisper
-    3. Chunks all text into semantically meaningful pieces
-    4. Returns list of Document objects ready for embedding
+    Same steps as load_and_chunk_documents, but chunks are yielded as each
+    file is loaded, so a consumer such as index_documents never holds the
+    whole corpus in memory. The data directory is checked immediately; load
+    errors surface while iterating.
 
     Args:
         data_dir: Directory containing source files (default: config.DATA_DIR)
+        workers: Parallel loading workers (default: config.LOAD_DOCUMENTS_NUM_WORKERS)
 
     Returns:
-        List of chunked Document objects with metadata
+        Iterator of chunked Document objects with metadata
 
     Raises:
-        ValueError: If data directory doesn't exist or is empty
+        ValueError: If data directory doesn't exist or is empty (immediately),
+            or if no document could be loaded (after the last chunk)
     """
     # Use configured data directory if not provided
     if data_dir is None:
@@ -614,8 +708,7 @@ def load_and_chunk_documents(data_dir: Optional[Path] = None) -> List[Document]:
         )
 
     # Check for supported files
-    pdf_files = list(data_dir.glob("*.pdf"))
-    mp4_files = list(data_dir.glob("*.mp4")) + list(data_dir.glob("*.MP4"))
+    pdf_files, mp4_files = find_source_files(data_dir)
 
     if not pdf_files and not mp4_files:
         raise ValueError(
@@ -631,41 +724,69 @@ def load_and_chunk_documents(data_dir: Optional[Path] = None) -> List[Document]:
     print(f"Chunk size: {CHUNK_SIZE}, Overlap: {CHUNK_OVERLAP}")
     print("=" * 60)
 
-    all_documents = []
+    return _stream_chunks(data_dir, workers)
 
-    # Load PDFs
-    try:
-        pdf_docs = _load_pdfs(data_dir)
-        all_documents.extend(pdf_docs)
-    except Exception as e:
-        warnings.warn(f"Error loading PDFs: {e}")
 
-    # Load and transcribe MP4s
-    try:
-        mp4_docs = _load_mp4s(data_dir)
-        all_documents.extend(mp4_docs)
-    except Exception as e:
-        warnings.warn(f"Error processing MP4s: {e}")
+def _stream_chunks(data_dir: Path, workers: Optional[int]) -> Iterator[Document]:
+    """Generator behind iter_chunked_documents (runs once the data dir is checked)."""
+    stats = {"documents": 0, "chunks": 0, "chars": 0}
+
+    def _counted(documents: Iterable[Document]) -> Iterator[Document]:
+        for doc in documents:
+            stats["documents"] += 1
+            yield doc
+
+    # Load PDFs, then load and transcribe MP4s, chunking each document as it arrives
+    for iter_source, label in ((_iter_pdfs, "loading PDFs"), (_iter_mp4s, "processing MP4s")):
+        try:
+            for chunk in _iter_chunks(_counted(iter_source(data_dir, workers))):
+                stats["chunks"] += 1
+                stats["chars"] += len(chunk.page_content)
+                yield chunk
+        except Exception as e:
+            warnings.warn(f"Error {label}: {e}")
 
     # Check if we loaded any documents
-    if not all_documents:
+    if not stats["documents"]:
         raise ValueError(
             "No documents were successfully loaded. "
             "Check warnings above for errors."
         )
 
-    # Chunk all documents
-    chunked_docs = _chunk_documents(all_documents)
-
     print("\n" + "=" * 60)
     print("INGESTION COMPLETE")
     print("=" * 60)
-    print(f"Total documents loaded: {len(all_documents)}")
-    print(f"Total chunks created: {len(chunked_docs)}")
-    print(f"Average chunk size: {sum(len(d.page_content) for d in chunked_docs) / len(chunked_docs):.0f} chars")
+    print(f"Total documents loaded: {stats['documents']}")
+    print(f"Total chunks created: {stats['chunks']}")
+    print(f"Average chunk size: {stats['chars'] / max(stats['chunks'], 1):.0f} chars")
     print("=" * 60)
 
-    return chunked_docs
+
+def load_and_chunk_documents(
+    data_dir: Optional[Path] = None,
+    workers: Optional[int] = None,
+) -> List[Document]:
+    """Main pipeline: Load PDFs and MP4s, transcribe audio, and chunk all text.
+
+    This is the primary entry point for data ingestion. It:
+    1. Loads all PDF files and extracts text
+    2. Loads all MP4 files, extracts audio, and transcribes with Whisper
+    3. Chunks all text into semantically meaningful pieces
+    4. Returns list of Document objects ready for embedding
+
+    Use iter_chunked_documents to process chunks without holding them all.
+
+    Args:
+        data_dir: Directory containing source files (default: config.DATA_DIR)
+        workers: Parallel loading workers (default: config.LOAD_DOCUMENTS_NUM_WORKERS)
+
+    Returns:
+        List of chunked Document objects with metadata
+
+    Raises:
+        ValueError: If data directory doesn't exist or is empty
+    """
+    return list(iter_chunked_documents(data_dir, workers))
 
 
 # ============================================================================
@@ -6,22 +6,29 @@ This module handles ChromaDB vector database operations including:
 - Performing similarity search for query retrieval
 """
 
+import itertools
+import threading
 import warnings
-from typing import List, Optional, Dict, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 from pathlib import Path
 
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from langchain_core.documents import Document
 from tqdm import tqdm
 
+from rag.collections import bump_index_version, hnsw_configuration, index_version  # noqa: F401
 from rag.config import CHROMA_DB_DIR, TOP_K
-from rag.embeddings import embed_texts, embed_query
+from rag.embeddings import embed_texts, embed_texts_cached, embed_query
+from rag.source_index import register_sources, has_sources, clear_sources, match_sources
 
 
 # Global ChromaDB client (lazy initialization)
 # Note: We no longer cache collections globally to support multiple collections
 _chroma_client = None
+_chroma_client_lock = threading.Lock()
 
 
 def _get_chroma_client() -> chromadb.Client:
@@ -32,25 +39,34 @@ def _get_chroma_client() -> chromadb.Client:
     """
     global _chroma_client
     if _chroma_client is None:
-        # Ensure ChromaDB directory exists
-        CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
-
-        # Create persistent client
-        _chroma_client = chromadb.PersistentClient(
-            path=str(CHROMA_DB_DIR),
-            settings=Settings(
-                anonymized_telemetry=False,
-                allow_reset=True,
-            ),
-        )
+        # Retrieval may run on worker threads; create the client only once
+        with _chroma_client_lock:
+            if _chroma_client is None:
+                # Ensure ChromaDB directory exists
+                CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
+
+                # Create persistent client
+                _chroma_client = chromadb.PersistentClient(
+                    path=str(CHROMA_DB_DIR),
+                    settings=Settings(
+                        anonymized_telemetry=False,
+                        allow_reset=True,
+                    ),
+                )
     return _chroma_client
 
 
-def _get_collection(collection_name: str = "ai_academy_course") -> chromadb.Collection:
+def _get_collection(
+    collection_name: str = "ai_academy_course",
+    hnsw_m: Optional[int] = None,
+    hnsw_ef: Optional[int] = None,
+) -> chromadb.Collection:
     """Get or create a ChromaDB collection.
 
     Args:
         collection_name: Name of the collection (default: "ai_academy_course")
+        hnsw_m: HNSW neighbors per vector if the collection is created (default: HNSW_M)
+        hnsw_ef: HNSW construction ef if the collection is created (default: HNSW_CONSTRUCTION_EF)
 
     Returns:
         chromadb.Collection: The requested collection
@@ -62,6 +78,7 @@ def _get_collection(collection_name: str = "ai_academy_course") -> chromadb.Coll
     # We'll provide embeddings directly when adding documents
     collection = client.get_or_create_collection(
         name=collection_name,
+        configuration=hnsw_configuration(m=hnsw_m, construction_ef=hnsw_ef),
         metadata={"description": f"Collection: {collection_name}"}
     )
     return collection
@@ -93,11 +110,17 @@ def get_collection_stats(collection_name: str = "ai_academy_course") -> Dict[str
     }
 
 
-def clear_index(collection_name: str = "ai_academy_course") -> None:
+def clear_index(
+    collection_name: str = "ai_academy_course",
+    hnsw_m: Optional[int] = None,
+    hnsw_ef: Optional[int] = None,
+) -> None:
     """Delete all documents from a collection (for rebuilding index).
 
     Args:
         collection_name: Name of the collection to clear (default: "ai_academy_course")
+        hnsw_m: HNSW neighbors per vector of the recreated collection (default: HNSW_M)
+        hnsw_ef: HNSW construction ef of the recreated collection (default: HNSW_CONSTRUCTION_EF)
 
     Warning:
         This operation is irreversible. All indexed documents will be removed.
@@ -107,10 +130,12 @@ def clear_index(collection_name: str = "ai_academy_course") -> None:
     try:
         # Delete the collection
         client.delete_collection(name=collection_name)
+        clear_sources(collection_name)
+        bump_index_version()
         print(f"✓ Deleted collection '{collection_name}'")
 
         # Recreate empty collection
-        _get_collection(collection_name)
+        _get_collection(collection_name, hnsw_m=hnsw_m, hnsw_ef=hnsw_ef)
         print(f"✓ Created new empty collection '{collection_name}'")
 
     except Exception as e:
@@ -118,10 +143,12 @@ def clear_index(collection_name: str = "ai_academy_course") -> None:
 
 
 def index_documents(
-    documents: List[Document],
+    documents: Iterable[Document],
     collection_name: str = "ai_academy_course",
-    batch_size: int = 100,
+    batch_size: int = 128,
     show_progress: bool = True,
+    hnsw_m: Optional[int] = None,
+    hnsw_ef: Optional[int] = None,
 ) -> None:
     """Index documents into ChromaDB with embeddings.
 
@@ -132,10 +159,13 @@ def index_documents(
     4. Is idempotent (skips already indexed documents)
 
     Args:
-        documents: List of Document objects to index
+        documents: Document objects to index; any iterable works and is consumed
+            one batch at a time (e.g. rag.loaders.iter_chunked_documents)
         collection_name: Name of the collection to index into (default: "ai_academy_course")
-        batch_size: Number of documents to process per batch (default: 100)
+        batch_size: Chunks embedded per API call and added per ChromaDB write (default: 128)
         show_progress: Whether to show progress bar (default: True)
+        hnsw_m: HNSW neighbors per vector if the collection is created (default: HNSW_M)
+        hnsw_ef: HNSW construction ef if the collection is created (default: HNSW_CONSTRUCTION_EF)
 
     Raises:
         ValueError: If documents list is empty
@@ -149,10 +179,13 @@ def index_documents(
         Generating embeddings: 100%|████████| 150/150
         ✓ Indexed 150 documents
     """
-    if not documents:
+    documents = iter(documents)
+    first = next(documents, None)
+    if first is None:
         raise ValueError("Cannot index empty document list")
+    documents = itertools.chain([first], documents)
 
-    collection = _get_collection(collection_name)
+    collection = _get_collection(collection_name, hnsw_m=hnsw_m, hnsw_ef=hnsw_ef)
 
     # Get existing document IDs to avoid duplicates
     existing_ids = set()
@@ -165,24 +198,28 @@ def index_documents(
     except Exception as e:
         warnings.warn(f"Could not fetch existing IDs: {e}")
 
-    # Filter out documents that are already indexed
-    new_documents = []
-    for doc in documents:
-        doc_id = doc.metadata.get("chunk_id", f"doc_{len(new_documents)}")
-        if doc_id not in existing_ids:
-            new_documents.append(doc)
-
-    if not new_documents:
-        print("✓ All documents already indexed, nothing to do")
-        return
-
-    print(f"\nIndexing {len(new_documents)} new documents (skipping {len(documents) - len(new_documents)} existing)...")
-
-    # Process in batches
-    total_batches = (len(new_documents) + batch_size - 1) // batch_size
+    counts = {"seen": 0, "new": 0}
+
+    def _new_batches() -> Iterator[List[Document]]:
+        # Filter out documents that are already indexed. Blank chunks are dropped
+        # too: embed_texts would skip them and misalign a batch's ids and vectors
+        batch = []
+        for doc in documents:
+            counts["seen"] += 1
+            doc_id = doc.metadata.get("chunk_id", f"doc_{counts['new']}")
+            if doc_id in existing_ids or not doc.page_content.strip():
+                continue
+            counts["new"] += 1
+            batch.append(doc)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    print("\nIndexing new documents (skipping existing or empty)...")
 
     progress_bar = tqdm(
-        total=len(new_documents),
         desc="Indexing documents",
         disable=not show_progress,
         unit="doc",
@@ -190,10 +227,35 @@ def index_documents(
 
     indexed_count = 0
 
-    for batch_idx in range(total_batches):
+    def _write_batch(ids, embeddings, texts, metadatas) -> int:
+        collection.add(
+            ids=ids,
+            embeddings=embeddings,
+            documents=texts,
+            metadatas=metadatas,
+        )
+        bump_index_version()
+        register_sources(collection_name, (m.get("source", "unknown") for m in metadatas))
+        return len(ids)
+
+    def _finish_write(batch_idx: int, write: Future) -> None:
+        nonlocal indexed_count
+        try:
+            written = write.result()
+        except Exception as e:
+            warnings.warn(f"Error indexing batch {batch_idx + 1}: {e}")
+            return
+        indexed_count += written
+        progress_bar.update(written)
+
+    # ChromaDB writes run on one background thread, so the embedding call for
+    # the next batch overlaps the write of the current one. At most one write
+    # is in flight, which keeps memory bounded and batches in order.
+    writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chroma-write")
+    pending = None
+
+    for batch_idx, batch in enumerate(_new_batches()):
         start_idx = batch_idx * batch_size
-        end_idx = min(start_idx + batch_size, len(new_documents))
-        batch = new_documents[start_idx:end_idx]
 
         try:
             # Extract data from documents
@@ -214,27 +276,29 @@ def index_documents(
                 }
                 metadatas.append(metadata)
 
-            # Generate embeddings for batch
-            embeddings = embed_texts(texts)
-
-            # Add to ChromaDB
-            collection.add(
-                ids=ids,
-                embeddings=embeddings,
-                documents=texts,
-                metadatas=metadatas,
-            )
-
-            indexed_count += len(batch)
-            progress_bar.update(len(batch))
+            # Generate embeddings for batch (unchanged chunks come from the cache)
+            embeddings = embed_texts_cached(texts)
 
         except Exception as e:
-            warnings.warn(f"Error indexing batch {batch_idx + 1}/{total_batches}: {e}")
+            warnings.warn(f"Error indexing batch {batch_idx + 1}: {e}")
             continue
 
+        # Wait for the previous batch, then hand this one to the writer
+        if pending is not None:
+            _finish_write(*pending)
+        pending = (batch_idx, writer.submit(_write_batch, ids, embeddings, texts, metadatas))
+
+    if pending is not None:
+        _finish_write(*pending)
+    writer.shutdown()
     progress_bar.close()
 
-    print(f"✓ Successfully indexed {indexed_count}/{len(new_documents)} new documents")
+    if not counts["new"]:
+        print("✓ All documents already indexed, nothing to do")
+        return
+
+    print(f"✓ Successfully indexed {indexed_count}/{counts['new']} new documents "
+          f"(skipped {counts['seen'] - counts['new']} existing or empty)")
     print(f"✓ Total documents in index: {collection.count()}")
 
 
@@ -243,6 +307,8 @@ def retrieve_relevant_chunks(
     collection_name: str = "ai_academy_course",
     top_k: Optional[int] = None,
     min_score: Optional[float] = None,
+    query_embedding: Optional[Union[List[float], np.ndarray]] = None,
+    sources: Optional[List[str]] = None,
 ) -> List[Document]:
     """Retrieve the most relevant document chunks for a query.
 
@@ -254,6 +320,10 @@ def retrieve_relevant_chunks(
         collection_name: Name of the collection to search (default: "ai_academy_course")
         top_k: Number of results to return (default: from config)
         min_score: Minimum similarity score threshold (optional)
+        query_embedding: Precomputed embedding of `query` (optional). Lets callers
+            searching several collections embed the query only once; passing it
+            as a float32 array also saves ChromaDB converting the list per query.
+        sources: Only search chunks from these source documents (optional)
 
     Returns:
         List of Document objects with relevance scores in metadata
@@ -285,51 +355,167 @@ def retrieve_relevant_chunks(
         )
 
     try:
-        # Generate query embedding
-        query_embedding = embed_query(query)
+        # Generate query embedding unless the caller already has one
+        if query_embedding is None:
+            query_embedding = embed_query(query)
 
         # Perform similarity search
         results = collection.query(
             query_embeddings=[query_embedding],
             n_results=top_k,
+            where={"source": {"$in": sources}} if sources else None,
             include=["documents", "metadatas", "distances"],
         )
 
-        # Convert results to Document objects
-        documents = []
+        return _to_documents(results, 0, min_score)
 
-        # ChromaDB returns results in nested lists
-        if results["ids"] and results["ids"][0]:
-            for idx in range(len(results["ids"][0])):
-                doc_text = results["documents"][0][idx]
-                doc_metadata = results["metadatas"][0][idx]
-                distance = results["distances"][0][idx]
+    except Exception as e:
+        raise Exception(f"Error retrieving documents: {e}")
 
-                # Convert distance to similarity score (lower distance = higher similarity)
-                # For cosine distance, similarity = 1 - distance
-                # ChromaDB uses squared L2 distance by default
-                similarity_score = 1.0 / (1.0 + distance)
 
-                # Apply minimum score filter if specified
-                if min_score is not None and similarity_score < min_score:
-                    continue
+def retrieve_relevant_chunks_batch(
+    queries: List[str],
+    collection_name: str = "ai_academy_course",
+    top_k: Optional[Union[int, Sequence[int]]] = None,
+    min_score: Optional[float] = None,
+) -> List[List[Document]]:
+    """Retrieve the most relevant document chunks for several queries at once.
 
-                # Add score to metadata
-                doc_metadata["score"] = similarity_score
-                doc_metadata["distance"] = distance
+    All queries are embedded in one API call and searched with one
+    ChromaDB query over the whole embedding matrix. With a per-query
+    top_k the query asks for the largest one and each row is cut to its
+    own limit.
 
-                doc = Document(
-                    page_content=doc_text,
-                    metadata=doc_metadata,
-                )
-                documents.append(doc)
+    Args:
+        queries: User questions or search queries
+        collection_name: Name of the collection to search (default: "ai_academy_course")
+        top_k: Number of results, for all queries or one per query (default: from config)
+        min_score: Minimum similarity score threshold (optional)
+
+    Returns:
+        One list of Document objects per query, in query order
+
+    Raises:
+        ValueError: If a query is empty, top_k doesn't match the queries or index is empty
+        Exception: If retrieval fails
+    """
+    if not queries:
+        return []
+    if any(not query or not query.strip() for query in queries):
+        raise ValueError("Query cannot be empty")
+
+    if top_k is None:
+        top_k = TOP_K
+    if isinstance(top_k, int):
+        limits = [top_k] * len(queries)
+    else:
+        limits = list(top_k)
+        if len(limits) != len(queries):
+            raise ValueError(f"Got {len(limits)} top_k values for {len(queries)} queries")
+
+    collection = _get_collection(collection_name)
+
+    # Check if collection is empty
+    if collection.count() == 0:
+        raise ValueError(
+            f"Collection '{collection_name}' is empty. Please run index building first:\n"
+            "  python -m scripts.build_index build"
+        )
+
+    try:
+        # Each distinct query is embedded once, all in the same request
+        distinct = list(dict.fromkeys(queries))
+        vectors = dict(zip(distinct, embed_texts(distinct)))
+        query_embeddings = np.asarray([vectors[query] for query in queries], dtype=np.float32)
+
+        results = collection.query(
+            query_embeddings=query_embeddings,
+            n_results=max(limits),
+            include=["documents", "metadatas", "distances"],
+        )
 
-        return documents
+        return [
+            _to_documents(results, row, min_score, limit=limit)
+            for row, limit in enumerate(limits)
+        ]
 
     except Exception as e:
         raise Exception(f"Error retrieving documents: {e}")
 
 
+def _to_documents(
+    results: Dict[str, Any],
+    row: int,
+    min_score: Optional[float],
+    limit: Optional[int] = None,
+) -> List[Document]:
+    """Convert one query's row of a ChromaDB query result to scored Documents.
+
+    Args:
+        results: Return value of collection.query
+        row: Index of the query in the results
+        min_score: Minimum similarity score threshold (optional)
+        limit: Use only the first `limit` hits of the row (optional)
+
+    Returns:
+        List of Document objects with relevance scores in metadata
+    """
+    documents = []
+
+    # ChromaDB returns results in nested lists, one per query
+    if results["ids"] and results["ids"][row]:
+        hits = len(results["ids"][row])
+        if limit is not None:
+            hits = min(hits, limit)
+        for idx in range(hits):
+            doc_text = results["documents"][row][idx]
+            doc_metadata = results["metadatas"][row][idx]
+            distance = results["distances"][row][idx]
+
+            # Convert distance to similarity score (lower distance = higher similarity)
+            # For cosine distance, similarity = 1 - distance
+            # ChromaDB uses squared L2 distance by default
+            similarity_score = 1.0 / (1.0 + distance)
+
+            # Apply minimum score filter if specified
+            if min_score is not None and similarity_score < min_score:
+                continue
+
+            # Add score to metadata
+            doc_metadata["score"] = similarity_score
+            doc_metadata["distance"] = distance
+
+            doc = Document(
+                page_content=doc_text,
+                metadata=doc_metadata,
+            )
+            documents.append(doc)
+
+    return documents
+
+
+def select_sources(query: str, collection_name: str = "ai_academy_course") -> List[str]:
+    """Pick the source documents to search for a query (first retrieval level).
+
+    Collections indexed before the source catalog existed are registered on
+    first use from their stored chunk metadata.
+
+    Args:
+        query: User's question or search query
+        collection_name: Name of the collection to search
+
+    Returns:
+        Matching source file names, or an empty list to search everything
+    """
+    if not has_sources(collection_name):
+        stored = _get_collection(collection_name).get(include=["metadatas"])
+        register_sources(
+            collection_name,
+            (m.get("source", "unknown") for m in stored["metadatas"] or []),
+        )
+    return match_sources(collection_name, query)
+
+
 def format_retrieved_chunks(documents: List[Document], include_scores: bool = False) -> str:
     """Format retrieved chunks for display or LLM input.
 
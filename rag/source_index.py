@@ -0,0 +1,153 @@
+"""Source catalog for two-level retrieval.
+
+This module keeps a small SQLite FTS5 index of the source documents in each
+collection (one row per PDF/transcript, keyed by its file name). Retrieval
+first ranks sources against the query with BM25 and then restricts the
+vector search to chunks from the best matching sources:
+- Queries naming a week, lesson or document search only those files
+- Queries with no matching title fall back to searching the whole collection
+
+The catalog is populated at indexing time and lives next to the ChromaDB
+storage, so it is rebuilt together with the index.
+"""
+
+import re
+import sqlite3
+import threading
+from typing import Iterable, List
+
+from rag.config import CHROMA_DB_DIR
+
+# Number of source documents the vector search is narrowed to
+MAX_MATCHED_SOURCES = 5
+
+# Words too common in questions to say anything about which document is meant
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "about", "can", "course", "did", "do", "does",
+    "explain", "for", "from", "how", "in", "is", "it", "learn", "me", "of",
+    "on", "or", "tell", "the", "to", "was", "what", "when", "where", "which",
+    "who", "why", "with", "you",
+})
+
+_conn = None
+_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """Get or create the catalog connection (lazy initialization).
+
+    Returns:
+        sqlite3.Connection: Connection with the catalog table created
+    """
+    global _conn
+    if _conn is None:
+        CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
+        _conn = sqlite3.connect(
+            str(CHROMA_DB_DIR / "source_catalog.db"), check_same_thread=False
+        )
+        _conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS sources "
+            "USING fts5(collection UNINDEXED, source UNINDEXED, title)"
+        )
+    return _conn
+
+
+def _title_terms(text: str) -> List[str]:
+    """Split text into lowercase search terms.
+
+    Letter/digit boundaries are split too, so "week3-rag.pdf" and
+    "week 3 RAG" produce the same terms.
+
+    Args:
+        text: File name or query text
+
+    Returns:
+        List of terms
+    """
+    return re.findall(r"[a-z]+|\d+", text.lower())
+
+
+def register_sources(collection_name: str, sources: Iterable[str]) -> None:
+    """Add source documents to the catalog (already known sources are skipped).
+
+    Args:
+        collection_name: Collection the sources were indexed into
+        sources: Source file names (the chunks' "source" metadata)
+    """
+    with _lock:
+        conn = _get_connection()
+        known = {
+            row[0] for row in conn.execute(
+                "SELECT source FROM sources WHERE collection = ?", (collection_name,)
+            )
+        }
+        new_rows = [
+            (collection_name, source, " ".join(_title_terms(source)))
+            for source in set(sources) - known
+        ]
+        if new_rows:
+            conn.executemany(
+                "INSERT INTO sources (collection, source, title) VALUES (?, ?, ?)",
+                new_rows,
+            )
+            conn.commit()
+
+
+def has_sources(collection_name: str) -> bool:
+    """Check whether the catalog has any sources for a collection.
+
+    Args:
+        collection_name: Name of the collection
+
+    Returns:
+        True if at least one source is registered
+    """
+    with _lock:
+        row = _get_connection().execute(
+            "SELECT 1 FROM sources WHERE collection = ? LIMIT 1", (collection_name,)
+        ).fetchone()
+    return row is not None
+
+
+def clear_sources(collection_name: str) -> None:
+    """Remove all catalog entries of a collection.
+
+    Args:
+        collection_name: Name of the collection being cleared
+    """
+    with _lock:
+        conn = _get_connection()
+        conn.execute("DELETE FROM sources WHERE collection = ?", (collection_name,))
+        conn.commit()
+
+
+def match_sources(
+    collection_name: str,
+    query: str,
+    limit: int = MAX_MATCHED_SOURCES,
+) -> List[str]:
+    """Rank a collection's source documents against a query.
+
+    Args:
+        collection_name: Name of the collection to search
+        query: User's question or search query
+        limit: Maximum number of sources to return
+
+    Returns:
+        Source file names ordered by BM25 relevance; empty if no title matches
+    """
+    terms = [term for term in _title_terms(query) if term not in _STOPWORDS]
+    if not terms:
+        return []
+
+    # Quote every term so FTS5 treats it literally; any term may match
+    match_expr = " OR ".join(f'"{term}"' for term in dict.fromkeys(terms))
+
+    with _lock:
+        rows = _get_connection().execute(
+            "SELECT source FROM sources "
+            "WHERE sources MATCH ? AND collection = ? "
+            "ORDER BY bm25(sources) LIMIT ?",
+            (f"title : ({match_expr})", collection_name, limit),
+        ).fetchall()
+    return [row[0] for row in rows]
@@ -19,8 +19,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from rag.config import DATA_DIR, CHROMA_DB_DIR, print_config
-from rag.loaders import load_and_chunk_documents
+from rag.config import DATA_DIR, CHROMA_DB_DIR, configure, print_config
+from rag.loaders import find_source_files, iter_chunked_documents
 from rag.retriever import index_documents, get_collection_stats, clear_index
 from rag.collections import get_all_stats
 
@@ -55,6 +55,28 @@ def build(
         "-d",
         help="Override data directory path"
     ),
+    batch_size: int = typer.Option(
+        128,
+        "--batch-size",
+        "-b",
+        help="Chunks embedded per API call and written per ChromaDB add"
+    ),
+    workers: int = typer.Option(
+        0,
+        "--workers",
+        "-w",
+        help="Parallel document loaders (0 = LOAD_DOCUMENTS_NUM_WORKERS, or CPUs - 1)"
+    ),
+    hnsw_m: int = typer.Option(
+        0,
+        "--hnsw-m",
+        help="HNSW neighbors per vector for a new collection (0 = HNSW_M)"
+    ),
+    hnsw_ef: int = typer.Option(
+        0,
+        "--hnsw-ef",
+        help="HNSW construction ef for a new collection (0 = HNSW_CONSTRUCTION_EF)"
+    ),
 ) -> None:
     """Build or update the document index.
 
@@ -90,8 +112,7 @@ def build(
         sys.exit(1)
 
     # Check for files
-    pdf_files = list(data_path.glob("*.pdf"))
-    mp4_files = list(data_path.glob("*.mp4")) + list(data_path.glob("*.MP4"))
+    pdf_files, mp4_files = find_source_files(data_path)
 
     if not pdf_files and not mp4_files:
         console.print(f"\n[red]Error: No PDF or MP4 files found in {data_path}[/red]")
@@ -105,37 +126,38 @@ def build(
     if rebuild:
         console.print("\n[yellow]Clearing existing collection...[/yellow]")
         try:
-            clear_index(collection)
+            clear_index(collection, hnsw_m=hnsw_m, hnsw_ef=hnsw_ef)
         except Exception as e:
             console.print(f"[red]Error clearing index: {e}[/red]")
             sys.exit(1)
 
-    # Step 1: Load and chunk documents
-    console.print("\n[bold cyan]Step 1: Loading and chunking documents[/bold cyan]")
+    # Step 1: Load and chunk documents, streamed into embedding and indexing
+    # so the whole corpus is never held in memory
+    console.print("\n[bold cyan]Step 1: Loading, chunking and indexing documents[/bold cyan]")
     try:
-        documents = load_and_chunk_documents(data_path)
+        documents = iter_chunked_documents(data_path, workers=workers)
     except Exception as e:
         console.print(f"\n[red]Error loading documents: {e}[/red]")
         import traceback
         traceback.print_exc()
         sys.exit(1)
 
-    if not documents:
-        console.print("[red]No documents were loaded. Exiting.[/red]")
-        sys.exit(1)
-
-    # Step 2: Generate embeddings and index
-    console.print("\n[bold cyan]Step 2: Generating embeddings and indexing[/bold cyan]")
     try:
-        index_documents(documents, collection_name=collection)
+        index_documents(
+            documents,
+            collection_name=collection,
+            batch_size=max(1, batch_size),
+            hnsw_m=hnsw_m,
+            hnsw_ef=hnsw_ef,
+        )
     except Exception as e:
         console.print(f"\n[red]Error indexing documents: {e}[/red]")
         import traceback
         traceback.print_exc()
         sys.exit(1)
 
-    # Step 3: Show final statistics
-    console.print("\n[bold cyan]Step 3: Index Statistics[/bold cyan]")
+    # Step 2: Show final statistics
+    console.print("\n[bold cyan]Step 2: Index Statistics[/bold cyan]")
     try:
         stats = get_collection_stats(collection)
         _display_stats(stats)
@@ -252,6 +274,7 @@ def stats(
 
 def main() -> None:
     """Entry point for the index builder."""
+    configure()
     app()
 
 
@@ -19,6 +19,8 @@ Usage:
     python -m scripts.demo social --save post.txt
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -28,12 +30,27 @@ from rich.markdown import Markdown
 from typing import Optional
 import time
 
-from agent.orchestrator import AgentOrchestrator
-from agent.social_post import SocialPostGenerator
+from rag.config import configure
 
 app = typer.Typer(help="🤖 AI Academy Agent Demo")
 console = Console()
 
+# Created on first use and shared by every command run in this process
+_orchestrator = None
+
+
+def _get_orchestrator():
+    """Get or create the agent orchestrator (lazy initialization)
+
+    The agent (openai, chromadb, langchain) is only imported here, so --help
+    and shell completion start instantly.
+    """
+    global _orchestrator
+    if _orchestrator is None:
+        from agent.orchestrator import AgentOrchestrator
+        _orchestrator = AgentOrchestrator()
+    return _orchestrator
+
 
 def display_sources(state):
     """Display retrieved sources in a formatted table"""
@@ -124,7 +141,7 @@ def ask(
     console.print(f"\n[bold]Your question:[/bold] {query}\n")
 
     # Initialize agent
-    orchestrator = AgentOrchestrator()
+    orchestrator = _get_orchestrator()
 
     # Run agent with progress indicator
     with Progress(
@@ -177,7 +194,7 @@ def interactive():
         border_style="cyan"
     ))
 
-    orchestrator = AgentOrchestrator()
+    orchestrator = _get_orchestrator()
 
     while True:
         console.print()
@@ -259,27 +276,37 @@ def examples():
     choice = typer.prompt("\nSelect example", type=int, default=1)
 
     if choice == 5:
-        # Run all
-        orchestrator = AgentOrchestrator()
-        for i, ex in enumerate(examples_list, 1):
-            console.print(f"\n{'='*60}")
-            console.print(f"[bold]Example {i}: {ex['name']}[/bold]")
-            console.print(f"[dim]{ex['description']}[/dim]")
-            console.print(f"{'='*60}\n")
-            console.print(f"[bold cyan]Query:[/bold cyan] {ex['query']}\n")
-
-            state = orchestrator.run(ex["query"], verbose=True)
-
-            console.print("\n[bold green]Answer:[/bold green]")
-            md = Markdown(state.current_answer)
-            console.print(md)
-            console.print(f"\n[dim]Confidence: {state.confidence_score:.2f} | "
-                          f"Attempts: {state.total_attempts} | "
-                          f"Revisions: {state.iteration}[/dim]")
-
-            if i < len(examples_list):
-                if not typer.confirm("\nContinue to next example?", default=True):
-                    break
+        # Run all: the examples are independent and wait on the API most of
+        # the time, so they run concurrently and are shown as each finishes
+        # (verbose traces would interleave, so they are off)
+        orchestrator = _get_orchestrator()
+        console.print(f"\n[dim]Running {len(examples_list)} examples concurrently...[/dim]")
+        with ThreadPoolExecutor(max_workers=len(examples_list)) as pool:
+            futures = {
+                pool.submit(orchestrator.run, ex["query"], verbose=False): i
+                for i, ex in enumerate(examples_list, 1)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                ex = examples_list[i - 1]
+                console.print(f"\n{'='*60}")
+                console.print(f"[bold]Example {i}: {ex['name']}[/bold]")
+                console.print(f"[dim]{ex['description']}[/dim]")
+                console.print(f"{'='*60}\n")
+                console.print(f"[bold cyan]Query:[/bold cyan] {ex['query']}\n")
+
+                try:
+                    state = future.result()
+                except Exception as e:
+                    console.print(f"[red]Error: {e}[/red]")
+                    continue
+
+                console.print("\n[bold green]Answer:[/bold green]")
+                md = Markdown(state.current_answer)
+                console.print(md)
+                console.print(f"\n[dim]Confidence: {state.confidence_score:.2f} | "
+                              f"Attempts: {state.total_attempts} | "
+                              f"Revisions: {state.iteration}[/dim]")
 
     elif 1 <= choice <= len(examples_list):
         # Run selected example
@@ -288,7 +315,7 @@ def examples():
         console.print(f"[dim]{ex['description']}[/dim]\n")
         console.print(f"[bold cyan]Query:[/bold cyan] {ex['query']}\n")
 
-        orchestrator = AgentOrchestrator()
+        orchestrator = _get_orchestrator()
         state = orchestrator.run(ex["query"], verbose=True)
 
         console.print("\n[bold green]Answer:[/bold green]")
@@ -313,7 +340,7 @@ def workflow(
 
     console.print(f"\n[bold]Query:[/bold] {query}\n")
 
-    orchestrator = AgentOrchestrator()
+    orchestrator = _get_orchestrator()
 
     # Run with verbose
     console.print("[bold blue]Starting workflow...[/bold blue]\n")
@@ -329,13 +356,16 @@ def workflow(
     steps_table.add_column("Type", style="green")
     steps_table.add_column("Summary", style="white")
 
-    for step in state.reasoning_steps:
-        summary = step.content[:60] + "..." if len(step.content) > 60 else step.content
-        steps_table.add_row(
+    rows = [
+        (
             str(step.step_number),
             step.step_type,
-            summary
+            step.content[:60] + "..." if len(step.content) > 60 else step.content
         )
+        for step in state.reasoning_steps
+    ]
+    for row in rows:
+        steps_table.add_row(*row)
 
     console.print(steps_table)
 
@@ -372,15 +402,15 @@ def stats():
     console.print("\n[bold]Knowledge Base Collections:[/bold]\n")
 
     try:
-        collection_names = collections.list_collections()
+        # One listing, counts read concurrently (no lookup per collection name)
+        all_stats = collections.get_all_stats()
 
-        if collection_names:
+        if all_stats:
             table = Table()
             table.add_column("Collection", style="cyan")
             table.add_column("Documents", style="green")
 
-            for collection_name in collection_names:
-                stats = collections.get_collection_stats(collection_name)
+            for collection_name, stats in all_stats.items():
                 doc_count = stats.get("count", 0)
                 table.add_row(collection_name, str(doc_count))
 
@@ -402,7 +432,7 @@ def stats():
 
     for tool_name in registry.list_tools():
         tool = registry.get_tool(tool_name)
-        tools_table.add_row(tool_name, tool.category.value if hasattr(tool, 'category') else "N/A")
+        tools_table.add_row(tool_name, tool.category.label if hasattr(tool, 'category') else "N/A")
 
     console.print(tools_table)
 
@@ -429,6 +459,7 @@ def social(
         border_style="cyan"
     ))
 
+    from agent.social_post import SocialPostGenerator
     generator = SocialPostGenerator()
 
     # Generate post
@@ -465,4 +496,5 @@ def social(
 
 
 if __name__ == "__main__":
+    configure()
     app()
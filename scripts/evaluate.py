@@ -11,8 +11,12 @@ Usage:
     python -m scripts.evaluate
     python -m scripts.evaluate --verbose
     python -m scripts.evaluate --output evaluation/reports/custom.json
+    python -m scripts.evaluate --batch
 """
 
+import logging
+
+import orjson
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -20,6 +24,7 @@ from rich.panel import Panel
 from pathlib import Path
 
 from evaluation.evaluator import EvaluationRunner
+from rag.config import EVAL_CONCURRENCY, EVAL_JUDGE_BATCH_SIZE, configure
 
 app = typer.Typer(help="Agent Evaluation Runner")
 console = Console()
@@ -30,7 +35,12 @@ def run(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output during evaluation"),
     save: bool = typer.Option(True, "--save/--no-save", help="Save results to file"),
     output: str = typer.Option(None, "--output", "-o", help="Custom output file path"),
-    dataset: str = typer.Option(None, "--dataset", "-d", help="Custom test queries JSON file")
+    compact: bool = typer.Option(False, "--compact", help="Save results without indentation (smaller, faster)"),
+    dataset: str = typer.Option(None, "--dataset", "-d", help="Custom test queries JSON file"),
+    batch: bool = typer.Option(False, "--batch", "-b", help="Generate answers via the OpenAI Batch API (50% cheaper, up to 24h per round)"),
+    concurrency: int = typer.Option(EVAL_CONCURRENCY, "--concurrency", "-c", help="Queries evaluated concurrently"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse judge results for answers judged before"),
+    judge_batch_size: int = typer.Option(EVAL_JUDGE_BATCH_SIZE, "--judge-batch-size", "-k", help="Answers scored per judge call")
 ):
     """Run agent evaluation on test queries"""
 
@@ -40,12 +50,20 @@ def run(
         border_style="blue"
     ))
 
+    # Per-query detail is logged; without --verbose only the progress bar shows
+    logging.getLogger("eval").setLevel(logging.INFO if verbose else logging.WARNING)
+
     # Initialize runner
-    runner = EvaluationRunner(test_queries_path=dataset)
+    runner = EvaluationRunner(test_queries_path=dataset, use_cache=cache)
 
     # Run evaluation
     console.print("\n[yellow]Running evaluation...[/yellow]")
-    results = runner.run_evaluation(verbose=verbose)
+    if batch:
+        results = runner.run_batch_evaluation()
+    else:
+        results = runner.run_evaluation(
+            verbose=verbose, concurrency=concurrency, judge_batch_size=judge_batch_size
+        )
 
     # Display summary
     summary = results["summary"]
@@ -105,7 +123,7 @@ def run(
 
     # Save results
     if save:
-        output_path = runner.save_results(results, output_path=output)
+        output_path = runner.save_results(results, output_path=output, human=not compact)
         console.print(f"\n[green]✓ Results saved to:[/green] {output_path}")
 
     console.print("\n[bold green]✅ Evaluation complete![/bold green]")
@@ -121,9 +139,8 @@ def show(
         console.print(f"[red]Error: Report file not found: {report}[/red]")
         raise typer.Exit(code=1)
 
-    import json
-    with open(report, 'r') as f:
-        results = json.load(f)
+    # Reports carry every query's reasoning trace; parse them in one bulk read
+    results = orjson.loads(Path(report).read_bytes())
 
     summary = results.get("summary", {})
     timestamp = results.get("timestamp", "Unknown")
@@ -150,4 +167,5 @@ def show(
 
 
 if __name__ == "__main__":
+    configure()
     app()
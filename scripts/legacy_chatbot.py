@@ -18,7 +18,7 @@ from typing import Dict, List, Optional
 import typer
 from openai import OpenAI
 
-from rag.config import OPENAI_API_KEY, GPT_MODEL, TOP_K, DATA_DIR, CHROMA_DB_DIR
+from rag.config import OPENAI_API_KEY, GPT_MODEL, TOP_K, DATA_DIR, CHROMA_DB_DIR, configure
 from rag.retriever import retrieve_relevant_chunks
 from rag.prompts import build_messages
 
@@ -500,4 +500,5 @@ def _test_generate_answer():
 
 if __name__ == "__main__":
     # Run CLI app
+    configure()
     app()
@@ -0,0 +1,148 @@
+"""
+Test evaluation rate limiting
+"""
+import asyncio
+import logging
+from types import SimpleNamespace
+
+import evaluation.rate_limit as rate_limit_module
+from evaluation.rate_limit import (
+    EXPECTED_COMPLETION_TOKENS,
+    TOKENS_PER_MESSAGE,
+    AsyncRateLimiter,
+    estimate_tokens
+)
+
+log = logging.getLogger(__name__)
+
+
+def _run_with_fake_clock(coro_factory):
+    """
+    Run `coro_factory(clock)` with a fake clock: sleeping advances it instantly
+    Returns (result, list of requested sleep durations)
+    """
+    clock = SimpleNamespace(now=1000.0)
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+        await real_sleep(0)
+
+    original_time, original_asyncio = rate_limit_module.time, rate_limit_module.asyncio
+    rate_limit_module.time = SimpleNamespace(monotonic=lambda: clock.now)
+    rate_limit_module.asyncio = SimpleNamespace(Lock=asyncio.Lock, sleep=fake_sleep)
+    try:
+        return asyncio.run(coro_factory(clock)), sleeps
+    finally:
+        rate_limit_module.time = original_time
+        rate_limit_module.asyncio = original_asyncio
+
+
+def test_estimate_tokens():
+    """Prompt tokens plus per-message overhead plus expected replies"""
+    original_count = rate_limit_module.count_tokens
+    rate_limit_module.count_tokens = lambda text, model: len(text)
+    try:
+        request = {
+            "model": "gpt-4o-mini",
+            "messages": [
+                {"role": "system", "content": "judge"},
+                {"role": "user", "content": "abc"}
+            ]
+        }
+        prompt = len("judge") + len("abc") + 2 * TOKENS_PER_MESSAGE
+        assert estimate_tokens(request) == prompt + EXPECTED_COMPLETION_TOKENS
+        assert estimate_tokens(request, replies=3) == prompt + 3 * EXPECTED_COMPLETION_TOKENS
+    finally:
+        rate_limit_module.count_tokens = original_count
+    log.info("  ✓ Token estimate counts overhead and replies")
+
+
+def test_acquire_within_budget():
+    """Requests that fit both buckets pass without waiting"""
+    async def scenario(clock):
+        limiter = AsyncRateLimiter(max_requests_per_minute=3, max_tokens_per_minute=1000)
+        for _ in range(3):
+            await limiter.acquire(100)
+        return limiter
+
+    limiter, sleeps = _run_with_fake_clock(scenario)
+    assert sleeps == [], f"Expected no waiting, slept {sleeps}"
+    assert limiter._requests == 0
+    assert limiter._tokens == 700
+    log.info("  ✓ Requests within budget are admitted immediately")
+
+
+def test_waits_for_short_bucket():
+    """An exhausted bucket makes the next request wait for its refill"""
+    async def scenario(clock):
+        limiter = AsyncRateLimiter(max_requests_per_minute=60, max_tokens_per_minute=600)
+        start = clock.now
+        await limiter.acquire(600)
+        # Token bucket is empty: 300 tokens take half a minute to accrue
+        await limiter.acquire(300)
+        return clock.now - start
+
+    waited, sleeps = _run_with_fake_clock(scenario)
+    assert sleeps, "Expected the second request to wait"
+    assert abs(waited - 30.0) < 1e-6, f"Expected a 30s wait, got {waited}"
+
+    async def requests_scenario(clock):
+        limiter = AsyncRateLimiter(max_requests_per_minute=2, max_tokens_per_minute=10_000)
+        start = clock.now
+        await limiter.acquire(1)
+        await limiter.acquire(1)
+        # Request bucket is empty: one request accrues in 30s
+        await limiter.acquire(1)
+        return clock.now - start
+
+    waited, _ = _run_with_fake_clock(requests_scenario)
+    assert abs(waited - 30.0) < 1e-6, f"Expected a 30s wait, got {waited}"
+    log.info("  ✓ Short token or request bucket delays the next call")
+
+
+def test_refill_is_capped():
+    """Idle time refills the buckets only up to one minute's budget"""
+    async def scenario(clock):
+        limiter = AsyncRateLimiter(max_requests_per_minute=10, max_tokens_per_minute=100)
+        await limiter.acquire(100, requests=10)
+        clock.now += 30.0
+        limiter._refill()
+        half = (limiter._requests, limiter._tokens)
+        clock.now += 600.0
+        limiter._refill()
+        return half, (limiter._requests, limiter._tokens)
+
+    (half, full), sleeps = _run_with_fake_clock(scenario)
+    assert sleeps == []
+    assert half == (5.0, 50.0), f"Expected half the budget after 30s, got {half}"
+    assert full == (10, 100), f"Expected the budget capped at one minute, got {full}"
+    log.info("  ✓ Buckets refill linearly and cap at one minute's budget")
+
+
+def test_oversized_request_is_clamped():
+    """Requests above a minute's budget wait for a full bucket instead of forever"""
+    async def scenario(clock):
+        limiter = AsyncRateLimiter(max_requests_per_minute=5, max_tokens_per_minute=1000)
+        start = clock.now
+        await limiter.acquire(5000, requests=20)
+        first = clock.now - start
+        await limiter.acquire(5000)
+        return first, clock.now - start
+
+    (first, total), _ = _run_with_fake_clock(scenario)
+    assert first == 0.0, "A full bucket should admit a clamped request at once"
+    assert abs(total - 60.0) < 1e-6, f"Expected a wait of one full refill, got {total}"
+    log.info("  ✓ Oversized requests are clamped to the bucket size")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log.info("\n⏱️ Testing Rate Limiter:")
+    test_estimate_tokens()
+    test_acquire_within_budget()
+    test_waits_for_short_bucket()
+    test_refill_is_capped()
+    test_oversized_request_is_clamped()
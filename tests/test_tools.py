@@ -1,76 +1,107 @@
 """
 Test tool execution
 """
+import logging
+import time
+from types import SimpleNamespace
+
+import tools.registry as registry_module
 from tools import get_global_registry
+from tools.base import BaseTool, ToolResult
+from tools.registry import BREAKER_COOLDOWN_SECONDS, BREAKER_FAILURE_THRESHOLD, ToolRegistry
+
+log = logging.getLogger(__name__)
+
+
+class FlakyTool(BaseTool):
+    """Test double: raises `error` while set, otherwise returns `result`"""
+
+    def __init__(self):
+        super().__init__()
+        self.error = None
+        self.result = ToolResult(success=True, result="ok")
+        self.calls = 0
+
+    def get_description(self) -> str:
+        return "Test tool"
+
+    def get_parameters(self):
+        return []
+
+    def execute(self) -> ToolResult:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.result
 
 
 def test_tools():
     """Test all registered tools"""
     registry = get_global_registry()
 
-    print("=" * 60)
-    print("TOOL SYSTEM TEST")
-    print("=" * 60)
+    log.info("=" * 60)
+    log.info("TOOL SYSTEM TEST")
+    log.info("=" * 60)
 
-    print("\n📦 Registered Tools:")
+    log.info("\n📦 Registered Tools:")
     for tool_name in registry.list_tools():
-        print(f"  ✓ {tool_name}")
+        log.info(f"  ✓ {tool_name}")
 
-    print("\n🧮 Testing Calculator Tool:")
+    log.info("\n🧮 Testing Calculator Tool:")
     result = registry.execute("CalculatorTool", expression="2 + 2")
     if result.success:
-        print(f"  2 + 2 = {result.result}")
+        log.info(f"  2 + 2 = {result.result}")
         assert result.result == 4, f"Expected 4, got {result.result}"
-        print(f"  ✓ Basic calculation passed")
+        log.info(f"  ✓ Basic calculation passed")
     else:
-        print(f"  ✗ Calculator test failed: {result.error}")
+        log.warning(f"  ✗ Calculator test failed: {result.error}")
 
     # Test percentage calculation
     result = registry.execute("CalculatorTool", expression="15% of 250")
     if result.success:
-        print(f"  15% of 250 = {result.result}")
+        log.info(f"  15% of 250 = {result.result}")
         assert result.result == 37.5, f"Expected 37.5, got {result.result}"
-        print(f"  ✓ Percentage calculation passed")
+        log.info(f"  ✓ Percentage calculation passed")
     else:
-        print(f"  ✗ Percentage test failed: {result.error}")
+        log.warning(f"  ✗ Percentage test failed: {result.error}")
 
-    print("\n📅 Testing Date Tool:")
+    log.info("\n📅 Testing Date Tool:")
     result = registry.execute("GetCurrentDateTool", format="date")
     if result.success:
-        print(f"  Today: {result.result}")
-        print(f"  ✓ Date tool passed")
+        log.info(f"  Today: {result.result}")
+        log.info(f"  ✓ Date tool passed")
     else:
-        print(f"  ✗ Date test failed: {result.error}")
+        log.warning(f"  ✗ Date test failed: {result.error}")
 
-    print("\n📊 Testing Collection Stats Tool:")
+    log.info("\n📊 Testing Collection Stats Tool:")
     result = registry.execute("GetCollectionStatsTool")
     if result.success:
-        print(f"  Collections found: {len(result.result)}")
+        log.info(f"  Collections found: {len(result.result)}")
         for coll_name, stats in result.result.items():
             if stats["status"] == "ok":
-                print(f"    - {coll_name}: {stats['count']} documents")
+                log.info(f"    - {coll_name}: {stats['count']} documents")
             else:
-                print(f"    - {coll_name}: ERROR")
-        print(f"  ✓ Collection stats tool passed")
+                log.info(f"    - {coll_name}: ERROR")
+        log.info(f"  ✓ Collection stats tool passed")
     else:
-        print(f"  ✗ Collection stats test failed: {result.error}")
+        log.warning(f"  ✗ Collection stats test failed: {result.error}")
 
-    print("\n🔍 Testing Search Tool:")
+    log.info("\n🔍 Testing Search Tool:")
     result = registry.execute(
         "SearchVectorDBTool",
         query="What is RAG?",
         top_k=3
     )
     if result.success:
-        print(f"  Found {len(result.result)} results")
+        log.info(f"  Found {len(result.result)} results")
         for i, r in enumerate(result.result, 1):
-            print(f"    {i}. Source: {r['source']}")
-            print(f"       Preview: {r['content'][:100]}...")
-        print(f"  ✓ Search tool passed")
+            log.info(f"    {i}. Source: {r['source']}")
+            log.info(f"       Preview: {r['content'][:100]}...")
+        log.info(f"  ✓ Search tool passed")
     else:
-        print(f"  ⚠ Search test failed (this is OK if no documents indexed): {result.error}")
+        log.warning(f"  ⚠ Search test failed (this is OK if no documents indexed): {result.error}")
 
-    print("\n📋 Testing Formatting Tools:")
+    log.info("\n📋 Testing Formatting Tools:")
 
     # Test table formatting
     test_data = [
@@ -79,26 +110,96 @@ def test_tools():
     ]
     result = registry.execute("FormatAsTableTool", data=test_data)
     if result.success:
-        print("  Table format:")
-        print(result.result)
-        print(f"  ✓ Table formatting passed")
+        log.info("  Table format:")
+        log.info(result.result)
+        log.info(f"  ✓ Table formatting passed")
     else:
-        print(f"  ✗ Table formatting failed: {result.error}")
+        log.warning(f"  ✗ Table formatting failed: {result.error}")
 
     # Test bullet list formatting
     test_items = ["First item", "Second item", "Third item"]
     result = registry.execute("FormatAsBulletListTool", items=test_items)
     if result.success:
-        print("\n  Bullet list format:")
-        print(result.result)
-        print(f"  ✓ Bullet list formatting passed")
+        log.info("\n  Bullet list format:")
+        log.info(result.result)
+        log.info(f"  ✓ Bullet list formatting passed")
     else:
-        print(f"  ✗ Bullet list formatting failed: {result.error}")
+        log.warning(f"  ✗ Bullet list formatting failed: {result.error}")
+
+    log.info("\n" + "=" * 60)
+    log.info("✅ All tool tests completed!")
+    log.info("=" * 60)
+
+
+def test_circuit_breaker():
+    """Breaker trips on repeated exceptions, cools down and closes after a probe"""
+    # Fake clock: retries don't sleep and the cooldown can be skipped
+    clock = SimpleNamespace(now=1000.0)
+    fake_time = SimpleNamespace(
+        monotonic=lambda: clock.now,
+        sleep=lambda seconds: None,
+        perf_counter_ns=time.perf_counter_ns
+    )
+    original_time = registry_module.time
+    registry_module.time = fake_time
+    try:
+        registry = ToolRegistry()
+        tool = FlakyTool()
+        registry.register(tool)
+        name = tool.name
+
+        log.info("\n🔌 Testing Circuit Breaker:")
+
+        # Failures the tool reports itself don't count (and aren't retried)
+        tool.result = ToolResult(success=False, result=None, error="unknown collection")
+        for _ in range(BREAKER_FAILURE_THRESHOLD + 1):
+            assert not registry.execute(name).success
+        assert tool.calls == BREAKER_FAILURE_THRESHOLD + 1, "Returned failures should not be retried"
+        assert name not in registry._breaker, "Returned failures should not trip the breaker"
+
+        # Neither do unrecoverable errors
+        tool.error = ValueError("bad argument")
+        for _ in range(BREAKER_FAILURE_THRESHOLD + 1):
+            assert "ValueError" in registry.execute(name).error
+        assert name not in registry._breaker, "Unrecoverable errors should not trip the breaker"
+        log.info("  ✓ Returned failures and argument errors leave the circuit closed")
+
+        # Exceptions on every attempt do, after the threshold
+        tool.error = ConnectionError("service down")
+        for _ in range(BREAKER_FAILURE_THRESHOLD):
+            assert "after 3 attempts" in registry.execute(name).error
+        calls = tool.calls
+        result = registry.execute(name)
+        assert "circuit open" in result.error, f"Expected an open circuit, got {result.error}"
+        assert tool.calls == calls, "An open circuit should not call the tool"
+        log.info("  ✓ Circuit opens after repeated exceptions")
+
+        # Still open just before the cooldown ends
+        clock.now += BREAKER_COOLDOWN_SECONDS - 1
+        assert "circuit open" in registry.execute(name).error
+
+        # After the cooldown one probe goes through; another exception reopens the circuit
+        clock.now += 2
+        assert "after 3 attempts" in registry.execute(name).error
+        assert tool.calls == calls + 3, "The probe should reach the tool"
+        assert "circuit open" in registry.execute(name).error
+        log.info("  ✓ Failed probe reopens the circuit")
+
+        # A probe that gets any response closes it, even an unrecoverable error
+        clock.now += BREAKER_COOLDOWN_SECONDS + 1
+        tool.error = TypeError("unexpected keyword")
+        assert "TypeError" in registry.execute(name).error
+        assert name not in registry._breaker, "A responding probe should close the circuit"
 
-    print("\n" + "=" * 60)
-    print("✅ All tool tests completed!")
-    print("=" * 60)
+        tool.error = None
+        tool.result = ToolResult(success=True, result="ok")
+        assert registry.execute(name).result == "ok"
+        log.info("  ✓ Responding probe closes the circuit")
+    finally:
+        registry_module.time = original_time
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_tools()
+    test_circuit_breaker()
@@ -1,110 +1,114 @@
 """
 Test complete agent workflow end-to-end
 """
+import logging
+
 from agent.orchestrator import AgentOrchestrator
 
+log = logging.getLogger(__name__)
+
 
 def test_simple_query():
     """Test simple factual query"""
-    print("\n" + "="*80)
-    print("TEST 1: Simple Factual Query")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("TEST 1: Simple Factual Query")
+    log.info("="*80)
 
     orchestrator = AgentOrchestrator()
 
     query = "What is retrieval-augmented generation?"
 
-    print(f"Testing: {query}\n")
+    log.info(f"Testing: {query}\n")
 
     state = orchestrator.run(query, verbose=True)
 
-    print("\n" + "="*60)
-    print("FINAL ANSWER:")
-    print("="*60)
-    print(state.current_answer)
-    print(f"\nConfidence: {state.confidence_score:.2f}")
-    print(f"Iterations: {state.iteration}")
+    log.info("\n" + "="*60)
+    log.info("FINAL ANSWER:")
+    log.info("="*60)
+    log.info(state.current_answer)
+    log.info(f"\nConfidence: {state.confidence_score:.2f}")
+    log.info(f"Iterations: {state.iteration}")
 
     # Assertions
     assert state.current_answer is not None, "Answer should not be None"
     assert len(state.current_answer) > 100, f"Answer too short: {len(state.current_answer)} chars"
     assert state.confidence_score > 0, f"Confidence score should be positive: {state.confidence_score}"
 
-    print("\n✅ Test 1 passed!")
+    log.info("\n✅ Test 1 passed!")
     return state
 
 
 def test_query_with_tools():
     """Test query that should trigger tool usage"""
-    print("\n" + "="*80)
-    print("TEST 2: Query with Tool Usage")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("TEST 2: Query with Tool Usage")
+    log.info("="*80)
 
     orchestrator = AgentOrchestrator()
 
     query = "What is today's date and calculate 15% of 250?"
 
-    print(f"Testing: {query}\n")
+    log.info(f"Testing: {query}\n")
 
     state = orchestrator.run(query, verbose=True)
 
-    print("\n" + "="*60)
-    print("FINAL ANSWER:")
-    print("="*60)
-    print(state.current_answer)
-    print(f"\nConfidence: {state.confidence_score:.2f}")
-    print(f"Iterations: {state.iteration}")
+    log.info("\n" + "="*60)
+    log.info("FINAL ANSWER:")
+    log.info("="*60)
+    log.info(state.current_answer)
+    log.info(f"\nConfidence: {state.confidence_score:.2f}")
+    log.info(f"Iterations: {state.iteration}")
 
     # Assertions
     assert state.current_answer is not None, "Answer should not be None"
 
     # Check that tool calling step was executed
     tool_steps = state.get_steps_by_type("tool_call")
-    print(f"\nTool calling steps: {len(tool_steps)}")
+    log.info(f"\nTool calling steps: {len(tool_steps)}")
 
-    print("\n✅ Test 2 passed!")
+    log.info("\n✅ Test 2 passed!")
     return state
 
 
 def test_complex_query():
     """Test complex query requiring multiple steps"""
-    print("\n" + "="*80)
-    print("TEST 3: Complex Multi-Step Query")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("TEST 3: Complex Multi-Step Query")
+    log.info("="*80)
 
     orchestrator = AgentOrchestrator()
 
     query = "What did I learn about embeddings in the AI Academy course, and how are they used in RAG systems?"
 
-    print(f"Testing: {query}\n")
+    log.info(f"Testing: {query}\n")
 
     state = orchestrator.run(query, verbose=True)
 
-    print("\n" + "="*60)
-    print("FINAL ANSWER:")
-    print("="*60)
-    print(state.current_answer)
-    print(f"\nConfidence: {state.confidence_score:.2f}")
-    print(f"Iterations: {state.iteration}")
+    log.info("\n" + "="*60)
+    log.info("FINAL ANSWER:")
+    log.info("="*60)
+    log.info(state.current_answer)
+    log.info(f"\nConfidence: {state.confidence_score:.2f}")
+    log.info(f"Iterations: {state.iteration}")
 
     # Assertions
     assert state.current_answer is not None, "Answer should not be None"
     assert state.iteration >= 0, f"Should have completed at least 1 iteration: {state.iteration}"
 
     # Check reasoning steps
-    print(f"\nTotal reasoning steps: {len(state.reasoning_steps)}")
+    log.info(f"\nTotal reasoning steps: {len(state.reasoning_steps)}")
     for step in state.reasoning_steps:
-        print(f"  - {step.step_type}: {step.content[:80]}...")
+        log.info(f"  - {step.step_type}: {step.content[:80]}...")
 
-    print("\n✅ Test 3 passed!")
+    log.info("\n✅ Test 3 passed!")
     return state
 
 
 def test_logging():
     """Test that logging files are created"""
-    print("\n" + "="*80)
-    print("TEST 4: Logging Verification")
-    print("="*80)
+    log.info("\n" + "="*80)
+    log.info("TEST 4: Logging Verification")
+    log.info("="*80)
 
     import os
     from pathlib import Path
@@ -113,7 +117,7 @@ def test_logging():
     orchestrator = AgentOrchestrator()
     query = "Quick test query for logging"
 
-    print(f"Testing: {query}\n")
+    log.info(f"Testing: {query}\n")
 
     state = orchestrator.run(query, verbose=False)
 
@@ -128,14 +132,15 @@ def test_logging():
     trace_path = orchestrator.save_trace(state)
     assert os.path.exists(trace_path), f"Detailed trace should exist: {trace_path}"
 
-    print(f"✓ Log directory: {log_dir}")
-    print(f"✓ Trace log: {trace_log}")
-    print(f"✓ Detailed trace: {trace_path}")
+    log.info(f"✓ Log directory: {log_dir}")
+    log.info(f"✓ Trace log: {trace_log}")
+    log.info(f"✓ Detailed trace: {trace_path}")
 
-    print("\n✅ Test 4 passed!")
+    log.info("\n✅ Test 4 passed!")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🧪 Running Complete Workflow Tests\n")
     print("This will test the full agent orchestrator with:")
     print("  1. Simple factual queries")
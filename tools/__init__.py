@@ -21,6 +21,11 @@ def initialize_tools():
     register_tool(FormatAsTableTool())
     register_tool(FormatAsBulletListTool())
 
+    # Build the schemas and descriptions once the tool set is complete
+    registry = get_global_registry()
+    registry.get_tool_schemas()
+    registry.describe_all_tools()
+
 
 # Auto-initialize on import
 initialize_tools()
@@ -5,19 +5,24 @@ All tools must inherit from BaseTool
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum, auto
 
 
-class ToolCategory(Enum):
-    """Tool categories for organization"""
-    SEARCH = "search"
-    CALCULATION = "calculation"
-    FORMATTING = "formatting"
-    UTILITY = "utility"
-    INFORMATION = "information"
+class ToolCategory(IntEnum):
+    """Tool categories for organization (ints compare without Enum machinery)"""
+    SEARCH = auto()
+    CALCULATION = auto()
+    FORMATTING = auto()
+    UTILITY = auto()
+    INFORMATION = auto()
 
+    @property
+    def label(self) -> str:
+        """Lowercase display name (the former string value), e.g. search"""
+        return self.name.lower()
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolParameter:
     """Tool parameter specification"""
     name: str
@@ -28,7 +33,7 @@ class ToolParameter:
     items_type: Optional[str] = None  # For array types: specify element type ("string", "object", "number", etc.)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from tool execution"""
     success: bool
@@ -42,9 +47,14 @@ class BaseTool(ABC):
     Abstract base class for all agent tools
     """
 
+    # Pure tools return the same result for the same arguments, so the
+    # registry may answer repeated calls from its result cache
+    is_pure: bool = False
+
     def __init__(self):
         self.name = self.__class__.__name__
         self.category = ToolCategory.UTILITY
+        self._schema: Optional[Dict[str, Any]] = None
 
     @abstractmethod
     def execute(self, **kwargs) -> ToolResult:
@@ -67,7 +77,14 @@ class BaseTool(ABC):
     def to_schema(self) -> Dict[str, Any]:
         """
         Convert tool to OpenAI function calling schema
+        Built on first call and reused: parameters and description are fixed
         """
+        if self._schema is None:
+            self._schema = self._build_schema()
+        return self._schema
+
+    def _build_schema(self) -> Dict[str, Any]:
+        """Build the OpenAI function calling schema from get_parameters()"""
         parameters_schema = {
             "type": "object",
             "properties": {},
@@ -8,6 +8,8 @@ from tools.base import BaseTool, ToolResult, ToolParameter, ToolCategory
 class FormatAsTableTool(BaseTool):
     """Format data as a markdown table"""
 
+    is_pure = True
+
     def __init__(self):
         super().__init__()
         self.category = ToolCategory.FORMATTING
@@ -33,17 +35,19 @@ class FormatAsTableTool(BaseTool):
                 return ToolResult(success=True, result="(empty table)")
 
             # Get headers from first row
-            headers = list(data[0].keys())
-
-            # Build table
-            table = "| " + " | ".join(headers) + " |\n"
-            table += "| " + " | ".join(["---"] * len(headers)) + " |\n"
-
-            for row in data:
-                values = [str(row.get(h, "")) for h in headers]
-                table += "| " + " | ".join(values) + " |\n"
+            headers = tuple(data[0].keys())
+
+            # Build table: collect the lines and join once
+            lines = [
+                "| " + " | ".join(headers) + " |",
+                "| " + " | ".join(["---"] * len(headers)) + " |"
+            ]
+            lines.extend(
+                "| " + " | ".join([str(row.get(h, "")) for h in headers]) + " |"
+                for row in data
+            )
 
-            return ToolResult(success=True, result=table)
+            return ToolResult(success=True, result="\n".join(lines) + "\n")
 
         except Exception as e:
             return ToolResult(success=False, result=None, error=str(e))
@@ -52,6 +56,8 @@ class FormatAsTableTool(BaseTool):
 class FormatAsBulletListTool(BaseTool):
     """Format items as a bullet list"""
 
+    is_pure = True
+
     def __init__(self):
         super().__init__()
         self.category = ToolCategory.FORMATTING
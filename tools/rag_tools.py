@@ -1,11 +1,126 @@
 """
 Tools for interacting with the RAG system
+The RAG modules (chromadb, langchain, the embeddings client) are imported
+when a tool first runs, so importing `tools` stays cheap
 """
-from typing import List
+import atexit
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
 
 from tools.base import BaseTool, ToolResult, ToolParameter, ToolCategory
-from rag.retriever import retrieve_relevant_chunks
-from rag.collections import get_all_stats, list_collections
+
+# Upper bound on collections searched concurrently for collection="all"
+MAX_SEARCH_WORKERS = 8
+
+# Seconds a listing of collection names is reused for collection="all"
+COLLECTIONS_CACHE_TTL = 30
+
+# Seconds GetCollectionStatsTool reuses the last collection stats
+STATS_CACHE_TTL = 10
+
+
+class QueryCache:
+    """
+    Thread-safe LRU cache of search results with expiry
+    Agent loops that retry or refine often repeat the exact same search
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: float = 300):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hits, misses and hit rate since creation"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0
+            }
+
+
+# Shared by every SearchVectorDBTool instance
+_search_cache = QueryCache()
+
+# Reused by every collection="all" search; threads start on first use
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=MAX_SEARCH_WORKERS, thread_name_prefix="rag-search")
+atexit.register(_SEARCH_POOL.shutdown)
+
+# (names, monotonic time listed, index version when listed)
+_collections_cache: Optional[tuple] = None
+_collections_lock = threading.Lock()
+
+
+def _cached_list_collections(ttl: float = COLLECTIONS_CACHE_TTL) -> List[str]:
+    """
+    Collection names, listed again after `ttl` seconds or once this process
+    has created or deleted a collection (tracked by the index version)
+    """
+    global _collections_cache
+    from rag.collections import index_version, list_collections
+
+    version = index_version()
+    now = time.monotonic()
+    with _collections_lock:
+        if _collections_cache is not None:
+            names, listed_at, listed_version = _collections_cache
+            if listed_version == version and now - listed_at <= ttl:
+                return list(names)
+        names = list_collections()
+        _collections_cache = (tuple(names), now, version)
+    return list(names)
+
+
+# Last GetCollectionStatsTool result, with the index version it was read at
+_stats_cache: Dict[str, Any] = {"ts": 0.0, "version": None, "value": None}
+_stats_lock = threading.Lock()
+
+
+def invalidate_stats_cache() -> None:
+    """
+    Drop the cached collection stats
+    Writes made through rag.retriever / rag.collections in this process
+    already invalidate it via the index version
+    """
+    with _stats_lock:
+        _stats_cache.update(ts=0.0, version=None, value=None)
 
 
 class SearchVectorDBTool(BaseTool):
@@ -43,56 +158,67 @@ class SearchVectorDBTool(BaseTool):
         ]
 
     def execute(self, query: str, collection: str = "ai_academy_course", top_k: int = 5) -> ToolResult:
-        """Execute vector search"""
+        """Execute vector search (repeated searches are answered from _search_cache)"""
+        # Deferred until the first search: loads chromadb and the embeddings client
+        import numpy as np
+        from rag.embeddings import embed_query
+        from rag.retriever import index_version, retrieve_relevant_chunks
+
+        # The index version makes entries written before any re-indexing unreachable
+        cache_key = (query, collection, top_k, index_version())
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            # Fresh copies: callers may annotate the result items
+            return ToolResult(success=True, result=[dict(item) for item in cached])
+
         try:
             # Handle "all" collections case
             if collection == "all":
-                all_collections = list_collections()
+                all_collections = _cached_list_collections()
                 all_results = []
 
-                for coll_name in all_collections:
+                # Embed once and search the collections concurrently
+                query_embedding = np.asarray(embed_query(query), dtype=np.float32)
+
+                def _search(coll_name: str) -> Optional[list]:
                     try:
-                        docs = retrieve_relevant_chunks(
+                        return retrieve_relevant_chunks(
                             query=query,
                             collection_name=coll_name,
-                            top_k=top_k
+                            top_k=top_k,
+                            query_embedding=query_embedding
                         )
-                        all_results.extend(docs)
-                    except Exception as e:
+                    except Exception:
                         # Skip collections that fail
-                        continue
+                        return None
+
+                # map keeps collection order, so results stay deterministic
+                complete = True
+                for docs in _SEARCH_POOL.map(_search, all_collections):
+                    if docs is None:
+                        complete = False
+                    else:
+                        all_results.extend(docs)
 
-                # Sort by relevance if we have metadata
-                results = all_results[:top_k]
+                # Similarities come from the same distance metric in every
+                # collection, so the overall top-k is a partial selection over
+                # the merged hits (ties keep collection order)
+                results = heapq.nlargest(
+                    top_k, all_results, key=lambda doc: doc.metadata.get("score", 0.0)
+                )
             else:
+                complete = True
                 results = retrieve_relevant_chunks(
                     query=query,
                     collection_name=collection,
                     top_k=top_k
                 )
 
-            # Format results with full source metadata
-            formatted_results = []
-            for doc in results:
-                # Increase content preview for better context (300 -> 800 chars)
-                content_preview = doc.page_content[:800] + "..." if len(doc.page_content) > 800 else doc.page_content
-
-                result_item = {
-                    "content": content_preview,
-                    "source": doc.metadata.get("source", "unknown"),
-                    "collection": doc.metadata.get("collection", collection)
-                }
-
-                # Add page number for PDFs
-                if "page" in doc.metadata:
-                    result_item["page"] = doc.metadata.get("page")
-
-                # Add source type for context
-                if "source_type" in doc.metadata:
-                    result_item["source_type"] = doc.metadata.get("source_type")
-
-                formatted_results.append(result_item)
+            formatted_results = self._format_results(results, collection)
 
+            # Partial results (a collection failed) are returned but not cached
+            if complete:
+                _search_cache.put(cache_key, [dict(item) for item in formatted_results])
             return ToolResult(
                 success=True,
                 result=formatted_results
@@ -105,6 +231,91 @@ class SearchVectorDBTool(BaseTool):
                 error=str(e)
             )
 
+    def execute_batch(
+        self,
+        queries: List[str],
+        collection: str = "ai_academy_course",
+        top_k: Union[int, List[int]] = 5
+    ) -> List[ToolResult]:
+        """
+        Execute several vector searches, one ToolResult per query
+        top_k is either shared or given per query. Cached queries are
+        answered from _search_cache; the rest share one embedding call and
+        one ChromaDB query. collection="all" falls back to execute() per query.
+        """
+        top_ks = [top_k] * len(queries) if isinstance(top_k, int) else list(top_k)
+        if len(top_ks) != len(queries):
+            error = f"Got {len(top_ks)} top_k values for {len(queries)} queries"
+            return [ToolResult(success=False, result=None, error=error) for _ in queries]
+
+        if collection == "all":
+            return [
+                self.execute(query, collection=collection, top_k=k)
+                for query, k in zip(queries, top_ks)
+            ]
+
+        from rag.retriever import index_version, retrieve_relevant_chunks_batch
+
+        version = index_version()
+        outcomes: List[Optional[ToolResult]] = []
+        missing: Dict[Tuple[str, int], List[int]] = {}
+        for position, (query, k) in enumerate(zip(queries, top_ks)):
+            cached = _search_cache.get((query, collection, k, version))
+            if cached is not None:
+                outcomes.append(ToolResult(success=True, result=[dict(item) for item in cached]))
+            else:
+                outcomes.append(None)
+                missing.setdefault((query, k), []).append(position)
+
+        if missing:
+            try:
+                batch = retrieve_relevant_chunks_batch(
+                    [query for query, _ in missing],
+                    collection_name=collection,
+                    top_k=[k for _, k in missing]
+                )
+            except Exception as e:
+                for positions in missing.values():
+                    for position in positions:
+                        outcomes[position] = ToolResult(success=False, result=None, error=str(e))
+                return outcomes
+
+            for ((query, k), positions), results in zip(missing.items(), batch):
+                formatted_results = self._format_results(results, collection)
+                _search_cache.put((query, collection, k, version), formatted_results)
+                for position in positions:
+                    outcomes[position] = ToolResult(
+                        success=True, result=[dict(item) for item in formatted_results]
+                    )
+
+        return outcomes
+
+    @staticmethod
+    def _format_results(results: list, collection: str) -> List[Dict[str, Any]]:
+        """Turn retrieved documents into result items with full source metadata"""
+        formatted_results = []
+        for doc in results:
+            metadata = doc.metadata
+            content = doc.page_content
+
+            result_item = {
+                # Increase content preview for better context (300 -> 800 chars)
+                "content": content[:800] + "..." if len(content) > 800 else content,
+                "source": metadata.get("source", "unknown"),
+                "collection": metadata.get("collection", collection)
+            }
+
+            # Add page number for PDFs
+            if "page" in metadata:
+                result_item["page"] = metadata["page"]
+
+            # Add source type for context
+            if "source_type" in metadata:
+                result_item["source_type"] = metadata["source_type"]
+
+            formatted_results.append(result_item)
+        return formatted_results
+
 
 class GetCollectionStatsTool(BaseTool):
     """Get statistics about available collections"""
@@ -120,7 +331,21 @@ class GetCollectionStatsTool(BaseTool):
         return []
 
     def execute(self) -> ToolResult:
-        """Get collection stats"""
+        """Get collection stats (reused for STATS_CACHE_TTL seconds until the index changes)"""
+        from rag.collections import get_all_stats, index_version
+
+        version = index_version()
+        with _stats_lock:
+            if (
+                _stats_cache["value"] is not None
+                and _stats_cache["version"] == version
+                and time.monotonic() - _stats_cache["ts"] < STATS_CACHE_TTL
+            ):
+                return ToolResult(
+                    success=True,
+                    result={name: dict(item) for name, item in _stats_cache["value"].items()}
+                )
+
         try:
             stats = get_all_stats()
 
@@ -135,6 +360,12 @@ class GetCollectionStatsTool(BaseTool):
                         "count": coll_stats.get("count", 0)
                     }
 
+            with _stats_lock:
+                _stats_cache.update(
+                    ts=time.monotonic(),
+                    version=version,
+                    value={name: dict(item) for name, item in formatted_stats.items()}
+                )
             return ToolResult(success=True, result=formatted_stats)
         except Exception as e:
             return ToolResult(success=False, result=None, error=str(e))
@@ -1,11 +1,63 @@
 """
 Tool registry for discovering and executing tools
 """
-from typing import Dict, List, Optional, Any
+import atexit
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from typing import Callable, Dict, List, Optional, Any, Tuple
+import random
+import threading
 import time
 
+import orjson
+
 from tools.base import BaseTool, ToolResult
-from rag.config import TOOL_TIMEOUT_SECONDS
+from rag.config import (
+    TOOL_RETRY_BASE_DELAY,
+    TOOL_RETRY_JITTER,
+    TOOL_RETRY_MAX_DELAY,
+    TOOL_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bad arguments or tool bugs: retrying can't help, so these fail immediately
+# (anything else, e.g. TimeoutError or ConnectionError, is retried)
+UNRECOVERABLE_ERRORS = (SyntaxError, TypeError, ValueError, KeyError, AttributeError)
+
+# Threads of the registry's shared pool for execute_many()
+TOOL_POOL_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Successful results of pure tools kept for repeated calls (least recently used evicted)
+RESULT_CACHE_SIZE = 512
+
+# Consecutive failed calls (after retries) that open a tool's circuit breaker
+BREAKER_FAILURE_THRESHOLD = 5
+
+# Seconds an open breaker fails calls immediately before letting one through
+BREAKER_COOLDOWN_SECONDS = 30.0
+
+
+def _result_cache_key(tool_name: str, kwargs: Dict[str, Any]) -> Optional[Tuple[str, bytes]]:
+    """
+    Key of a call: the arguments as JSON, so nested lists and dicts (table
+    rows, list items) hash too. Only the argument names are sorted; key order
+    inside values can matter (table headers follow the first row). None if
+    the arguments aren't JSON data
+    """
+    try:
+        return tool_name, orjson.dumps(dict(sorted(kwargs.items())))
+    except TypeError:
+        return None
+
+
+def _retry_delay(attempt: int) -> float:
+    """Capped exponential backoff with jitter for the given attempt (0-based)"""
+    delay = min(TOOL_RETRY_MAX_DELAY, TOOL_RETRY_BASE_DELAY * (2 ** attempt))
+    return delay * (1 + random.uniform(-TOOL_RETRY_JITTER, TOOL_RETRY_JITTER))
 
 
 class ToolRegistry:
@@ -15,11 +67,35 @@ class ToolRegistry:
 
     def __init__(self):
         self.tools: Dict[str, BaseTool] = {}
+        # Name -> bound execute method, resolved once at registration
+        self._dispatch: Dict[str, Callable[..., ToolResult]] = {}
+        # Built on first use, dropped whenever a tool is registered
+        self._schemas_cache: Optional[List[Dict[str, Any]]] = None
+        self._describe_cache: Optional[str] = None
+        # Created by the first execute_many() with more than one call, kept for the process
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # (tool name, arguments JSON) -> successful result of a pure tool
+        self._pure_tools: set = set()
+        self._result_cache: "OrderedDict[Tuple[str, bytes], ToolResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        # Tool name -> (consecutive failures, monotonic time the breaker stays open until)
+        self._breaker: Dict[str, Tuple[int, float]] = {}
+        self._breaker_lock = threading.Lock()
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool"""
         self.tools[tool.name] = tool
-        print(f"✓ Registered tool: {tool.name}")
+        self._dispatch[tool.name] = tool.execute
+        if tool.is_pure:
+            self._pure_tools.add(tool.name)
+        else:
+            self._pure_tools.discard(tool.name)
+        with self._result_cache_lock:
+            self._result_cache.clear()
+        self._schemas_cache = None
+        self._describe_cache = None
+        logger.debug("Registered tool: %s", tool.name)
 
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """Get a tool by name"""
@@ -33,65 +109,160 @@ class ToolRegistry:
         """
         Get OpenAI function calling schemas for all tools
         """
-        return [tool.to_schema() for tool in self.tools.values()]
+        if self._schemas_cache is None:
+            self._schemas_cache = [tool.to_schema() for tool in self.tools.values()]
+        return self._schemas_cache
 
     def execute(self, tool_name: str, **kwargs) -> ToolResult:
         """
         Execute a tool with simple retry logic (no tenacity!)
+        Successful results of pure tools are cached by arguments. Exceptions
+        are retried with jittered exponential backoff, except for
+        UNRECOVERABLE_ERRORS; failed results a tool returns itself (bad
+        arguments it caught) are returned right away.
+
+        After BREAKER_FAILURE_THRESHOLD calls in a row that end in a
+        retried-out exception, the tool's circuit opens: calls fail
+        immediately for BREAKER_COOLDOWN_SECONDS, then one call is let
+        through as a probe. Any response from the tool closes the circuit
+        again; another exception reopens it
         """
-        tool = self.get_tool(tool_name)
-        if not tool:
+        execute = self._dispatch.get(tool_name)
+        if execute is None:
             return ToolResult(
                 success=False,
                 result=None,
                 error=f"Tool '{tool_name}' not found"
             )
 
-        # Simple retry logic with exponential backoff
+        cache_key = None
+        if tool_name in self._pure_tools:
+            cache_key = _result_cache_key(tool_name, kwargs)
+            if cache_key is not None:
+                with self._result_cache_lock:
+                    cached = self._result_cache.get(cache_key)
+                    if cached is not None:
+                        self._result_cache.move_to_end(cache_key)
+                        # A deep copy: callers may set execution_time_ms or mutate the result
+                        return deepcopy(cached)
+
+        with self._breaker_lock:
+            failures, open_until = self._breaker.get(tool_name, (0, 0.0))
+            now = time.monotonic()
+            if open_until > now:
+                return ToolResult(
+                    success=False,
+                    result=None,
+                    error=(
+                        f"Tool '{tool_name}' circuit open after {failures} consecutive failures; "
+                        f"retry in {open_until - now:.0f}s"
+                    )
+                )
+            if failures >= BREAKER_FAILURE_THRESHOLD:
+                # Half-open: hold other callers off while this call probes the tool
+                self._breaker[tool_name] = (failures, now + BREAKER_COOLDOWN_SECONDS)
+
+        result, tool_unavailable = self._execute_with_retries(execute, kwargs)
+
+        with self._breaker_lock:
+            if not tool_unavailable:
+                self._breaker.pop(tool_name, None)
+            else:
+                failures = self._breaker.get(tool_name, (0, 0.0))[0] + 1
+                open_until = (
+                    time.monotonic() + BREAKER_COOLDOWN_SECONDS
+                    if failures >= BREAKER_FAILURE_THRESHOLD else 0.0
+                )
+                self._breaker[tool_name] = (failures, open_until)
+
+        if cache_key is not None and result.success:
+            with self._result_cache_lock:
+                self._result_cache[cache_key] = deepcopy(result)
+                while len(self._result_cache) > RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+        return result
+
+    def _execute_with_retries(
+        self,
+        execute: Callable[..., ToolResult],
+        kwargs: Dict[str, Any]
+    ) -> Tuple[ToolResult, bool]:
+        """
+        Run a tool's execute method with retries
+        Returns the result and whether the tool failed to respond at all
+        (exceptions on every attempt), the only failures the circuit breaker
+        counts; returned failures and unrecoverable errors point at the call
+        """
+        # Simple retry logic with jittered exponential backoff
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
-                start_time = time.time()
+                start_ns = time.perf_counter_ns()
 
                 # Execute tool
-                result = tool.execute(**kwargs)
+                result = execute(**kwargs)
 
-                execution_time = (time.time() - start_time) * 1000  # ms
+                execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000  # ms
 
-                # If successful, return immediately
+                # The tool handled the call: success, or a failure it reported itself
                 if result.success:
                     result.execution_time_ms = execution_time
-                    return result
+                return result, False
 
-                # If not successful and not last attempt, retry
-                if attempt < max_attempts - 1:
-                    wait_time = (2 ** attempt)  # Exponential: 1s, 2s, 4s
-                    time.sleep(wait_time)
-                    continue
-
-                return result
+            except UNRECOVERABLE_ERRORS as e:
+                return ToolResult(
+                    success=False,
+                    result=None,
+                    error=f"Tool execution failed: {type(e).__name__}: {str(e)}"
+                ), False
 
             except Exception as e:
                 if attempt < max_attempts - 1:
-                    wait_time = (2 ** attempt)
-                    time.sleep(wait_time)
+                    time.sleep(_retry_delay(attempt))  # ~1s, 2s, 4s by default
                     continue
 
                 return ToolResult(
                     success=False,
                     result=None,
                     error=f"Tool execution failed after {max_attempts} attempts: {str(e)}"
-                )
+                ), True
 
         # Should not reach here, but just in case
         return ToolResult(
             success=False,
             result=None,
             error=f"Tool execution failed after {max_attempts} attempts"
-        )
+        ), True
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get or create the shared tool pool (shut down at exit)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=TOOL_POOL_WORKERS, thread_name_prefix="tool-exec"
+                )
+                atexit.register(self._executor.shutdown)
+            return self._executor
+
+    def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[ToolResult]:
+        """
+        Execute independent tool calls concurrently
+        Each (tool_name, kwargs) pair goes through execute(), retries
+        included; results come back in the order of `calls`
+        """
+        if len(calls) <= 1:
+            return [self.execute(name, **kwargs) for name, kwargs in calls]
+
+        executor = self._get_executor()
+        futures = [executor.submit(self.execute, name, **kwargs) for name, kwargs in calls]
+        return [future.result() for future in futures]
 
     def describe_all_tools(self) -> str:
         """Generate description of all available tools"""
+        if self._describe_cache is not None:
+            return self._describe_cache
+
         descriptions = []
         for tool in self.tools.values():
             params = ", ".join([
@@ -100,7 +271,8 @@ class ToolRegistry:
             descriptions.append(
                 f"- {tool.name}({params}): {tool.get_description()}"
             )
-        return "\n".join(descriptions)
+        self._describe_cache = "\n".join(descriptions)
+        return self._describe_cache
 
 
 # Global registry instance
@@ -1,16 +1,93 @@
 """
 Utility tools for calculations, dates, and other common operations
 """
+import ast
 import math
+import time
 from datetime import datetime
-from typing import List
+from functools import lru_cache
+from typing import Any, List
 
 from tools.base import BaseTool, ToolResult, ToolParameter, ToolCategory
 
+# Names available to calculator expressions (no builtins otherwise)
+_ALLOWED = {
+    "abs": abs, "round": round, "min": min, "max": max,
+    "sum": sum, "pow": pow,
+    "sqrt": math.sqrt, "pi": math.pi, "e": math.e
+}
+
+# Globals of every evaluation; expressions can't assign, so sharing it is safe
+_EVAL_GLOBALS = {"__builtins__": {}}
+
+# Functions an expression may call
+_CALLABLE = frozenset(name for name, value in _ALLOWED.items() if callable(value))
+
+# Syntax an expression may use: arithmetic on numbers and calls of _CALLABLE
+# (no attributes, subscripts, lambdas, comprehensions or strings)
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.operator, ast.unaryop,
+    ast.Constant, ast.Name, ast.Load, ast.Call, ast.keyword, ast.Tuple, ast.List
+)
+
+
+def _validate(tree: ast.AST) -> None:
+    """Reject expressions that use anything beyond the calculator grammar"""
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and (
+            isinstance(node.value, bool) or not isinstance(node.value, (int, float, complex))
+        ):
+            raise ValueError(f"unsupported constant: {node.value!r}")
+        if isinstance(node, ast.Name) and node.id not in _ALLOWED:
+            raise ValueError(f"unknown name: {node.id}")
+        if isinstance(node, ast.Call) and not (
+            isinstance(node.func, ast.Name) and node.func.id in _CALLABLE
+        ):
+            raise ValueError("only calls of " + ", ".join(sorted(_CALLABLE)) + " are allowed")
+
+
+@lru_cache(maxsize=512)
+def _compile(expression: str):
+    """Parse, validate and compile an expression once"""
+    tree = ast.parse(expression, mode="eval")
+    _validate(tree)
+    return compile(tree, "<calc>", "eval")
+
+
+def _freeze(value: Any) -> Any:
+    """Lists (from list literals) as tuples, so a cached result can't be mutated by a caller"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _eval_expr(expression: str) -> Any:
+    """
+    Evaluate a whitespace-normalized expression (repeats are answered from the cache)
+    Every caller gets the same result object, so list results come back as tuples
+    """
+    # Handle percentage expressions
+    if "%" in expression:
+        expression = expression.replace("%", "/100")
+
+    # Handle "of" keyword (e.g., "15% of 250")
+    if " of " in expression:
+        parts = expression.split(" of ")
+        if len(parts) == 2:
+            expression = f"({parts[0]}) * ({parts[1]})"
+
+    # Whitelisted syntax only, evaluated without builtins
+    return _freeze(eval(_compile(expression), _EVAL_GLOBALS, _ALLOWED))
+
 
 class CalculatorTool(BaseTool):
     """Perform mathematical calculations"""
 
+    is_pure = True
+
     def __init__(self):
         super().__init__()
         self.category = ToolCategory.CALCULATION
@@ -29,26 +106,13 @@ class CalculatorTool(BaseTool):
         ]
 
     def execute(self, expression: str) -> ToolResult:
-        """Evaluate math expression safely"""
+        """
+        Evaluate math expression safely
+        Invalid expressions raise ValueError, which the registry returns
+        without retrying: the same expression would fail again
+        """
         try:
-            # Handle percentage expressions
-            if "%" in expression:
-                expression = expression.replace("%", "/100")
-
-            # Handle "of" keyword (e.g., "15% of 250")
-            if " of " in expression:
-                parts = expression.split(" of ")
-                if len(parts) == 2:
-                    expression = f"({parts[0]}) * ({parts[1]})"
-
-            # Safe eval with limited builtins
-            allowed_names = {
-                "abs": abs, "round": round, "min": min, "max": max,
-                "sum": sum, "pow": pow,
-                "sqrt": math.sqrt, "pi": math.pi, "e": math.e
-            }
-
-            result = eval(expression, {"__builtins__": {}}, allowed_names)
+            result = _eval_expr(" ".join(expression.split()))
 
             return ToolResult(
                 success=True,
@@ -56,11 +120,21 @@ class CalculatorTool(BaseTool):
             )
 
         except Exception as e:
-            return ToolResult(
-                success=False,
-                result=None,
-                error=f"Calculation error: {str(e)}"
-            )
+            raise ValueError(f"Calculation error: {str(e)}") from e
+
+
+# Named formats of GetCurrentDateTool; anything else is a custom strftime format
+_FORMATS = {
+    "date": "%Y-%m-%d",
+    "time": "%H:%M:%S",
+    "datetime": "%Y-%m-%d %H:%M:%S",
+}
+
+
+@lru_cache(maxsize=8)
+def _format_time(format: str, epoch_sec: int) -> str:
+    """Format a whole second of local time (repeats within that second are cached)"""
+    return time.strftime(_FORMATS.get(format, format), time.localtime(epoch_sec))
 
 
 class GetCurrentDateTool(BaseTool):
@@ -87,17 +161,11 @@ class GetCurrentDateTool(BaseTool):
     def execute(self, format: str = "datetime") -> ToolResult:
         """Get current date/time"""
         try:
-            now = datetime.now()
-
-            if format == "date":
-                result = now.strftime("%Y-%m-%d")
-            elif format == "time":
-                result = now.strftime("%H:%M:%S")
-            elif format == "datetime":
-                result = now.strftime("%Y-%m-%d %H:%M:%S")
+            if "%f" in format:
+                # Microseconds can't come from a one-second bucket
+                result = datetime.now().strftime(format)
             else:
-                # Custom strftime format
-                result = now.strftime(format)
+                result = _format_time(format, int(time.time()))
 
             return ToolResult(success=True, result=result)
 